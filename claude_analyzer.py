@@ -5,8 +5,13 @@ Provides AI-powered market analysis and insights
 """
 
 import os
+import copy
 import json
-from typing import Dict, List, Optional, Any
+import math
+import time
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 import pandas as pd
 from loguru import logger
@@ -19,6 +24,68 @@ except ImportError:
     logger.warning("Anthropic library not available. Claude integration disabled.")
 
 
+# Client-side memo of analyze_market_data results: identical (quantized)
+# inputs within the TTL reuse the previous analysis without an API call
+ANALYSIS_MEMO_TTL = 60  # seconds
+ANALYSIS_MEMO_MAXSIZE = 512
+
+# Delimiter around each coin name in batched analysis requests and responses
+BATCH_SECTION_MARKER = "==="
+
+# Coins per batched request. Each coin gets the single-analysis token budget,
+# and 8 x 1500 tokens stays well inside the model's 32k output limit
+BATCH_MAX_COINS = 8
+BATCH_TOKENS_PER_COIN = 1500
+
+
+def _quantize(value: Any, digits: int = 4) -> Any:
+    """Round floats so trivially different inputs share a memo key"""
+    if isinstance(value, float):
+        return round(value, digits) if math.isfinite(value) else None
+    return value
+
+# Static system prompts. They form the cacheable prefix of every request, so
+# they must stay byte-identical between calls; per-call data goes in messages.
+MARKET_ANALYSIS_SYSTEM_PROMPT = """You are an expert cryptocurrency analyst. Analyze market data and provide insights with:
+1. A comprehensive market analysis (2-3 paragraphs)
+2. A clear trading recommendation (BUY/SELL/HOLD) with reasoning
+3. Risk assessment and key factors to consider
+4. 3-5 key insights in bullet points
+
+Be concise, actionable, and focus on the most important factors. Remember this is for educational purposes only."""
+
+SIGNAL_EXPLANATION_SYSTEM_PROMPT = """Explain trading signals in clear, simple language for someone learning about cryptocurrency trading. 
+Provide 2-3 sentence explanations that help traders understand WHY signals are generated and what they mean for their decisions."""
+
+RISK_ANALYSIS_SYSTEM_PROMPT = """Analyze risk factors for cryptocurrency trading.
+
+Provide:
+1. Risk Level: LOW, MEDIUM, or HIGH
+2. Risk Score: 0.0 (lowest) to 1.0 (highest)
+3. 2-3 sentences explaining the risk profile and what traders should be aware of
+
+Format your response as:
+RISK_LEVEL: [level]
+RISK_SCORE: [score]
+INSIGHTS: [your analysis]"""
+
+
+def _cached_system_blocks(prompt: str) -> List[Dict[str, Any]]:
+    """Wrap a system prompt as a single text block with a cache breakpoint"""
+    return [
+        {
+            "type": "text",
+            "text": prompt,
+            "cache_control": {"type": "ephemeral"}
+        }
+    ]
+
+
+MARKET_ANALYSIS_SYSTEM_BLOCKS = _cached_system_blocks(MARKET_ANALYSIS_SYSTEM_PROMPT)
+SIGNAL_EXPLANATION_SYSTEM_BLOCKS = _cached_system_blocks(SIGNAL_EXPLANATION_SYSTEM_PROMPT)
+RISK_ANALYSIS_SYSTEM_BLOCKS = _cached_system_blocks(RISK_ANALYSIS_SYSTEM_PROMPT)
+
+
 class ClaudeAnalyzer:
     """
     Claude Opus 4.1 powered cryptocurrency analysis
@@ -47,6 +114,10 @@ class ClaudeAnalyzer:
         self.client = None
         self.model = "claude-opus-4-20250514"  # Claude Opus 4.1
         self.enable_caching = True  # Enable prompt caching for infinite context window
+        self._analysis_memo: "OrderedDict[Tuple, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._memo_lock = threading.Lock()  # analyses may run on worker threads
+        self.memo_hits = 0
+        self.memo_misses = 0
         
         if not ANTHROPIC_AVAILABLE:
             logger.warning("Anthropic library not installed. Install with: pip install anthropic")
@@ -108,6 +179,14 @@ class ClaudeAnalyzer:
                 'key_insights': []
             }
         
+        memo_key = self._analysis_memo_key(
+            coin_name, current_price, price_change_24h,
+            technical_indicators, ml_predictions, fear_greed_index
+        )
+        memoized = self._memo_get(memo_key)
+        if memoized is not None:
+            return memoized
+        
         try:
             # Prepare market context
             market_context = self._prepare_market_context(
@@ -115,39 +194,21 @@ class ClaudeAnalyzer:
                 technical_indicators, ml_predictions, fear_greed_index
             )
             
-            # Create system prompt with caching for instructions
-            system_prompt = """You are an expert cryptocurrency analyst. Analyze market data and provide insights with:
-1. A comprehensive market analysis (2-3 paragraphs)
-2. A clear trading recommendation (BUY/SELL/HOLD) with reasoning
-3. Risk assessment and key factors to consider
-4. 3-5 key insights in bullet points
-
-Be concise, actionable, and focus on the most important factors. Remember this is for educational purposes only."""
+            system_prompt = MARKET_ANALYSIS_SYSTEM_PROMPT
 
-            # Structure message with prompt caching for better performance
-            # Cache the system instructions and market context for reuse
+            # Only the static instructions carry a cache breakpoint; the market
+            # context differs on every call, so caching it would pay the cache
+            # write premium for an entry that is never read back
             if self.enable_caching:
                 message = self.client.messages.create(
                     model=self.model,
                     max_tokens=1500,
                     temperature=0.7,
-                    system=[
-                        {
-                            "type": "text",
-                            "text": system_prompt,
-                            "cache_control": {"type": "ephemeral"}
-                        }
-                    ],
+                    system=MARKET_ANALYSIS_SYSTEM_BLOCKS,
                     messages=[
                         {
                             "role": "user",
-                            "content": [
-                                {
-                                    "type": "text",
-                                    "text": f"Analyze the following market data:\n\n{market_context}",
-                                    "cache_control": {"type": "ephemeral"}
-                                }
-                            ]
+                            "content": f"Analyze the following market data:\n\n{market_context}"
                         }
                     ]
                 )
@@ -169,6 +230,8 @@ Be concise, actionable, and focus on the most important factors. Remember this i
             response_text = message.content[0].text
             parsed_response = self._parse_claude_response(response_text)
             
+            self._memo_put(memo_key, parsed_response)
+            
             logger.success(f"Claude analysis completed for {coin_name}")
             return parsed_response
             
@@ -181,6 +244,182 @@ Be concise, actionable, and focus on the most important factors. Remember this i
                 'key_insights': []
             }
     
+    def analyze_market_data_batch(self, markets: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Analyze several cryptocurrencies in a single Claude request
+        
+        All coins share one request and therefore one read (or write) of the
+        cached system prompt, instead of one request per coin. Coins with a
+        memoized analysis are not sent again.
+        
+        Args:
+            markets: List of dicts with the keyword arguments of analyze_market_data
+            
+        Returns:
+            List of analysis dicts, in the same order as markets
+        """
+        if not self.is_available() or len(markets) <= 1:
+            return [self.analyze_market_data(**market) for market in markets]
+        
+        results: List[Optional[Dict[str, Any]]] = [None] * len(markets)
+        pending = []
+        for index, market in enumerate(markets):
+            memo_key = self._analysis_memo_key(
+                market['coin_name'], market['current_price'], market['price_change_24h'],
+                market['technical_indicators'], market['ml_predictions'],
+                market.get('fear_greed_index')
+            )
+            results[index] = self._memo_get(memo_key)
+            if results[index] is None:
+                pending.append((index, market, memo_key))
+        
+        if len(pending) == 1:
+            index, market, _ = pending[0]
+            results[index] = self.analyze_market_data(**market)
+            return results
+        
+        # Larger batches go out as several requests, keeping max_tokens bounded
+        for start in range(0, len(pending), BATCH_MAX_COINS):
+            self._analyze_batch_chunk(pending[start:start + BATCH_MAX_COINS], results)
+        
+        return results
+    
+    def _analyze_batch_chunk(self, chunk: List[Tuple[int, Dict[str, Any], Optional[Tuple]]],
+                             results: List[Optional[Dict[str, Any]]]) -> None:
+        """
+        Analyze up to BATCH_MAX_COINS coins in one request
+        
+        Args:
+            chunk: (index into results, market, memo key) for each coin
+            results: Result list filled in place at each coin's index
+        """
+        try:
+            contexts = "\n".join(
+                f"{BATCH_SECTION_MARKER} {market['coin_name']} {BATCH_SECTION_MARKER}\n"
+                + self._prepare_market_context(
+                    market['coin_name'], market['current_price'], market['price_change_24h'],
+                    market['technical_indicators'], market['ml_predictions'],
+                    market.get('fear_greed_index')
+                )
+                for _, market, _ in chunk
+            )
+            prompt = (
+                f"Analyze each of the following {len(chunk)} cryptocurrencies separately. "
+                f"Start each analysis with a line of the form "
+                f"\"{BATCH_SECTION_MARKER} <name> {BATCH_SECTION_MARKER}\" using the name given, "
+                f"in the same order.\n\n{contexts}"
+            )
+            
+            message = self.client.messages.create(
+                model=self.model,
+                max_tokens=BATCH_TOKENS_PER_COIN * len(chunk),
+                temperature=0.7,
+                system=MARKET_ANALYSIS_SYSTEM_BLOCKS if self.enable_caching else MARKET_ANALYSIS_SYSTEM_PROMPT,
+                messages=[{"role": "user", "content": prompt}]
+            )
+            sections = self._split_batch_response(message.content[0].text)
+            
+            for index, market, memo_key in chunk:
+                section = sections.get(market['coin_name'].lower())
+                if section is None:
+                    results[index] = {
+                        'analysis': 'Analysis missing from batch response.',
+                        'recommendation': 'Unable to provide recommendation.',
+                        'risk_assessment': 'Risk assessment unavailable.',
+                        'key_insights': []
+                    }
+                    continue
+                results[index] = self._parse_claude_response(section)
+                self._memo_put(memo_key, results[index])
+            
+            logger.success(f"Claude batch analysis completed for {len(chunk)} coins")
+            
+        except Exception as e:
+            logger.error(f"Error in Claude batch analysis: {e}")
+            for index, _, _ in chunk:
+                results[index] = {
+                    'analysis': f'Analysis error: {str(e)}',
+                    'recommendation': 'Unable to provide recommendation due to error.',
+                    'risk_assessment': 'Risk assessment unavailable.',
+                    'key_insights': []
+                }
+    
+    @staticmethod
+    def _split_batch_response(response_text: str) -> Dict[str, str]:
+        """Split a batch response into per-coin sections keyed by lowercased name"""
+        sections = {}
+        current = None
+        lines: List[str] = []
+        for line in response_text.split('\n'):
+            # Headers may come back as markdown, e.g. "### **=== Name ===**"
+            stripped = line.strip('#* \t')
+            if stripped.startswith(BATCH_SECTION_MARKER) and stripped.endswith(BATCH_SECTION_MARKER):
+                if current is not None:
+                    sections[current] = '\n'.join(lines)
+                current = stripped.strip('=* ').lower()
+                lines = []
+            elif current is not None:
+                lines.append(line)
+        if current is not None:
+            sections[current] = '\n'.join(lines)
+        return sections
+    
+    def _memo_get(self, memo_key: Optional[Tuple]) -> Optional[Dict[str, Any]]:
+        """Return a copy of a fresh memoized analysis, or None"""
+        if memo_key is None:
+            return None
+        with self._memo_lock:
+            memoized = self._analysis_memo.get(memo_key)
+            if memoized is None or time.monotonic() - memoized[0] >= ANALYSIS_MEMO_TTL:
+                self.memo_misses += 1
+                return None
+            self._analysis_memo.move_to_end(memo_key)
+            self.memo_hits += 1
+        logger.debug(f"Reusing Claude analysis for {memo_key[0]} "
+                     f"(memo hits: {self.memo_hits}, misses: {self.memo_misses})")
+        return copy.deepcopy(memoized[1])
+    
+    def _memo_put(self, memo_key: Optional[Tuple], analysis: Dict[str, Any]) -> None:
+        """Store a copy of an analysis in the memo, evicting the least recently used entry"""
+        if memo_key is None:
+            return
+        # Copied so callers mutating their result cannot change later hits
+        analysis = copy.deepcopy(analysis)
+        with self._memo_lock:
+            self._analysis_memo[memo_key] = (time.monotonic(), analysis)
+            self._analysis_memo.move_to_end(memo_key)
+            if len(self._analysis_memo) > ANALYSIS_MEMO_MAXSIZE:
+                self._analysis_memo.popitem(last=False)
+    
+    @staticmethod
+    def _analysis_memo_key(coin_name: str,
+                           current_price: float,
+                           price_change_24h: float,
+                           technical_indicators: Dict[str, Any],
+                           ml_predictions: Dict[str, Any],
+                           fear_greed_index: Optional[int]) -> Optional[Tuple]:
+        """
+        Build a hashable memo key from quantized analysis inputs
+        
+        Returns:
+            The key, or None if the inputs cannot form one (missing prices,
+            unhashable indicator values); the analysis then skips the memo
+        """
+        try:
+            memo_key = (
+                coin_name,
+                _quantize(float(current_price), 2),
+                _quantize(float(price_change_24h), 2),
+                tuple(sorted((k, _quantize(v)) for k, v in technical_indicators.items())),
+                tuple(sorted((k, _quantize(v)) for k, v in ml_predictions.items())),
+                fear_greed_index
+            )
+            hash(memo_key)
+        except (TypeError, ValueError, AttributeError) as e:
+            logger.debug(f"Analysis inputs for {coin_name} not memoizable: {e}")
+            return None
+        return memo_key
+    
     def explain_trading_signal(self,
                                signal: str,
                                confidence: float,
@@ -204,8 +443,7 @@ Be concise, actionable, and focus on the most important factors. Remember this i
         try:
             reasons_text = "\n".join([f"- {reason}" for reason in technical_reasons])
             
-            system_prompt = """Explain trading signals in clear, simple language for someone learning about cryptocurrency trading. 
-Provide 2-3 sentence explanations that help traders understand WHY signals are generated and what they mean for their decisions."""
+            system_prompt = SIGNAL_EXPLANATION_SYSTEM_PROMPT
             
             user_prompt = f"""Explain this trading signal:
 
@@ -221,13 +459,7 @@ Technical Reasons:
                     model=self.model,
                     max_tokens=300,
                     temperature=0.7,
-                    system=[
-                        {
-                            "type": "text",
-                            "text": system_prompt,
-                            "cache_control": {"type": "ephemeral"}
-                        }
-                    ],
+                    system=SIGNAL_EXPLANATION_SYSTEM_BLOCKS,
                     messages=[
                         {"role": "user", "content": user_prompt}
                     ]
@@ -274,17 +506,7 @@ Technical Reasons:
             }
         
         try:
-            system_prompt = """Analyze risk factors for cryptocurrency trading.
-
-Provide:
-1. Risk Level: LOW, MEDIUM, or HIGH
-2. Risk Score: 0.0 (lowest) to 1.0 (highest)
-3. 2-3 sentences explaining the risk profile and what traders should be aware of
-
-Format your response as:
-RISK_LEVEL: [level]
-RISK_SCORE: [score]
-INSIGHTS: [your analysis]"""
+            system_prompt = RISK_ANALYSIS_SYSTEM_PROMPT
 
             user_prompt = f"""Analyze these risk factors:
 
@@ -297,13 +519,7 @@ Market Sentiment: {market_sentiment}"""
                     model=self.model,
                     max_tokens=400,
                     temperature=0.7,
-                    system=[
-                        {
-                            "type": "text",
-                            "text": system_prompt,
-                            "cache_control": {"type": "ephemeral"}
-                        }
-                    ],
+                    system=RISK_ANALYSIS_SYSTEM_BLOCKS,
                     messages=[
                         {"role": "user", "content": user_prompt}
                     ]
@@ -3,6 +3,7 @@ from decimal import Decimal
 from unittest.mock import patch, MagicMock
 from django.test import TestCase, Client
 from django.urls import reverse
+from . import views
 from .models import WatchlistItem
 from .utils import InMemoryCache, RateLimiter
 
@@ -86,11 +87,52 @@ class HealthCheckViewTest(TestCase):
         self.assertEqual(data['status'], 'alive')
 
 
+class CompressionTest(TestCase):
+    """Test response compression"""
+    
+    def setUp(self):
+        """Set up test client"""
+        views.get_market_overview.clear_cache()
+        self.client = Client()
+    
+    @patch('crypto_api.views.requests.get')
+    def test_market_overview_is_gzipped(self, mock_get):
+        """Test large list responses are gzip encoded when accepted"""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {}
+        mock_response.json.return_value = [
+            {'id': f'coin-{i}', 'symbol': f'c{i}', 'name': f'Coin {i}', 'current_price': i,
+             'market_cap': i * 1000, 'total_volume': i * 100,
+             'price_change_percentage_24h': 1.0, 'market_cap_rank': i}
+            for i in range(1, 11)
+        ]
+        mock_get.return_value = mock_response
+        
+        response = self.client.get(
+            reverse('crypto_api:market_overview'),
+            HTTP_ACCEPT_ENCODING='gzip'
+        )
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+    
+    def test_liveness_is_not_compressed(self):
+        """Test tiny responses are sent uncompressed"""
+        response = self.client.get(
+            reverse('crypto_api:liveness_check'),
+            HTTP_ACCEPT_ENCODING='gzip'
+        )
+        
+        self.assertFalse(response.has_header('Content-Encoding'))
+
+
 class WatchlistViewTest(TestCase):
     """Test watchlist endpoints"""
     
     def setUp(self):
         """Set up test data"""
+        views.get_watchlist.clear_cache()
         self.client = Client()
         self.item = WatchlistItem.objects.create(
             coin_id='bitcoin',
@@ -121,6 +163,36 @@ class WatchlistViewTest(TestCase):
         data = response.json()
         self.assertIn('watchlist', data)
         self.assertEqual(data['count'], 1)
+
+    @patch('crypto_api.views.requests.get')
+    def test_get_large_watchlist_uses_markets(self, mock_get):
+        """Test large watchlists are priced through /coins/markets"""
+        for i in range(40):
+            WatchlistItem.objects.create(
+                coin_id=f'coin-{i}',
+                coin_name=f'Coin {i}',
+                coin_symbol=f'C{i}'
+            )
+        
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = [
+            {'id': 'bitcoin', 'current_price': 50000, 'price_change_percentage_24h': 2.5,
+             'market_cap': 1000000000000, 'total_volume': 50000000000}
+        ]
+        mock_get.return_value = mock_response
+        
+        response = self.client.get(reverse('crypto_api:get_watchlist'))
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertTrue(mock_get.call_args[0][0].endswith('/coins/markets'))
+        
+        data = response.json()
+        self.assertEqual(data['count'], 41)
+        bitcoin = next(item for item in data['watchlist'] if item['id'] == 'bitcoin')
+        self.assertEqual(bitcoin['current_price_usd'], 50000)
+        self.assertEqual(bitcoin['price_change_24h_percent'], 2.5)
     
     @patch('crypto_api.views.requests.get')
     def test_add_to_watchlist(self, mock_get):
@@ -260,6 +332,60 @@ class CachingTest(TestCase):
         self.assertIsNone(cache.get('key2'))
 
 
+class ConditionalFetchTest(TestCase):
+    """Test ETag revalidation of upstream requests"""
+    
+    def setUp(self):
+        """Start each test without stored validators"""
+        from django.core.cache import cache
+        cache.clear()
+    
+    @patch('crypto_api.utils.requests.get')
+    def test_not_modified_returns_stored_body(self, mock_get):
+        """Test a 304 reuses the body stored with the ETag"""
+        from .utils import fetch_with_etag
+        
+        first = MagicMock()
+        first.status_code = 200
+        first.headers = {'ETag': 'W/"abc"'}
+        first.json.return_value = {'coins': [{'id': 'bitcoin'}]}
+        
+        not_modified = MagicMock()
+        not_modified.status_code = 304
+        not_modified.headers = {}
+        
+        mock_get.side_effect = [first, not_modified]
+        url = 'https://example.test/etag-search'
+        
+        self.assertEqual(fetch_with_etag(url, params={'query': 'bit'}), {'coins': [{'id': 'bitcoin'}]})
+        self.assertEqual(fetch_with_etag(url, params={'query': 'bit'}), {'coins': [{'id': 'bitcoin'}]})
+        
+        self.assertEqual(mock_get.call_args[1]['headers'], {'If-None-Match': 'W/"abc"'})
+        not_modified.json.assert_not_called()
+    
+    @patch('crypto_api.utils.requests.get')
+    def test_not_modified_without_entry_refetches(self, mock_get):
+        """Test a 304 with nothing stored is retried without validators"""
+        from .utils import fetch_with_etag
+        
+        not_modified = MagicMock()
+        not_modified.status_code = 304
+        not_modified.headers = {}
+        
+        full = MagicMock()
+        full.status_code = 200
+        full.headers = {}
+        full.json.return_value = {'coins': []}
+        
+        mock_get.side_effect = [not_modified, full]
+        
+        self.assertEqual(fetch_with_etag('https://example.test/etag-retry'), {'coins': []})
+        
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertNotIn('If-None-Match', mock_get.call_args[1]['headers'])
+        not_modified.json.assert_not_called()
+
+
 class RateLimitingTest(TestCase):
     """Test rate limiting functionality"""
     
@@ -11,7 +11,9 @@ from datetime import datetime, timedelta
 from decimal import Decimal, InvalidOperation
 from functools import wraps
 from typing import Any, Callable, Dict, Optional, Union
+from urllib.parse import urlencode
 
+import requests
 from django.core.cache import cache
 from django.http import JsonResponse
 
@@ -117,6 +119,76 @@ def cached(timeout: int = 300, key_prefix: str = "") -> Callable:
     return decorator
 
 
+# ========== Conditional Upstream Requests ==========
+
+# Validators are kept well past the view cache timeouts so an expired view
+# cache can still revalidate upstream with a headers-only 304
+ETAG_CACHE_TIMEOUT = 3600
+
+
+def fetch_with_etag(url: str, params: Optional[Dict[str, Any]] = None,
+                    timeout: int = 30, ttl: int = ETAG_CACHE_TIMEOUT) -> Any:
+    """
+    GET a JSON resource, revalidating with If-None-Match/If-Modified-Since
+    
+    The response body is stored together with the upstream ETag and
+    Last-Modified headers. When upstream answers 304 Not Modified the stored
+    body is returned and its retention is extended. Entries live in the
+    Django cache, which culls itself at MAX_ENTRIES and is safe to share
+    between request threads.
+    
+    Args:
+        url: Upstream URL
+        params: Optional query parameters
+        timeout: Request timeout in seconds
+        ttl: How long to keep the body and validators, in seconds
+    
+    Returns:
+        Decoded JSON body
+    
+    Raises:
+        requests.exceptions.RequestException: If the request fails
+    """
+    cache_key = "etag:" + hashlib.md5(
+        f"{url}?{urlencode(sorted((params or {}).items()))}".encode()
+    ).hexdigest()
+    entry = cache.get(cache_key)
+    
+    headers = {}
+    if entry is not None:
+        etag, last_modified, _ = entry
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+    
+    response = requests.get(url, params=params, headers=headers, timeout=timeout)
+    
+    if response.status_code == 304:
+        if entry is not None:
+            logger.debug(f"Upstream not modified: {cache_key}")
+            cache.set(cache_key, entry, ttl)
+            return entry[2]
+        # Nothing stored to reuse, so ask again for the full body
+        logger.debug(f"Unexpected 304 without a stored body, refetching: {cache_key}")
+        response = requests.get(url, params=params, headers={'Cache-Control': 'no-cache'},
+                                timeout=timeout)
+    
+    response.raise_for_status()
+    if response.status_code == 304:
+        raise requests.exceptions.HTTPError(
+            f"304 Not Modified without a stored body for url: {response.url}", response=response
+        )
+    body = response.json()
+    
+    etag = response.headers.get('ETag')
+    last_modified = response.headers.get('Last-Modified')
+    if etag or last_modified:
+        cache.set(cache_key, (etag, last_modified, body), ttl)
+    
+    return body
+
+
 # ========== Rate Limiting ==========
 
 class RateLimiter:
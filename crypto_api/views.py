@@ -7,6 +7,7 @@ from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Union
 
 from django.conf import settings
+from django.core.cache import cache
 from django.core.exceptions import ValidationError as DjangoValidationError
 from django.db import connection, DatabaseError, IntegrityError
 from django.http import HttpRequest, JsonResponse
@@ -21,7 +22,8 @@ from requests.exceptions import (
 from .models import WatchlistItem
 from .utils import (
     cached, rate_limit, validate_coin_id, validate_symbol,
-    validate_positive_integer, remove_special_chars, json_response_with_timestamp
+    validate_positive_integer, remove_special_chars, json_response_with_timestamp,
+    fetch_with_etag
 )
 
 logger = logging.getLogger(__name__)
@@ -291,6 +293,17 @@ def health_check(request: HttpRequest) -> JsonResponse:
         }, status=503)
 
 
+# Readiness probes share one database round trip per interval
+READINESS_DB_PROBE_TTL = 10
+
+
+def _db_probe() -> bool:
+    """Run a trivial query to verify the database is reachable"""
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1")
+    return True
+
+
 def readiness_check(request: HttpRequest) -> JsonResponse:
     """
     Readiness check endpoint for Kubernetes/ECS
@@ -298,8 +311,8 @@ def readiness_check(request: HttpRequest) -> JsonResponse:
     Indicates if the application is ready to accept traffic
     """
     try:
-        # Check database connection
-        connection.ensure_connection()
+        # Check database connection (cached so frequent probes reuse the result)
+        cache.get_or_set('db:alive', _db_probe, READINESS_DB_PROBE_TTL)
         
         # Check critical components
         status = {
@@ -341,6 +354,16 @@ def liveness_check(request: HttpRequest) -> JsonResponse:
 
 # ========== API Endpoints ==========
 
+# Response skeletons copied per request instead of rebuilding the dict literal
+_PRICE_TEMPLATE = dict.fromkeys((
+    'symbol', 'price_usd', 'market_cap_usd', 'volume_24h_usd', 'price_change_24h_percent'
+))
+_MARKET_ITEM_TEMPLATE = dict.fromkeys((
+    'symbol', 'name', 'price_usd', 'market_cap_usd', 'volume_24h_usd',
+    'price_change_24h_percent', 'market_cap_rank'
+))
+
+
 @csrf_exempt
 @require_http_methods(["GET"])
 @rate_limit(max_requests=100, window_seconds=60)  # 100 requests per minute
@@ -381,13 +404,12 @@ def get_crypto_price(request: HttpRequest, symbol: str) -> JsonResponse:
         raise NotFoundError(f'Cryptocurrency {symbol} not found')
     
     crypto_data = data[symbol]
-    result = {
-        'symbol': symbol.upper(),
-        'price_usd': crypto_data.get('usd'),
-        'market_cap_usd': crypto_data.get('usd_market_cap'),
-        'volume_24h_usd': crypto_data.get('usd_24h_vol'),
-        'price_change_24h_percent': crypto_data.get('usd_24h_change')
-    }
+    result = _PRICE_TEMPLATE.copy()
+    result['symbol'] = symbol.upper()
+    result['price_usd'] = crypto_data.get('usd')
+    result['market_cap_usd'] = crypto_data.get('usd_market_cap')
+    result['volume_24h_usd'] = crypto_data.get('usd_24h_vol')
+    result['price_change_24h_percent'] = crypto_data.get('usd_24h_change')
     
     return json_response_with_timestamp(result)
 
@@ -420,14 +442,11 @@ def get_crypto_history(request: HttpRequest, symbol: str) -> JsonResponse:
     coingecko_url = f"{settings.CRYPTO_API_SETTINGS['COINGECKO_API_URL']}/coins/{symbol}/market_chart"
     params = {'vs_currency': 'usd', 'days': days}
     
-    response = requests.get(
+    data = fetch_with_etag(
         coingecko_url,
         params=params,
         timeout=settings.CRYPTO_API_SETTINGS['REQUEST_TIMEOUT']
     )
-    response.raise_for_status()
-    
-    data = response.json()
     prices = [
         {'timestamp': int(ts / 1000), 'price': price}
         for ts, price in data.get('prices', [])
@@ -476,26 +495,22 @@ def get_market_overview(request: HttpRequest) -> JsonResponse:
         'price_change_percentage': '24h'
     }
     
-    response = requests.get(
+    data = fetch_with_etag(
         coingecko_url,
         params=params,
         timeout=settings.CRYPTO_API_SETTINGS['REQUEST_TIMEOUT']
     )
-    response.raise_for_status()
-    
-    data = response.json()
-    market_data = [
-        {
-            'symbol': coin.get('symbol', '').upper(),
-            'name': coin.get('name'),
-            'price_usd': coin.get('current_price'),
-            'market_cap_usd': coin.get('market_cap'),
-            'volume_24h_usd': coin.get('total_volume'),
-            'price_change_24h_percent': coin.get('price_change_percentage_24h'),
-            'market_cap_rank': coin.get('market_cap_rank')
-        }
-        for coin in data
-    ]
+    market_data = []
+    for coin in data:
+        item = _MARKET_ITEM_TEMPLATE.copy()
+        item['symbol'] = coin.get('symbol', '').upper()
+        item['name'] = coin.get('name')
+        item['price_usd'] = coin.get('current_price')
+        item['market_cap_usd'] = coin.get('market_cap')
+        item['volume_24h_usd'] = coin.get('total_volume')
+        item['price_change_24h_percent'] = coin.get('price_change_percentage_24h')
+        item['market_cap_rank'] = coin.get('market_cap_rank')
+        market_data.append(item)
     
     result = {
         'market_overview': market_data,
@@ -539,14 +554,11 @@ def search_crypto(request: HttpRequest) -> JsonResponse:
     coingecko_url = f"{settings.CRYPTO_API_SETTINGS['COINGECKO_API_URL']}/search"
     params = {'query': query}
     
-    response = requests.get(
+    data = fetch_with_etag(
         coingecko_url,
         params=params,
         timeout=settings.CRYPTO_API_SETTINGS['REQUEST_TIMEOUT']
     )
-    response.raise_for_status()
-    
-    data = response.json()
     coins = data.get('coins', [])[:20]  # Limit to top 20 results
     
     results = [
@@ -572,6 +584,78 @@ def search_crypto(request: HttpRequest) -> JsonResponse:
 
 # ========== Watchlist Endpoints ==========
 
+# Above this many coins the watchlist is priced through /coins/markets, which
+# returns every field we need in one paged call instead of a huge /simple/price URL
+WATCHLIST_MARKETS_THRESHOLD = 30
+COINGECKO_MARKETS_PAGE_SIZE = 250
+
+
+def _fetch_watchlist_simple_prices(coin_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Fetch prices for a small watchlist via /simple/price
+    
+    Returns:
+        Mapping of coin ID to market data, using /coins/markets field names
+    """
+    coingecko_url = f"{settings.CRYPTO_API_SETTINGS['COINGECKO_API_URL']}/simple/price"
+    params = {
+        'ids': ','.join(coin_ids),
+        'vs_currencies': 'usd',
+        'include_24hr_change': 'true',
+        'include_market_cap': 'true',
+        'include_24hr_vol': 'true'
+    }
+    
+    response = requests.get(
+        coingecko_url,
+        params=params,
+        timeout=settings.CRYPTO_API_SETTINGS['REQUEST_TIMEOUT']
+    )
+    response.raise_for_status()
+    
+    return {
+        coin_id: {
+            'current_price': price_info.get('usd'),
+            'price_change_percentage_24h': price_info.get('usd_24h_change'),
+            'market_cap': price_info.get('usd_market_cap'),
+            'total_volume': price_info.get('usd_24h_vol')
+        }
+        for coin_id, price_info in response.json().items()
+    }
+
+
+def _fetch_watchlist_markets(coin_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Fetch prices for a large watchlist via /coins/markets, one page per 250 IDs
+    
+    Returns:
+        Mapping of coin ID to the /coins/markets entry for that coin
+    """
+    coingecko_url = f"{settings.CRYPTO_API_SETTINGS['COINGECKO_API_URL']}/coins/markets"
+    by_id = {}
+    
+    for start in range(0, len(coin_ids), COINGECKO_MARKETS_PAGE_SIZE):
+        params = {
+            'vs_currency': 'usd',
+            'ids': ','.join(coin_ids[start:start + COINGECKO_MARKETS_PAGE_SIZE]),
+            'per_page': COINGECKO_MARKETS_PAGE_SIZE,
+            'page': 1,
+            'sparkline': 'false',
+            'price_change_percentage': '24h'
+        }
+        
+        response = requests.get(
+            coingecko_url,
+            params=params,
+            timeout=settings.CRYPTO_API_SETTINGS['REQUEST_TIMEOUT']
+        )
+        response.raise_for_status()
+        
+        by_id.update((coin['id'], coin) for coin in response.json())
+    
+    return by_id
+
+
 @csrf_exempt
 @require_http_methods(["GET"])
 @rate_limit(max_requests=120, window_seconds=60)  # 120 requests per minute
@@ -601,24 +685,11 @@ def get_watchlist(request: HttpRequest) -> JsonResponse:
     
     prices_data = {}
     if coin_ids:
-        # Batch fetch prices from CoinGecko
-        coingecko_url = f"{settings.CRYPTO_API_SETTINGS['COINGECKO_API_URL']}/simple/price"
-        params = {
-            'ids': ','.join(coin_ids),
-            'vs_currencies': 'usd',
-            'include_24hr_change': 'true',
-            'include_market_cap': 'true',
-            'include_24hr_vol': 'true'
-        }
-        
         try:
-            response = requests.get(
-                coingecko_url,
-                params=params,
-                timeout=settings.CRYPTO_API_SETTINGS['REQUEST_TIMEOUT']
-            )
-            response.raise_for_status()
-            prices_data = response.json()
+            if len(coin_ids) > WATCHLIST_MARKETS_THRESHOLD:
+                prices_data = _fetch_watchlist_markets(coin_ids)
+            else:
+                prices_data = _fetch_watchlist_simple_prices(coin_ids)
         except RequestException as e:
             logger.warning(f"Failed to fetch prices for watchlist: {e}")
             # Continue with empty prices_data
@@ -631,10 +702,10 @@ def get_watchlist(request: HttpRequest) -> JsonResponse:
             'name': item.coin_name,
             'symbol': item.coin_symbol.upper(),
             'added_at': item.added_at.isoformat(),
-            'current_price_usd': price_info.get('usd'),
-            'price_change_24h_percent': price_info.get('usd_24h_change'),
-            'market_cap_usd': price_info.get('usd_market_cap'),
-            'volume_24h_usd': price_info.get('usd_24h_vol'),
+            'current_price_usd': price_info.get('current_price'),
+            'price_change_24h_percent': price_info.get('price_change_percentage_24h'),
+            'market_cap_usd': price_info.get('market_cap'),
+            'volume_24h_usd': price_info.get('total_volume'),
             'last_price': float(item.last_price) if item.last_price else None,
             'last_updated': item.last_updated.isoformat(),
             'is_favorite': item.is_favorite,
@@ -17,12 +17,32 @@ Based on the existing HeadlessCryptoAPI implementation.
 
 import sys
 import json
+import hashlib
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 from datetime import datetime
 
+import numpy as np
+
+# Fast JSON encoding for the stdio hot path (optional)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Compiled JSON Schema validation for tool arguments (optional)
+try:
+    import fastjsonschema
+    FASTJSONSCHEMA_AVAILABLE = True
+except ImportError:
+    FASTJSONSCHEMA_AVAILABLE = False
+
 # Import the existing crypto API
 from headless_crypto_api import HeadlessCryptoAPI
+import indicator_kernels
 
 # Configure logging
 logging.basicConfig(
@@ -32,6 +52,55 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Maximum number of requests processed concurrently; bounds the number of
+# simultaneous upstream CoinGecko calls
+MAX_CONCURRENT_REQUESTS = 20
+
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj).encode()
+
+
+def loads(data: bytes) -> Any:
+    """Parse JSON, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Pre-serialized JSON-RPC error envelopes
+PARSE_ERROR_RESPONSE = b'{"jsonrpc":"2.0","id":null,"error":{"code":-32700,"message":"Parse error"}}'
+INVALID_REQUEST_RESPONSE = b'{"jsonrpc":"2.0","id":null,"error":{"code":-32600,"message":"Invalid Request"}}'
+INTERNAL_ERROR_RESPONSE = b'{"jsonrpc":"2.0","id":null,"error":{"code":-32603,"message":"Internal error"}}'
+_METHOD_NOT_FOUND_PREFIX = b'{"jsonrpc":"2.0","id":'
+_METHOD_NOT_FOUND_INFIX = b',"error":{"code":-32601,"message":'
+_METHOD_NOT_FOUND_SUFFIX = b'}}'
+
+
+def method_not_found_response(request_id: Any, method: Any) -> bytes:
+    """Build a serialized "method not found" error from the cached envelope."""
+    return (_METHOD_NOT_FOUND_PREFIX + dumps_bytes(request_id) + _METHOD_NOT_FOUND_INFIX
+            + dumps_bytes(f"Method not found: {method}") + _METHOD_NOT_FOUND_SUFFIX)
+
+
+# Upper bounds for coalescing queued responses into one stdout write
+WRITE_BATCH_MAX_RESPONSES = 16
+WRITE_BATCH_MAX_BYTES = 64 * 1024
+
+# Tool response cache lifetimes in seconds
+PRICE_CACHE_TTL = 30
+HISTORY_CACHE_TTL = 300
+MARKET_OVERVIEW_CACHE_TTL = 60
+SUPPORTED_COINS_CACHE_TTL = 3600
+
+# How long past expiry a cached response may still be served while it is
+# refreshed in the background
+CACHE_STALE_WINDOW = 60
+
 
 class CryptoMCPServer:
     """
@@ -41,14 +110,61 @@ class CryptoMCPServer:
     as tools that can be called by AI assistants.
     """
     
-    def __init__(self):
+    __slots__ = (
+        'crypto_api', 'server_info', '_ts_cache', '_structured_content',
+        '_cache', '_inflight', '_tools', '_resources', '_tools_result_json',
+        '_tool_dispatch', '_method_dispatch', '_validators',
+        '_supported_coins_body', '_supported_coins_etag'
+    )
+    
+    def __init__(self, warmup: bool = True):
         self.crypto_api = HeadlessCryptoAPI()
+        if warmup:
+            # Pay the indicator JIT compilation cost at startup rather than
+            # on the first analyze_cryptocurrency call
+            indicator_kernels.warmup()
         self.server_info = {
             "name": "crypto-data-server",
             "version": "1.0.0",
             "description": "Cryptocurrency data and analysis server"
         }
-        logger.info(f"Initialized {self.server_info['name']} v{self.server_info['version']}")
+        self._ts_cache: Tuple[float, str] = (0.0, "")
+        # Set during initialize when the client accepts structured tool content
+        self._structured_content = False
+        self._cache: Dict[str, Tuple[float, Any]] = {}
+        # Fetches currently running, keyed like _cache, shared by all waiters
+        self._inflight: Dict[str, asyncio.Task] = {}
+        
+        # Tool and resource listings never change, so build them once
+        self._tools = self.get_tools()
+        self._resources = self.get_resources()
+        self._tools_result_json = dumps_bytes({"tools": self._tools})
+        self.refresh_supported_coins()
+        
+        # Compile each tool's inputSchema into a validator function once
+        self._validators: Dict[str, Callable[[Any], Any]] = {}
+        if FASTJSONSCHEMA_AVAILABLE:
+            self._validators = {
+                tool["name"]: fastjsonschema.compile(tool["inputSchema"])
+                for tool in self._tools
+            }
+        
+        # Name -> handler lookup tables for tools and JSON-RPC methods
+        self._tool_dispatch = {
+            "get_crypto_price": self._get_crypto_price,
+            "get_crypto_history": self._get_crypto_history,
+            "get_market_overview": self._get_market_overview,
+            "analyze_cryptocurrency": self._analyze_cryptocurrency,
+            "get_supported_coins": lambda args: self._get_supported_coins(),
+        }
+        self._method_dispatch = {
+            "initialize": self.handle_initialize,
+            "tools/list": self.handle_list_tools,
+            "resources/list": self.handle_list_resources,
+            "tools/call": self.handle_call_tool,
+            "resources/read": self.handle_read_resource,
+        }
+        logger.info("Initialized %s v%s", self.server_info['name'], self.server_info['version'])
     
     def get_tools(self) -> List[Dict[str, Any]]:
         """
@@ -155,7 +271,7 @@ class CryptoMCPServer:
             }
         ]
     
-    def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    async def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """
         Execute a tool with given arguments.
         
@@ -167,52 +283,78 @@ class CryptoMCPServer:
             Tool execution result
         """
         try:
-            logger.info(f"Calling tool: {tool_name} with args: {arguments}")
+            logger.info("Calling tool: %s with args: %s", tool_name, arguments)
             
-            if tool_name == "get_crypto_price":
-                return self._get_crypto_price(arguments)
-            elif tool_name == "get_crypto_history":
-                return self._get_crypto_history(arguments)
-            elif tool_name == "get_market_overview":
-                return self._get_market_overview(arguments)
-            elif tool_name == "analyze_cryptocurrency":
-                return self._analyze_cryptocurrency(arguments)
-            elif tool_name == "get_supported_coins":
-                return self._get_supported_coins()
-            else:
+            handler = self._tool_dispatch.get(tool_name)
+            if handler is None:
                 return {
                     "error": f"Unknown tool: {tool_name}",
-                    "available_tools": [t["name"] for t in self.get_tools()]
+                    "available_tools": [t["name"] for t in self._tools]
                 }
+            
+            validator = self._validators.get(tool_name)
+            if validator is not None:
+                try:
+                    # Returns the arguments with schema defaults filled in
+                    arguments = validator(arguments)
+                except fastjsonschema.JsonSchemaException as e:
+                    return {
+                        "error": f"Invalid arguments: {e.message}",
+                        "tool": tool_name
+                    }
+            
+            return await handler(arguments)
                 
         except Exception as e:
-            logger.error(f"Error executing tool {tool_name}: {e}", exc_info=True)
+            logger.error("Error executing tool %s: %s", tool_name, e, exc_info=True)
             return {
                 "error": str(e),
                 "tool": tool_name
             }
     
-    def read_resource(self, uri: str) -> Dict[str, Any]:
+    def refresh_supported_coins(self) -> None:
+        """
+        Rebuild the cached supported-coins resource body and its ETag.
+        
+        Call this after crypto_api.supported_coins changes.
+        """
+        self._supported_coins_body = json.dumps({
+            "supported_coins": self.crypto_api.supported_coins,
+            "count": len(self.crypto_api.supported_coins)
+        }, indent=2)
+        self._supported_coins_etag = hashlib.blake2b(
+            self._supported_coins_body.encode(), digest_size=8
+        ).hexdigest()
+    
+    def read_resource(self, uri: str, if_none_match: Optional[str] = None) -> Dict[str, Any]:
         """
         Read a resource by URI.
         
         Args:
             uri: Resource URI
+            if_none_match: ETag from a previous read; when it still matches,
+                the content is omitted and "notModified" is set
             
         Returns:
             Resource content
         """
         try:
-            logger.info(f"Reading resource: {uri}")
+            logger.info("Reading resource: %s", uri)
             
             if uri == "crypto://supported-coins":
+                if if_none_match == self._supported_coins_etag:
+                    return {
+                        "uri": uri,
+                        "mimeType": "application/json",
+                        "etag": self._supported_coins_etag,
+                        "notModified": True,
+                        "text": ""
+                    }
                 return {
                     "uri": uri,
                     "mimeType": "application/json",
-                    "text": json.dumps({
-                        "supported_coins": self.crypto_api.supported_coins,
-                        "count": len(self.crypto_api.supported_coins)
-                    }, indent=2)
+                    "etag": self._supported_coins_etag,
+                    "text": self._supported_coins_body
                 }
             elif uri == "crypto://server-info":
                 return {
@@ -223,26 +365,95 @@ class CryptoMCPServer:
             else:
                 return {
                     "error": f"Unknown resource: {uri}",
-                    "available_resources": [r["uri"] for r in self.get_resources()]
+                    "available_resources": [r["uri"] for r in self._resources]
                 }
                 
         except Exception as e:
-            logger.error(f"Error reading resource {uri}: {e}", exc_info=True)
+            logger.error("Error reading resource %s: %s", uri, e, exc_info=True)
             return {
                 "error": str(e),
                 "uri": uri
             }
     
+    def _now_iso(self) -> str:
+        """Current time as ISO 8601, recomputed at most once per second."""
+        now = time.time()
+        if now - self._ts_cache[0] > 1.0:
+            self._ts_cache = (now, datetime.fromtimestamp(now).isoformat())
+        return self._ts_cache[1]
+    
+    # Response cache
+    
+    async def _cached(self, key: str, ttl: float,
+                      fetch: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        """
+        Return a cached tool response, fetching it when missing or expired.
+        
+        Responses within CACHE_STALE_WINDOW of expiry are served stale while a
+        background task refreshes them. Concurrent misses for the same key
+        share a single upstream fetch. Error responses are never cached.
+        
+        Args:
+            key: Cache key
+            ttl: Time to live in seconds
+            fetch: Coroutine function producing a fresh response
+            
+        Returns:
+            Tool response
+        """
+        now = time.monotonic()
+        entry = self._cache.get(key)
+        
+        if entry is not None:
+            expires_at, value = entry
+            if now < expires_at:
+                return value
+            if now < expires_at + CACHE_STALE_WINDOW:
+                self._start_refresh(key, ttl, fetch)
+                return value
+        
+        # Shield the shared task so one cancelled waiter doesn't cancel the
+        # fetch for everyone else
+        return await asyncio.shield(self._start_refresh(key, ttl, fetch))
+    
+    def _start_refresh(self, key: str, ttl: float,
+                       fetch: Callable[[], Awaitable[Dict[str, Any]]]) -> asyncio.Task:
+        """Return the in-flight refresh task for key, starting one if needed."""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._refresh(key, ttl, fetch))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return task
+    
+    async def _refresh(self, key: str, ttl: float,
+                       fetch: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        """Fetch a fresh response and store it in the cache."""
+        value = await fetch()
+        if "error" not in value:
+            self._cache[key] = (time.monotonic() + ttl, value)
+        return value
+    
     # Tool implementations
+    #
+    # HeadlessCryptoAPI is synchronous, so its calls run in worker threads to
+    # let concurrent requests overlap their upstream wait time.
     
-    def _get_crypto_price(self, args: Dict[str, Any]) -> Dict[str, Any]:
+    async def _get_crypto_price(self, args: Dict[str, Any]) -> Dict[str, Any]:
         """Get current price for a cryptocurrency."""
         coin_id = args.get("coin_id")
         if not coin_id:
             return {"error": "coin_id is required"}
         
+        return await self._cached(
+            f"price:{coin_id}", PRICE_CACHE_TTL,
+            lambda: self._fetch_crypto_price(coin_id)
+        )
+    
+    async def _fetch_crypto_price(self, coin_id: str) -> Dict[str, Any]:
+        """Fetch current price data for a cryptocurrency."""
         # Fetch price data (1 day to get latest)
-        df = self.crypto_api.fetch_price_data(coin_id, days=1)
+        df = await asyncio.to_thread(self.crypto_api.fetch_price_data, coin_id, days=1)
         if df is None:
             return {"error": f"Could not fetch data for {coin_id}"}
         
@@ -261,10 +472,10 @@ class CryptoMCPServer:
             "volume_24h_usd": latest_volume,
             "market_cap_usd": latest_market_cap,
             "price_change_24h_percent": price_change_24h,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": self._now_iso()
         }
     
-    def _get_crypto_history(self, args: Dict[str, Any]) -> Dict[str, Any]:
+    async def _get_crypto_history(self, args: Dict[str, Any]) -> Dict[str, Any]:
         """Get historical price data."""
         coin_id = args.get("coin_id")
         days = args.get("days", 30)
@@ -275,42 +486,68 @@ class CryptoMCPServer:
         # Limit days to 365
         days = min(days, 365)
         
-        df = self.crypto_api.fetch_price_data(coin_id, days)
+        return await self._cached(
+            f"history:{coin_id}:{days}", HISTORY_CACHE_TTL,
+            lambda: self._fetch_crypto_history(coin_id, days)
+        )
+    
+    async def _fetch_crypto_history(self, coin_id: str, days: int) -> Dict[str, Any]:
+        """Fetch historical price data."""
+        df = await asyncio.to_thread(self.crypto_api.fetch_price_data, coin_id, days)
         if df is None:
             return {"error": f"Could not fetch data for {coin_id}"}
         
-        # Convert DataFrame to list of price points
-        prices = []
-        for idx, row in df.iterrows():
-            prices.append({
-                "timestamp": idx.isoformat(),
-                "price": float(row['price']),
-                "volume": float(row['volume']),
-                "market_cap": float(row['market_cap'])
-            })
+        # Convert DataFrame to list of price points, column-wise. Each column
+        # is converted to Python objects in a single C loop; timestamps are
+        # formatted at a fixed microsecond precision
+        timestamps = np.datetime_as_string(df.index.to_numpy(), unit='us').tolist()
+        price_values = df['price'].to_numpy(dtype=np.float64).tolist()
+        volume_values = df['volume'].to_numpy(dtype=np.float64).tolist()
+        market_cap_values = df['market_cap'].to_numpy(dtype=np.float64).tolist()
+        
+        prices = [
+            {
+                "timestamp": timestamp,
+                "price": price,
+                "volume": volume,
+                "market_cap": market_cap
+            }
+            for timestamp, price, volume, market_cap in zip(
+                timestamps, price_values, volume_values, market_cap_values
+            )
+        ]
         
         return {
             "coin_id": coin_id,
             "days": days,
             "data_points": len(prices),
             "prices": prices,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": self._now_iso()
         }
     
-    def _get_market_overview(self, args: Dict[str, Any]) -> Dict[str, Any]:
+    async def _get_market_overview(self, args: Dict[str, Any]) -> Dict[str, Any]:
         """Get market overview."""
         limit = args.get("limit", 10)
         limit = min(limit, 50)  # Max 50
         
-        market_data = self.crypto_api.get_market_overview(limit)
+        return await self._cached(
+            f"market_overview:{limit}", MARKET_OVERVIEW_CACHE_TTL,
+            lambda: self._fetch_market_overview(limit)
+        )
+    
+    async def _fetch_market_overview(self, limit: int) -> Dict[str, Any]:
+        """Fetch market overview."""
+        # A single /coins/markets request returns all `limit` coins, so there
+        # is no per-coin fan-out to parallelize here
+        market_data = await asyncio.to_thread(self.crypto_api.get_market_overview, limit)
         
         return {
             "market_overview": market_data,
             "total_cryptocurrencies": len(market_data),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": self._now_iso()
         }
     
-    def _analyze_cryptocurrency(self, args: Dict[str, Any]) -> Dict[str, Any]:
+    async def _analyze_cryptocurrency(self, args: Dict[str, Any]) -> Dict[str, Any]:
         """Perform comprehensive analysis."""
         coin_id = args.get("coin_id")
         days = args.get("days", 30)
@@ -318,20 +555,35 @@ class CryptoMCPServer:
         if not coin_id:
             return {"error": "coin_id is required"}
         
-        return self.crypto_api.analyze_cryptocurrency(coin_id, days)
+        return await asyncio.to_thread(self.crypto_api.analyze_cryptocurrency, coin_id, days)
     
-    def _get_supported_coins(self) -> Dict[str, Any]:
+    async def _get_supported_coins(self) -> Dict[str, Any]:
         """Get list of supported coins."""
+        return await self._cached(
+            "supported_coins", SUPPORTED_COINS_CACHE_TTL,
+            self._fetch_supported_coins
+        )
+    
+    async def _fetch_supported_coins(self) -> Dict[str, Any]:
+        """Build the supported coins response."""
         return {
             "supported_coins": self.crypto_api.supported_coins,
             "count": len(self.crypto_api.supported_coins),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": self._now_iso()
         }
     
     # MCP Protocol handlers
     
-    def handle_initialize(self, request: Dict[str, Any]) -> Dict[str, Any]:
-        """Handle initialize request."""
+    async def handle_initialize(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Handle initialize request.
+        
+        Clients that advertise the `structuredContent` capability receive
+        tool results as JSON objects instead of JSON-encoded text.
+        """
+        capabilities = request.get("params", {}).get("capabilities", {})
+        self._structured_content = bool(capabilities.get("structuredContent"))
+        
         return {
             "protocolVersion": "2024-11-05",
             "capabilities": {
@@ -341,41 +593,75 @@ class CryptoMCPServer:
             "serverInfo": self.server_info
         }
     
-    def handle_list_tools(self, request: Dict[str, Any]) -> Dict[str, Any]:
+    async def handle_list_tools(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Handle tools/list request."""
         return {
-            "tools": self.get_tools()
+            "tools": self._tools
         }
     
-    def handle_list_resources(self, request: Dict[str, Any]) -> Dict[str, Any]:
+    def fast_response_bytes(self, request: Dict[str, Any]) -> Optional[bytes]:
+        """
+        Return a pre-serialized response for requests that need no handler.
+        
+        Covers tools/list and unknown methods; returns None for everything
+        else, which must go through handle_request.
+        """
+        method = request.get("method")
+        if method == "tools/list":
+            return self.tools_list_response_bytes(request.get("id"))
+        if not isinstance(method, str) or method not in self._method_dispatch:
+            logger.info("Handling request: method=%s, id=%s", method, request.get('id'))
+            return method_not_found_response(request.get("id"), method)
+        return None
+    
+    def tools_list_response_bytes(self, request_id: Any) -> bytes:
+        """
+        Return a serialized tools/list response.
+        
+        Only the request id is encoded per call; the tool listing itself is
+        serialized once at startup.
+        """
+        return b'{"jsonrpc":"2.0","id":' + dumps_bytes(request_id) + b',"result":' + self._tools_result_json + b'}'
+    
+    async def handle_list_resources(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Handle resources/list request."""
         return {
-            "resources": self.get_resources()
+            "resources": self._resources
         }
     
-    def handle_call_tool(self, request: Dict[str, Any]) -> Dict[str, Any]:
+    async def handle_call_tool(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Handle tools/call request."""
         params = request.get("params", {})
         tool_name = params.get("name")
         arguments = params.get("arguments", {})
         
-        result = self.call_tool(tool_name, arguments)
+        result = await self.call_tool(tool_name, arguments)
+        
+        if self._structured_content:
+            return {
+                "content": [
+                    {
+                        "type": "json",
+                        "json": result
+                    }
+                ]
+            }
         
         return {
             "content": [
                 {
                     "type": "text",
-                    "text": json.dumps(result, indent=2)
+                    "text": dumps_bytes(result).decode()
                 }
             ]
         }
     
-    def handle_read_resource(self, request: Dict[str, Any]) -> Dict[str, Any]:
+    async def handle_read_resource(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Handle resources/read request."""
         params = request.get("params", {})
         uri = params.get("uri")
         
-        result = self.read_resource(uri)
+        result = self.read_resource(uri, params.get("ifNoneMatch"))
         
         if "error" in result:
             return result
@@ -384,7 +670,7 @@ class CryptoMCPServer:
             "contents": [result]
         }
     
-    def handle_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+    async def handle_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """
         Handle incoming MCP request.
         
@@ -397,28 +683,21 @@ class CryptoMCPServer:
         method = request.get("method")
         request_id = request.get("id")
         
-        logger.info(f"Handling request: method={method}, id={request_id}")
+        logger.info("Handling request: method=%s, id=%s", method, request_id)
         
         response = {"jsonrpc": "2.0", "id": request_id}
         
         try:
-            if method == "initialize":
-                response["result"] = self.handle_initialize(request)
-            elif method == "tools/list":
-                response["result"] = self.handle_list_tools(request)
-            elif method == "resources/list":
-                response["result"] = self.handle_list_resources(request)
-            elif method == "tools/call":
-                response["result"] = self.handle_call_tool(request)
-            elif method == "resources/read":
-                response["result"] = self.handle_read_resource(request)
-            else:
+            handler = self._method_dispatch.get(method)
+            if handler is None:
                 response["error"] = {
                     "code": -32601,
                     "message": f"Method not found: {method}"
                 }
+            else:
+                response["result"] = await handler(request)
         except Exception as e:
-            logger.error(f"Error handling request: {e}", exc_info=True)
+            logger.error("Error handling request: %s", e, exc_info=True)
             response["error"] = {
                 "code": -32603,
                 "message": f"Internal error: {str(e)}"
@@ -427,6 +706,101 @@ class CryptoMCPServer:
         return response
 
 
+async def _write_responses(responses: asyncio.Queue) -> None:
+    """
+    Write queued responses to stdout until a None sentinel is received.
+    
+    Responses are either dicts or bytes that are already serialized. While
+    more responses are waiting in the queue they are coalesced into a single
+    write (up to WRITE_BATCH_MAX_RESPONSES / WRITE_BATCH_MAX_BYTES); the
+    buffer is flushed as soon as the queue drains, so an idle server never
+    holds a response back.
+    """
+    out = sys.stdout.buffer
+    done = False
+    while not done:
+        response = await responses.get()
+        buffer = bytearray()
+        count = 0
+        while True:
+            if response is None:
+                done = True
+                break
+            buffer += response if isinstance(response, bytes) else dumps_bytes(response)
+            buffer += b"\n"
+            count += 1
+            if (count >= WRITE_BATCH_MAX_RESPONSES or len(buffer) >= WRITE_BATCH_MAX_BYTES
+                    or responses.empty()):
+                break
+            response = responses.get_nowait()
+        
+        if buffer:
+            out.write(buffer)
+            out.flush()
+
+
+async def _serve_stdio(server: CryptoMCPServer) -> None:
+    """
+    Read JSON-RPC requests from stdin and process them concurrently.
+    
+    Each request line is handled in its own task so slow tool calls do not
+    block the ones behind them. Responses carry the request id and are
+    written in completion order by a single writer task.
+    """
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader()
+    await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+    
+    responses: asyncio.Queue = asyncio.Queue()
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    writer = asyncio.create_task(_write_responses(responses))
+    pending = set()
+    
+    async def respond(line: bytes) -> Any:
+        async with semaphore:
+            try:
+                request = loads(line)
+            except json.JSONDecodeError as e:
+                logger.error("Invalid JSON received: %s", e)
+                return PARSE_ERROR_RESPONSE
+            if not isinstance(request, dict):
+                logger.error("Invalid request received: %s", type(request).__name__)
+                return INVALID_REQUEST_RESPONSE
+            response = server.fast_response_bytes(request)
+            if response is None:
+                response = await server.handle_request(request)
+            return response
+    
+    async def process(line: bytes) -> None:
+        # Every line gets an answer, and a failure here must not take the
+        # shutdown sequence below down with it
+        try:
+            response = await respond(line)
+        except Exception as e:
+            logger.error("Error processing request: %s", e, exc_info=True)
+            response = INTERNAL_ERROR_RESPONSE
+        await responses.put(response)
+    
+    while True:
+        line = await reader.readline()
+        if not line:
+            break
+        
+        line = line.strip()
+        if not line:
+            continue
+        
+        task = asyncio.create_task(process(line))
+        pending.add(task)
+        task.add_done_callback(pending.discard)
+    
+    # stdin closed: finish in-flight requests, then stop the writer
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+    await responses.put(None)
+    await writer
+
+
 def run_stdio_server():
     """
     Run the MCP server using stdio transport.
@@ -438,39 +812,29 @@ def run_stdio_server():
     logger.info("Waiting for requests on stdin...")
     
     try:
-        for line in sys.stdin:
-            line = line.strip()
-            if not line:
-                continue
-            
-            try:
-                request = json.loads(line)
-                response = server.handle_request(request)
-                
-                # Write response to stdout
-                print(json.dumps(response), flush=True)
-                
-            except json.JSONDecodeError as e:
-                logger.error(f"Invalid JSON received: {e}")
-                error_response = {
-                    "jsonrpc": "2.0",
-                    "id": None,
-                    "error": {
-                        "code": -32700,
-                        "message": "Parse error"
-                    }
-                }
-                print(json.dumps(error_response), flush=True)
-                
+        asyncio.run(_serve_stdio(server))
     except KeyboardInterrupt:
         logger.info("Server stopped by user")
     except Exception as e:
-        logger.error(f"Server error: {e}", exc_info=True)
+        logger.error("Server error: %s", e, exc_info=True)
         sys.exit(1)
 
 
 def main():
     """Main entry point."""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Cryptocurrency Data MCP Server (stdio)')
+    parser.add_argument(
+        '--verbose', '-v',
+        action='store_true',
+        help='Log every request at INFO level to stderr'
+    )
+    args = parser.parse_args()
+    
+    # Per-request logging is at INFO, so it costs nothing unless --verbose
+    logging.getLogger().setLevel(logging.INFO if args.verbose else logging.WARNING)
+    
     logger.info("=" * 60)
     logger.info("Cryptocurrency Data MCP Server")
     logger.info("=" * 60)
@@ -5,11 +5,30 @@ Shows that the GUI components are properly integrated
 """
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
+from requests.adapters import HTTPAdapter
 
 # Constants
 API_TIMEOUT = 10  # Timeout for API requests in seconds
 
+
+def create_session():
+    """Create a keep-alive session shared by all demo requests"""
+    session = requests.Session()
+    session.mount('http://', HTTPAdapter(pool_maxsize=8))
+    return session
+
+
+def send_request(session, base_url, method, path, **kwargs):
+    """Send one request, returning the response or the exception raised"""
+    try:
+        return session.request(method, f"{base_url}{path}", timeout=API_TIMEOUT, **kwargs)
+    except Exception as e:
+        return e
+
+
 def test_api_endpoints():
     """Test that the API endpoints are working"""
     print("\n" + "=" * 70)
@@ -17,12 +36,33 @@ def test_api_endpoints():
     print("=" * 70)
     
     base_url = "http://localhost:8000/api"
+    session = create_session()
+    payload = {
+        'coin_id': 'ethereum',
+        'coin_name': 'Ethereum',
+        'coin_symbol': 'ETH'
+    }
+    
+    # Search and add are independent, so they run concurrently; viewing the
+    # watchlist waits for the add so the new coin is included
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        search_future = executor.submit(
+            send_request, session, base_url, 'GET', '/search/', params={'query': 'cardano'}
+        )
+        add_future = executor.submit(
+            send_request, session, base_url, 'POST', '/watchlist/add/', json=payload
+        )
+        add_result = add_future.result()
+        watchlist_result = send_request(session, base_url, 'GET', '/watchlist/')
+        search_result = search_future.result()
     
     # Test 1: Search functionality
     print("\n1. Testing Search API...")
     print("-" * 70)
     try:
-        response = requests.get(f"{base_url}/search/", params={'query': 'cardano'}, timeout=API_TIMEOUT)
+        if isinstance(search_result, Exception):
+            raise search_result
+        response = search_result
         if response.status_code == 200:
             data = response.json()
             print(f"✅ Search successful! Found {data['count']} results")
@@ -37,16 +77,9 @@ def test_api_endpoints():
     print("\n2. Testing Add to Watchlist...")
     print("-" * 70)
     try:
-        payload = {
-            'coin_id': 'ethereum',
-            'coin_name': 'Ethereum',
-            'coin_symbol': 'ETH'
-        }
-        response = requests.post(
-            f"{base_url}/watchlist/add/",
-            json=payload,
-            timeout=API_TIMEOUT
-        )
+        if isinstance(add_result, Exception):
+            raise add_result
+        response = add_result
         if response.status_code in [201, 409]:  # 409 if already exists
             if response.status_code == 201:
                 print(f"✅ Added Ethereum to watchlist")
@@ -61,7 +94,9 @@ def test_api_endpoints():
     print("\n3. Testing View Watchlist...")
     print("-" * 70)
     try:
-        response = requests.get(f"{base_url}/watchlist/", timeout=API_TIMEOUT)
+        if isinstance(watchlist_result, Exception):
+            raise watchlist_result
+        response = watchlist_result
         if response.status_code == 200:
             data = response.json()
             print(f"✅ Watchlist retrieved successfully")
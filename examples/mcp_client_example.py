@@ -9,28 +9,87 @@ This is a reference implementation showing how an MCP client would
 communicate with the server.
 """
 
+import asyncio
 import json
-import subprocess
 import sys
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Largest response line accepted from the server (history results can be big)
+MAX_LINE_BYTES = 16 * 1024 * 1024
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize to JSON bytes, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 class MCPClient:
-    """Simple MCP client for demonstration purposes."""
+    """
+    Simple asyncio MCP client for demonstration purposes.
+    
+    Requests are pipelined: each one gets a Future keyed by its JSON-RPC id,
+    and a single background task reads responses and resolves the matching
+    Future, so several tool calls can be in flight at once.
+    """
     
     def __init__(self, server_path: str):
-        """Initialize the MCP client."""
+        """Initialize the MCP client. Call start() before sending requests."""
+        self.server_path = server_path
         self.request_id = 0
-        self.server_process = subprocess.Popen(
-            [sys.executable, server_path],
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=False
+        self.server_process: Optional[asyncio.subprocess.Process] = None
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._reader_task: Optional[asyncio.Task] = None
+    
+    async def start(self) -> None:
+        """Launch the server process and start reading its responses."""
+        self.server_process = await asyncio.create_subprocess_exec(
+            sys.executable, self.server_path,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            limit=MAX_LINE_BYTES
         )
+        self._reader_task = asyncio.create_task(self._read_responses())
     
-    def send_request(self, method: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Send a JSON-RPC request to the server."""
+    async def _read_responses(self) -> None:
+        """Resolve pending requests as their responses arrive."""
+        while True:
+            line = await self.server_process.stdout.readline()
+            if not line:
+                break
+            try:
+                response = _loads(line)
+            except ValueError:
+                # Skip non-JSON lines (probably log messages)
+                continue
+            
+            future = self._pending.pop(response.get("id"), None)
+            if future is not None and not future.done():
+                future.set_result(response)
+        
+        # Server closed its stdout: fail anything still waiting
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(Exception("Server closed the connection"))
+        self._pending.clear()
+    
+    async def send_request(self, method: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Send a JSON-RPC request to the server and wait for its response."""
         self.request_id += 1
         request = {
             "jsonrpc": "2.0",
@@ -40,65 +99,71 @@ class MCPClient:
         if params:
             request["params"] = params
         
-        # Send request
-        request_line = json.dumps(request) + "\n"
-        self.server_process.stdin.write(request_line.encode())
-        self.server_process.stdin.flush()
+        future = asyncio.get_running_loop().create_future()
+        self._pending[self.request_id] = future
         
-        # Read response, skipping non-JSON lines (like log messages)
-        max_attempts = 10
-        for _ in range(max_attempts):
-            response_line = self.server_process.stdout.readline().decode().strip()
-            if not response_line:
-                continue
-            try:
-                return json.loads(response_line)
-            except json.JSONDecodeError:
-                # Skip non-JSON lines (probably log messages)
-                continue
+        # Send request
+        self.server_process.stdin.write(_dumps(request) + b"\n")
+        await self.server_process.stdin.drain()
         
-        raise Exception("No valid JSON response received from server")
+        return await future
     
-    def initialize(self) -> Dict[str, Any]:
+    async def initialize(self) -> Dict[str, Any]:
         """Initialize the MCP session."""
-        return self.send_request("initialize", {
+        return await self.send_request("initialize", {
             "protocolVersion": "2024-11-05",
-            "capabilities": {}
+            "capabilities": {
+                "structuredContent": True
+            }
         })
     
-    def list_tools(self) -> Dict[str, Any]:
+    async def list_tools(self) -> Dict[str, Any]:
         """List available tools."""
-        return self.send_request("tools/list")
+        return await self.send_request("tools/list")
     
-    def call_tool(self, tool_name: str, arguments: Dict[str, Any] = None) -> Dict[str, Any]:
+    async def call_tool(self, tool_name: str, arguments: Dict[str, Any] = None) -> Dict[str, Any]:
         """Call a tool."""
         if arguments is None:
             arguments = {}
-        return self.send_request("tools/call", {
+        return await self.send_request("tools/call", {
             "name": tool_name,
             "arguments": arguments
         })
     
-    def list_resources(self) -> Dict[str, Any]:
+    @staticmethod
+    def tool_result(response: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract the tool result from a tools/call response."""
+        content = response['result']['content'][0]
+        if content['type'] == 'json':
+            return content['json']
+        return json.loads(content['text'])
+    
+    async def list_resources(self) -> Dict[str, Any]:
         """List available resources."""
-        return self.send_request("resources/list")
+        return await self.send_request("resources/list")
     
-    def read_resource(self, uri: str) -> Dict[str, Any]:
+    async def read_resource(self, uri: str) -> Dict[str, Any]:
         """Read a resource."""
-        return self.send_request("resources/read", {
+        return await self.send_request("resources/read", {
             "uri": uri
         })
     
-    def close(self):
+    async def close(self) -> None:
         """Close the client connection."""
-        self.server_process.terminate()
+        if self.server_process is None:
+            return
+        if self.server_process.returncode is None:
+            self.server_process.terminate()
         try:
-            self.server_process.wait(timeout=5)
-        except subprocess.TimeoutExpired:
+            await asyncio.wait_for(self.server_process.wait(), timeout=5)
+        except asyncio.TimeoutError:
             self.server_process.kill()
+            await self.server_process.wait()
+        if self._reader_task is not None:
+            await self._reader_task
 
 
-def main():
+async def main():
     """Demonstrate MCP client usage."""
     print("=" * 60)
     print("Crypto MCP Client Example")
@@ -107,17 +172,18 @@ def main():
     # Initialize client
     print("\n1. Initializing MCP client...")
     client = MCPClient("../crypto_mcp_server.py")
+    await client.start()
     
     try:
         # Initialize session
         print("\n2. Initializing MCP session...")
-        init_response = client.initialize()
+        init_response = await client.initialize()
         server_info = init_response['result']['serverInfo']
         print(f"   Connected to: {server_info['name']} v{server_info['version']}")
         
         # List available tools
         print("\n3. Listing available tools...")
-        tools_response = client.list_tools()
+        tools_response = await client.list_tools()
         tools = tools_response['result']['tools']
         print(f"   Available tools: {len(tools)}")
         for tool in tools:
@@ -125,28 +191,31 @@ def main():
         
         # Example 1: Get supported coins
         print("\n4. Getting supported cryptocurrencies...")
-        response = client.call_tool("get_supported_coins")
-        result = json.loads(response['result']['content'][0]['text'])
+        response = await client.call_tool("get_supported_coins")
+        result = client.tool_result(response)
         print(f"   Supported coins: {', '.join(result['supported_coins'])}")
         
-        # Example 2: Get Bitcoin price
-        print("\n5. Getting Bitcoin current price...")
-        response = client.call_tool("get_crypto_price", {
-            "coin_id": "bitcoin"
-        })
-        result = json.loads(response['result']['content'][0]['text'])
-        if 'error' not in result:
-            print(f"   Bitcoin Price: ${result['price_usd']:,.2f}")
-            print(f"   24h Change: {result['price_change_24h_percent']:.2f}%")
-        else:
-            print(f"   Error: {result['error']}")
+        # Example 2: Get several prices concurrently (requests are pipelined)
+        print("\n5. Getting Bitcoin and Ethereum current prices...")
+        coins = ["bitcoin", "ethereum"]
+        responses = await asyncio.gather(*(
+            client.call_tool("get_crypto_price", {"coin_id": coin_id})
+            for coin_id in coins
+        ))
+        for coin_id, response in zip(coins, responses):
+            result = client.tool_result(response)
+            if 'error' not in result:
+                print(f"   {coin_id.title()} Price: ${result['price_usd']:,.2f}")
+                print(f"   24h Change: {result['price_change_24h_percent']:.2f}%")
+            else:
+                print(f"   Error: {result['error']}")
         
         # Example 3: Get market overview
         print("\n6. Getting market overview (top 5)...")
-        response = client.call_tool("get_market_overview", {
+        response = await client.call_tool("get_market_overview", {
             "limit": 5
         })
-        result = json.loads(response['result']['content'][0]['text'])
+        result = client.tool_result(response)
         if result.get('market_overview'):
             print("   Top 5 Cryptocurrencies:")
             for i, coin in enumerate(result['market_overview'], 1):
@@ -155,7 +224,7 @@ def main():
         
         # Example 4: Read a resource
         print("\n7. Reading server-info resource...")
-        response = client.read_resource("crypto://server-info")
+        response = await client.read_resource("crypto://server-info")
         resource_content = json.loads(response['result']['contents'][0]['text'])
         print(f"   Server: {json.dumps(resource_content, indent=6)}")
         
@@ -172,9 +241,9 @@ def main():
     finally:
         # Clean up
         print("\n8. Closing connection...")
-        client.close()
+        await client.close()
         print("   ✓ Disconnected")
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -10,8 +10,9 @@ import json
 import time
 import logging
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -19,7 +20,10 @@ warnings.filterwarnings('ignore')
 import pandas as pd
 import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
 from retrying import retry
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 
 # ML libraries
 try:
@@ -41,6 +45,30 @@ except ImportError:
     TA_AVAILABLE = False
     print("⚠️ Technical analysis library not available.", file=sys.stderr)
 
+# Fast JSON parsing for CoinGecko responses
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Persistent cache for fetched price data (optional)
+try:
+    import diskcache
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
+
+# Bounded in-memory caches (optional)
+try:
+    from cachetools import LRUCache, TTLCache
+    CACHETOOLS_AVAILABLE = True
+except ImportError:
+    CACHETOOLS_AVAILABLE = False
+
+# Indicator kernels (Numba-compiled when available)
+import indicator_kernels
+
 # Claude integration
 try:
     from claude_analyzer import ClaudeAnalyzer
@@ -50,6 +78,47 @@ except ImportError:
     CLAUDE_AVAILABLE = False
     print("⚠️ Claude Analyzer not available. AI insights disabled.")
 
+# Most entries kept in each in-memory cache (price frames, indicator frames,
+# ETag-revalidated response bodies)
+MEMORY_CACHE_MAXSIZE = 64
+
+# On-disk price data cache, shared across processes and restarts; off unless
+# a directory is configured here or passed to HeadlessCryptoAPI
+DISK_CACHE_DIR = os.environ.get('LETSGETCRYPTO_CACHE_DIR')
+DISK_CACHE_SIZE_LIMIT = 512 * 1024 * 1024  # 512 MB
+
+# Upper bound on concurrent CoinGecko requests from one fan-out call; kept
+# below the session's connection pool size so every worker gets a connection
+MAX_FETCH_WORKERS = 10
+
+# Trend slope window and its precomputed least-squares terms: for x = 0..n-1,
+# slope = sum((x - mean(x)) * y) / sum((x - mean(x))^2)
+TREND_WINDOW = 7
+_TREND_X_CENTERED = np.arange(TREND_WINDOW) - (TREND_WINDOW - 1) / 2.0
+_TREND_X_DENOM = float(np.dot(_TREND_X_CENTERED, _TREND_X_CENTERED))
+
+# Reason strings for every combination of the signal_vote flags that carry
+# no value: flags -> (crossover reason, trailing reasons)
+_STATIC_REASON_FLAGS = (
+    indicator_kernels.SIGNAL_SMA_BULLISH
+    | indicator_kernels.SIGNAL_HIGH_VOLUME
+    | indicator_kernels.SIGNAL_HIGH_VOLATILITY
+)
+_SIGNAL_REASONS = {
+    flags: (
+        "SMA7 > SMA25" if flags & indicator_kernels.SIGNAL_SMA_BULLISH else "SMA7 < SMA25",
+        tuple(
+            reason for flag, reason in (
+                (indicator_kernels.SIGNAL_HIGH_VOLUME, "High volume"),
+                (indicator_kernels.SIGNAL_HIGH_VOLATILITY, "High volatility"),
+            )
+            if flags & flag
+        )
+    )
+    for flags in range(_STATIC_REASON_FLAGS + 1)
+    if flags & ~_STATIC_REASON_FLAGS == 0
+}
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -58,15 +127,67 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def create_http_session() -> requests.Session:
+    """
+    Create a pooled HTTP session for CoinGecko requests
+    
+    Connections are kept alive and reused across calls, and transient
+    upstream failures (rate limiting, gateway errors) are retried with backoff.
+    """
+    session = requests.Session()
+    retries = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 502, 503, 504],
+        allowed_methods=['GET']
+    )
+    # Sized for the MCP server's concurrent tool calls (up to 20) plus a
+    # fetch_price_data_many fan-out (up to MAX_FETCH_WORKERS) at the same time
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=retries)
+    session.mount('https://', adapter)
+    # ACCEPT_ENCODING lists every encoding urllib3 can decode here: gzip and
+    # deflate, plus br/zstd when the brotli/zstandard packages are installed
+    session.headers.update({'Connection': 'keep-alive', 'Accept-Encoding': ACCEPT_ENCODING})
+    return session
+
+
 class HeadlessCryptoAPI:
     """
     Headless version of the crypto trading tool
     Provides API-like interface for AWS deployment
     """
     
-    def __init__(self, enable_claude: bool = True):
-        self.data_cache = {}
+    def __init__(self, enable_claude: bool = True, compact_dtypes: bool = False,
+                 disk_cache_dir: Optional[str] = DISK_CACHE_DIR):
+        """
+        Args:
+            enable_claude: Enable Claude AI insights when an API key is configured
+            compact_dtypes: Store fetched price, volume and market cap columns as
+                float32, halving cached frame memory at ~7 significant digits
+            disk_cache_dir: Directory for the persistent price data cache;
+                defaults to LETSGETCRYPTO_CACHE_DIR, and None disables it
+        """
         self.cache_timeout = 300  # 5 minutes
+        self.price_dtype = np.float32 if compact_dtypes else np.float64
+        # Entries also carry their own fetch time, because disk cache hits are
+        # promoted with their remaining lifetime rather than a full TTL
+        self.data_cache = (
+            TTLCache(maxsize=MEMORY_CACHE_MAXSIZE, ttl=self.cache_timeout, timer=time.monotonic)
+            if CACHETOOLS_AVAILABLE else {}
+        )
+        self.disk_cache = self._open_disk_cache(disk_cache_dir)
+        self.session = create_http_session()
+        self._etag_cache: Dict[str, Tuple[Optional[str], Optional[str], Any]] = (
+            LRUCache(maxsize=MEMORY_CACHE_MAXSIZE) if CACHETOOLS_AVAILABLE else {}
+        )
+        # Last indicator frame per (coin, days)
+        self.indicator_cache: Dict[str, pd.DataFrame] = (
+            LRUCache(maxsize=MEMORY_CACHE_MAXSIZE) if CACHETOOLS_AVAILABLE else {}
+        )
+        # cachetools caches are not thread-safe, and fetch_price_data_many,
+        # analyze_many and the MCP server call in from several threads; every
+        # get/set on the three caches above goes through this lock
+        self.cache_lock = threading.Lock()
         self.supported_coins = [
             'bitcoin', 'ethereum', 'binancecoin', 'cardano', 'solana',
             'polkadot', 'dogecoin', 'avalanche-2', 'polygon', 'chainlink'
@@ -80,20 +201,115 @@ class HeadlessCryptoAPI:
                 logger.info("Claude Opus 4.1 integration enabled")
             else:
                 logger.warning("Claude API key not configured. AI insights disabled.")
+    
+    def _open_disk_cache(self, directory: Optional[str]):
+        """
+        Open the persistent price data cache, or return None if it is not
+        configured or unavailable
+        """
+        if directory is None or not DISKCACHE_AVAILABLE:
+            return None
+        try:
+            return diskcache.Cache(directory, size_limit=DISK_CACHE_SIZE_LIMIT)
+        except Exception as e:
+            logger.warning(f"Disk cache unavailable at {directory}: {e}")
+            return None
+    
+    def _get_json(self, url: str, params: Dict[str, Any],
+                  transform: Optional[Callable[[Any], Any]] = None) -> Any:
+        """
+        GET a JSON resource through the pooled session
+        
+        Sends If-None-Match / If-Modified-Since when validators from a
+        previous response are known. On 304 Not Modified the stored result
+        is returned without downloading or parsing a body.
         
+        Args:
+            url: Resource URL
+            params: Query parameters
+            transform: Optional function applied to the parsed body; its
+                result is what gets stored and returned, so a 304 skips
+                the transformation too
+        """
+        cache_key = f"{url}?{sorted(params.items())}"
+        with self.cache_lock:
+            cached = self._etag_cache.get(cache_key)
+        headers = {}
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+        
+        response = self.session.get(url, params=params, headers=headers, timeout=30)
+        if response.status_code == 304 and cached:
+            return cached[2]
+        response.raise_for_status()
+        
+        data = orjson.loads(response.content) if ORJSON_AVAILABLE else response.json()
+        if transform is not None:
+            data = transform(data)
+        
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if etag or last_modified:
+            with self.cache_lock:
+                self._etag_cache[cache_key] = (etag, last_modified, data)
+        return data
+        
+    def _market_chart_frame(self, data: Dict[str, Any]) -> pd.DataFrame:
+        """
+        Build a price DataFrame from a /market_chart response body
+        """
+        # Convert to DataFrame: each [timestamp, value] list becomes an
+        # (n, 2) array in one C-level pass, then columns are sliced out
+        prices = np.asarray(data['prices'], dtype=np.float64).reshape(-1, 2)
+        volumes = np.asarray(data['total_volumes'], dtype=np.float64).reshape(-1, 2)
+        market_caps = np.asarray(data['market_caps'], dtype=np.float64).reshape(-1, 2)
+        
+        return pd.DataFrame(
+            {
+                'price': prices[:, 1].astype(self.price_dtype, copy=False),
+                'volume': volumes[:, 1].astype(self.price_dtype, copy=False),
+                'market_cap': market_caps[:, 1].astype(self.price_dtype, copy=False)
+            },
+            # Millisecond epoch integers reinterpreted as datetime64[ms]:
+            # a zero-copy view instead of a pd.to_datetime conversion
+            index=pd.DatetimeIndex(
+                prices[:, 0].astype(np.int64).view('datetime64[ms]'),
+                name='timestamp'
+            )
+        )
+    
     def fetch_price_data(self, coin_id: str, days: int = 30) -> Optional[pd.DataFrame]:
         """
         Fetch price data from CoinGecko API
         """
         cache_key = f"{coin_id}_{days}"
         
-        # Check cache
-        if cache_key in self.data_cache:
-            cached_data, timestamp = self.data_cache[cache_key]
-            if time.time() - timestamp < self.cache_timeout:
+        # Check cache; ages are measured on the monotonic clock so they are
+        # unaffected by wall-clock adjustments
+        with self.cache_lock:
+            entry = self.data_cache.get(cache_key)
+        if entry is not None:
+            cached_data, timestamp = entry
+            if time.monotonic() - timestamp < self.cache_timeout:
                 logger.info(f"Using cached data for {coin_id}")
                 return cached_data
         
+        # Check the persistent cache, which survives restarts
+        if self.disk_cache is not None:
+            entry = self.disk_cache.get(cache_key)
+            if entry is not None:
+                logger.info(f"Using disk-cached data for {coin_id}")
+                # Disk entries carry wall-clock fetch times, which are
+                # comparable across processes; convert to a monotonic one
+                cached_data, fetched_at = entry
+                with self.cache_lock:
+                    self.data_cache[cache_key] = (cached_data, time.monotonic() - (time.time() - fetched_at))
+                return cached_data
+        
         try:
             logger.info(f"Fetching data for {coin_id} ({days} days)")
             
@@ -104,24 +320,14 @@ class HeadlessCryptoAPI:
                 'interval': 'daily' if days > 30 else 'hourly'
             }
             
-            response = requests.get(url, params=params, timeout=30)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            # Convert to DataFrame
-            df = pd.DataFrame({
-                'timestamp': [x[0] for x in data['prices']],
-                'price': [x[1] for x in data['prices']],
-                'volume': [x[1] for x in data['total_volumes']],
-                'market_cap': [x[1] for x in data['market_caps']]
-            })
-            
-            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-            df.set_index('timestamp', inplace=True)
+            # A 304 returns the frame built from the previous response
+            df = self._get_json(url, params, transform=self._market_chart_frame)
             
             # Cache the data
-            self.data_cache[cache_key] = (df, time.time())
+            with self.cache_lock:
+                self.data_cache[cache_key] = (df, time.monotonic())
+            if self.disk_cache is not None:
+                self.disk_cache.set(cache_key, (df.copy(), time.time()), expire=self.cache_timeout)
             
             logger.info(f"Successfully fetched {len(df)} records for {coin_id}")
             return df
@@ -130,17 +336,53 @@ class HeadlessCryptoAPI:
             logger.error(f"Error fetching data for {coin_id}: {e}")
             return None
     
-    def calculate_technical_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
+    def fetch_price_data_many(self, coin_ids: List[str], days: int = 30) -> Dict[str, Optional[pd.DataFrame]]:
+        """
+        Fetch price data for several coins concurrently
+        
+        Requests run on a small thread pool sharing the pooled session, so
+        total wall time is roughly that of the slowest request rather than
+        the sum of all of them. Returns a frame (or None) per coin id.
+        """
+        if not coin_ids:
+            return {}
+        
+        workers = min(len(coin_ids), MAX_FETCH_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            frames = executor.map(lambda coin_id: self.fetch_price_data(coin_id, days), coin_ids)
+            return dict(zip(coin_ids, frames))
+    
+    def calculate_technical_indicators(self, df: pd.DataFrame,
+                                       cache_key: Optional[str] = None) -> pd.DataFrame:
         """
         Calculate technical indicators
+        
+        With a cache_key, the result is remembered and returned as is when the
+        same frame object comes back; any other frame is computed in full.
+        """
+        if cache_key is None:
+            return self._compute_indicators(df)
+        
+        # fetch_price_data hands back its cached frame object until it
+        # expires, and the indicators were added to that same object, so a
+        # repeat call needs no work at all
+        with self.cache_lock:
+            cached = self.indicator_cache.get(cache_key)
+        if cached is df:
+            return df
+        
+        df = self._compute_indicators(df)
+        with self.cache_lock:
+            self.indicator_cache[cache_key] = df
+        return df
+    
+    def _compute_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Calculate all technical indicators over the full frame
         """
         if not TA_AVAILABLE:
             logger.warning("Technical analysis not available, using basic indicators")
-            df['sma_7'] = df['price'].rolling(7).mean()
-            df['sma_25'] = df['price'].rolling(25).mean()
-            df['price_change'] = df['price'].pct_change()
-            df['volatility'] = df['price_change'].rolling(7).std()
-            return df
+            return self._calculate_basic_indicators(df)
         
         try:
             logger.info("Calculating technical indicators")
@@ -164,8 +406,9 @@ class HeadlessCryptoAPI:
             df['volume_sma'] = ta.volume.volume_sma(df['volume'], window=7)
             
             # Price changes
-            df['price_change'] = df['price'].pct_change()
-            df['volatility'] = df['price_change'].rolling(7).std()
+            price_change = indicator_kernels.pct_change(df['price'].to_numpy(dtype=np.float64))
+            df['price_change'] = price_change
+            df['volatility'] = indicator_kernels.rolling_std(price_change, 7)
             
             logger.info("Technical indicators calculated successfully")
             return df
@@ -173,11 +416,21 @@ class HeadlessCryptoAPI:
         except Exception as e:
             logger.error(f"Error calculating technical indicators: {e}")
             # Fallback to basic indicators
-            df['sma_7'] = df['price'].rolling(7).mean()
-            df['sma_25'] = df['price'].rolling(25).mean()
-            df['price_change'] = df['price'].pct_change()
-            df['volatility'] = df['price_change'].rolling(7).std()
-            return df
+            return self._calculate_basic_indicators(df)
+    
+    def _calculate_basic_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Calculate core indicators without the `ta` library
+        
+        Produces the same columns as the pandas fallback it replaces: SMA7,
+        SMA25, price change and volatility, computed by the indicator_kernels
+        equivalents of rolling().mean(), pct_change() and rolling(7).std().
+        """
+        prices = df['price'].to_numpy(dtype=np.float64)
+        indicators = indicator_kernels.BasicIndicators.compute(prices)
+        for name, values in indicators.columns().items():
+            df[name] = values
+        return df
     
     def generate_signals(self, df: pd.DataFrame) -> Dict[str, Any]:
         """
@@ -187,44 +440,36 @@ class HeadlessCryptoAPI:
             return {'signal': 'HOLD', 'confidence': 0.0, 'reason': 'Insufficient data'}
         
         try:
-            latest = df.iloc[-1]
-            signals = []
-            reasons = []
-            
-            # Moving average crossover
-            if latest['sma_7'] > latest['sma_25']:
-                signals.append(1)  # Buy signal
-                reasons.append("SMA7 > SMA25")
-            else:
-                signals.append(-1)  # Sell signal
-                reasons.append("SMA7 < SMA25")
-            
-            # RSI signals
-            if 'rsi' in df.columns:
-                rsi = latest['rsi']
-                if rsi < 30:
-                    signals.append(1)  # Oversold - buy
-                    reasons.append(f"RSI oversold ({rsi:.1f})")
-                elif rsi > 70:
-                    signals.append(-1)  # Overbought - sell
-                    reasons.append(f"RSI overbought ({rsi:.1f})")
-                else:
-                    signals.append(0)  # Neutral
-            
-            # Volume analysis
-            if 'volume_sma' in df.columns and latest['volume'] > latest['volume_sma'] * 1.5:
-                signals.append(1)  # High volume - bullish
-                reasons.append("High volume")
-            
-            # Volatility analysis
-            if latest['volatility'] > df['volatility'].quantile(0.8):
-                signals.append(0)  # High volatility - hold
-                reasons.append("High volatility")
+            # Read the last row from the underlying arrays instead of
+            # materializing it as a Series and looking up labels
+            price = float(df['price'].to_numpy()[-1])
+            sma_7 = df['sma_7'].to_numpy()[-1]
+            sma_25 = df['sma_25'].to_numpy()[-1]
+            volume = float(df['volume'].to_numpy()[-1])
+            volatility_values = df['volatility'].to_numpy(dtype=np.float64)
+            volatility = volatility_values[-1]
+            rsi = df['rsi'].to_numpy()[-1] if 'rsi' in df.columns else None
             
-            # Calculate overall signal
-            avg_signal = np.mean(signals) if signals else 0
+            has_volume_sma = 'volume_sma' in df.columns
+            avg_signal, flags = indicator_kernels.signal_vote(
+                sma_7, sma_25,
+                rsi if rsi is not None else np.nan, rsi is not None,
+                volume, df['volume_sma'].to_numpy()[-1] if has_volume_sma else np.nan, has_volume_sma,
+                # The 80th percentile matches Series.quantile(0.8)
+                # (linear interpolation, NaN skipped)
+                volatility, np.nanquantile(volatility_values, 0.8)
+            )
             confidence = min(abs(avg_signal), 1.0)
             
+            # Fixed reasons come from the table; only the RSI one embeds a value
+            crossover_reason, trailing_reasons = _SIGNAL_REASONS[flags & _STATIC_REASON_FLAGS]
+            reasons = [crossover_reason]
+            if flags & indicator_kernels.SIGNAL_RSI_OVERSOLD:
+                reasons.append(f"RSI oversold ({rsi:.1f})")
+            elif flags & indicator_kernels.SIGNAL_RSI_OVERBOUGHT:
+                reasons.append(f"RSI overbought ({rsi:.1f})")
+            reasons.extend(trailing_reasons)
+            
             if avg_signal > 0.3:
                 signal = 'BUY'
             elif avg_signal < -0.3:
@@ -236,18 +481,36 @@ class HeadlessCryptoAPI:
                 'signal': signal,
                 'confidence': confidence,
                 'reasons': reasons,
-                'price': latest['price'],
-                'sma_7': latest['sma_7'],
-                'sma_25': latest['sma_25'],
-                'rsi': latest.get('rsi', None),
-                'volume': latest['volume'],
-                'volatility': latest['volatility']
+                'price': price,
+                'sma_7': sma_7,
+                'sma_25': sma_25,
+                'rsi': rsi,
+                'volume': volume,
+                'volatility': volatility
             }
             
         except Exception as e:
             logger.error(f"Error generating signals: {e}")
             return {'signal': 'HOLD', 'confidence': 0.0, 'reason': f'Error: {e}'}
     
+    @staticmethod
+    def _market_overview_rows(data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Build market overview rows from a /coins/markets response body
+        """
+        return [
+            {
+                'symbol': coin.get('symbol', '').upper(),
+                'name': coin.get('name'),
+                'price_usd': coin.get('current_price'),
+                'market_cap_usd': coin.get('market_cap'),
+                'volume_24h_usd': coin.get('total_volume'),
+                'price_change_24h_percent': coin.get('price_change_percentage_24h'),
+                'market_cap_rank': coin.get('market_cap_rank')
+            }
+            for coin in data
+        ]
+    
     def get_market_overview(self, limit: int = 10) -> List[Dict[str, Any]]:
         """
         Get market overview for top cryptocurrencies
@@ -265,22 +528,7 @@ class HeadlessCryptoAPI:
                 'price_change_percentage': '24h'
             }
             
-            response = requests.get(url, params=params, timeout=30)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            market_data = []
-            for coin in data:
-                market_data.append({
-                    'symbol': coin.get('symbol', '').upper(),
-                    'name': coin.get('name'),
-                    'price_usd': coin.get('current_price'),
-                    'market_cap_usd': coin.get('market_cap'),
-                    'volume_24h_usd': coin.get('total_volume'),
-                    'price_change_24h_percent': coin.get('price_change_percentage_24h'),
-                    'market_cap_rank': coin.get('market_cap_rank')
-                })
+            market_data = self._get_json(url, params, transform=self._market_overview_rows)
             
             logger.info(f"Successfully fetched market data for {len(market_data)} cryptocurrencies")
             return market_data
@@ -289,9 +537,13 @@ class HeadlessCryptoAPI:
             logger.error(f"Error fetching market overview: {e}")
             return []
     
-    def analyze_cryptocurrency(self, coin_id: str, days: int = 30, use_claude: bool = True) -> Dict[str, Any]:
+    def analyze_cryptocurrency(self, coin_id: str, days: int = 30, use_claude: bool = True,
+                               analysis_timestamp: Optional[str] = None) -> Dict[str, Any]:
         """
         Perform complete analysis of a cryptocurrency
+        
+        analysis_timestamp lets batch callers stamp every result with one
+        shared time; it defaults to the current time.
         """
         logger.info(f"Starting analysis for {coin_id}")
         
@@ -301,20 +553,22 @@ class HeadlessCryptoAPI:
             return {'error': f'Could not fetch data for {coin_id}'}
         
         # Calculate technical indicators
-        df = self.calculate_technical_indicators(df)
+        df = self.calculate_technical_indicators(df, cache_key=f"{coin_id}_{days}")
         
         # Generate signals
         signals = self.generate_signals(df)
         
         # Calculate additional statistics
-        latest_price = df['price'].iloc[-1]
-        price_change_24h = (latest_price - df['price'].iloc[-2]) / df['price'].iloc[-2] * 100
+        # Plain floats, so results serialize the same whatever the column dtype
+        latest_price = float(df['price'].iloc[-1])
+        previous_price = float(df['price'].iloc[-2])
+        price_change_24h = (latest_price - previous_price) / previous_price * 100
         
         volatility_7d = df['price_change'].tail(7).std() * np.sqrt(7) * 100
         
         result = {
             'coin_id': coin_id,
-            'analysis_timestamp': datetime.now().isoformat(),
+            'analysis_timestamp': analysis_timestamp or datetime.now().isoformat(),
             'price_data': {
                 'current_price': latest_price,
                 'price_change_24h_percent': price_change_24h,
@@ -333,14 +587,14 @@ class HeadlessCryptoAPI:
                 
                 # Prepare technical indicators for Claude
                 latest_data = df.iloc[-1]
-                tech_indicators = {
-                    'rsi': latest_data.get('rsi', None),
-                    'macd': latest_data.get('macd', None),
-                    'sma_7': latest_data.get('sma_7', None),
-                    'sma_25': latest_data.get('sma_25', None),
-                    'volatility': latest_data.get('volatility', None),
-                    'volume': latest_data.get('volume', None)
-                }
+                # Rounded to 4 decimals, with missing or NaN values dropped:
+                # shorter prompts, and analyses differing only in noise share
+                # the analyzer's memo entry
+                tech_indicators = {}
+                for name in ('rsi', 'macd', 'sma_7', 'sma_25', 'volatility', 'volume'):
+                    value = latest_data.get(name)
+                    if value is not None and not pd.isna(value):
+                        tech_indicators[name] = round(float(value), 4)
                 
                 ml_predictions = {
                     'signal': signals.get('signal', 'HOLD'),
@@ -367,17 +621,42 @@ class HeadlessCryptoAPI:
         
         return result
     
+    def analyze_many(self, coin_ids: List[str], days: int = 30,
+                     use_claude: bool = True) -> Dict[str, Dict[str, Any]]:
+        """
+        Analyze several cryptocurrencies concurrently
+        
+        Each coin is analyzed by analyze_cryptocurrency on a thread pool, so
+        their CoinGecko (and Claude) round-trips overlap. Duplicate ids are
+        analyzed once, and all results share one analysis_timestamp. Returns
+        the analysis per coin id, in input order.
+        """
+        unique_ids = list(dict.fromkeys(coin_ids))
+        if not unique_ids:
+            return {}
+        
+        analysis_timestamp = datetime.now().isoformat()
+        workers = min(len(unique_ids), MAX_FETCH_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            analyses = executor.map(
+                lambda coin_id: self.analyze_cryptocurrency(coin_id, days, use_claude, analysis_timestamp),
+                unique_ids
+            )
+            return dict(zip(unique_ids, analyses))
+    
     def _determine_trend(self, df: pd.DataFrame) -> str:
         """Determine market trend"""
-        if len(df) < 7:
+        if len(df) < TREND_WINDOW:
             return 'INSUFFICIENT_DATA'
         
-        recent_prices = df['price'].tail(7)
-        trend_slope = np.polyfit(range(len(recent_prices)), recent_prices, 1)[0]
+        # Least-squares slope over the last TREND_WINDOW points in closed form
+        recent_prices = df['price'].to_numpy(dtype=np.float64)[-TREND_WINDOW:]
+        trend_slope = np.dot(_TREND_X_CENTERED, recent_prices) / _TREND_X_DENOM
+        latest_price = recent_prices[-1]
         
-        if trend_slope > df['price'].iloc[-1] * 0.01:  # > 1% slope
+        if trend_slope > latest_price * 0.01:  # > 1% slope
             return 'BULLISH'
-        elif trend_slope < -df['price'].iloc[-1] * 0.01:  # < -1% slope
+        elif trend_slope < -latest_price * 0.01:  # < -1% slope
             return 'BEARISH'
         else:
             return 'SIDEWAYS'
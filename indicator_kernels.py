@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+Technical indicator kernels for LetsGetCrypto
+
+Single-pass recurrence implementations of the SMA, EMA, RSI and MACD
+indicators, compiled with Numba when it is installed. Each kernel takes a
+float64 NumPy array and returns an array of the same length, with NaN where
+the indicator window is not yet full. The formulas match the `ta` library
+(which itself uses pandas rolling/ewm), so results can be used as a drop-in
+fallback when `ta` is unavailable.
+"""
+
+from dataclasses import dataclass, fields
+from typing import Dict
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when Numba is not installed"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
+
+
+@njit(cache=True)
+def sma(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Simple moving average using a running window sum
+
+    Each step adds the newest value and drops the oldest, so the cost is
+    O(1) per element regardless of window size. A window containing NaN
+    yields NaN, matching pandas rolling(window).mean().
+    """
+    n = values.shape[0]
+    out = np.full(n, np.nan)
+    window_sum = 0.0
+    nan_count = 0
+
+    for i in range(n):
+        value = values[i]
+        if np.isnan(value):
+            nan_count += 1
+        else:
+            window_sum += value
+
+        if i >= window:
+            dropped = values[i - window]
+            if np.isnan(dropped):
+                nan_count -= 1
+            else:
+                window_sum -= dropped
+
+        if i >= window - 1 and nan_count == 0:
+            out[i] = window_sum / window
+
+    return out
+
+
+@njit(cache=True)
+def ewm_mean(values: np.ndarray, alpha: float, min_periods: int) -> np.ndarray:
+    """
+    Exponentially weighted mean with adjust=False semantics
+
+    Leading NaNs are skipped and the recursion starts at the first valid
+    value; later NaNs carry the previous average forward.
+    """
+    n = values.shape[0]
+    out = np.full(n, np.nan)
+    average = np.nan
+    count = 0
+
+    for i in range(n):
+        value = values[i]
+        if not np.isnan(value):
+            if count == 0:
+                average = value
+            else:
+                average = (1.0 - alpha) * average + alpha * value
+            count += 1
+
+        if count >= min_periods and count > 0:
+            out[i] = average
+
+    return out
+
+
+@njit(cache=True)
+def ema(values: np.ndarray, span: int) -> np.ndarray:
+    """Exponential moving average, equivalent to ewm(span, min_periods=span, adjust=False)"""
+    return ewm_mean(values, 2.0 / (span + 1.0), span)
+
+
+@njit(cache=True)
+def rsi(values: np.ndarray, window: int = 14) -> np.ndarray:
+    """Relative Strength Index using Wilder smoothing (alpha = 1 / window)"""
+    n = values.shape[0]
+    gains = np.zeros(n)
+    losses = np.zeros(n)
+
+    for i in range(1, n):
+        change = values[i] - values[i - 1]
+        if change > 0:
+            gains[i] = change
+        elif change < 0:
+            losses[i] = -change
+
+    alpha = 1.0 / window
+    avg_gain = ewm_mean(gains, alpha, window)
+    avg_loss = ewm_mean(losses, alpha, window)
+
+    out = np.full(n, np.nan)
+    for i in range(n):
+        if avg_loss[i] == 0.0:
+            out[i] = 100.0
+        elif not np.isnan(avg_gain[i]) and not np.isnan(avg_loss[i]):
+            out[i] = 100.0 - 100.0 / (1.0 + avg_gain[i] / avg_loss[i])
+
+    return out
+
+
+@njit(cache=True)
+def macd_diff(values: np.ndarray, window_slow: int = 26,
+              window_fast: int = 12, window_sign: int = 9) -> np.ndarray:
+    """MACD histogram: MACD line minus its signal line"""
+    macd_line = ema(values, window_fast) - ema(values, window_slow)
+    return macd_line - ema(macd_line, window_sign)
+
+
+@njit(cache=True)
+def macd_signal(values: np.ndarray, window_slow: int = 26,
+                window_fast: int = 12, window_sign: int = 9) -> np.ndarray:
+    """MACD signal line: EMA of the MACD line"""
+    return ema(ema(values, window_fast) - ema(values, window_slow), window_sign)
+
+
+# Conditions reported by signal_vote, as bit flags
+SIGNAL_SMA_BULLISH = 1
+SIGNAL_RSI_OVERSOLD = 2
+SIGNAL_RSI_OVERBOUGHT = 4
+SIGNAL_HIGH_VOLUME = 8
+SIGNAL_HIGH_VOLATILITY = 16
+
+
+@njit(cache=True)
+def signal_vote(sma_7: float, sma_25: float, rsi_value: float, has_rsi: bool,
+                volume: float, volume_sma: float, has_volume_sma: bool,
+                volatility: float, volatility_p80: float) -> tuple:
+    """
+    Combine the latest indicator values into an average trading vote
+
+    Each rule votes +1 (buy), -1 (sell) or 0 (hold): SMA crossover, RSI
+    oversold/overbought, high volume and high volatility. NaN inputs
+    compare false, so they count as the neutral or bearish branch.
+    Returns (average vote, bit flags of the conditions that fired).
+    """
+    flags = 0
+    if sma_7 > sma_25:
+        total = 1.0
+        flags |= SIGNAL_SMA_BULLISH
+    else:
+        total = -1.0
+    count = 1
+
+    if has_rsi:
+        if rsi_value < 30:
+            total += 1.0
+            flags |= SIGNAL_RSI_OVERSOLD
+        elif rsi_value > 70:
+            total -= 1.0
+            flags |= SIGNAL_RSI_OVERBOUGHT
+        count += 1
+
+    if has_volume_sma and volume > volume_sma * 1.5:
+        total += 1.0
+        flags |= SIGNAL_HIGH_VOLUME
+        count += 1
+
+    if volatility > volatility_p80:
+        flags |= SIGNAL_HIGH_VOLATILITY
+        count += 1
+
+    return total / count, flags
+
+
+def pct_change(values: np.ndarray) -> np.ndarray:
+    """Fractional change from the previous element, NaN for the first"""
+    out = np.empty_like(values)
+    out[:1] = np.nan
+    np.divide(values[1:] - values[:-1], values[:-1], out=out[1:])
+    return out
+
+
+def rolling_std(values: np.ndarray, window: int, ddof: int = 1) -> np.ndarray:
+    """
+    Rolling standard deviation over a fixed window
+
+    Computed on a strided view of all windows at once, so it runs as a
+    single vectorized NumPy reduction. A window containing NaN yields NaN,
+    matching pandas rolling(window).std().
+    """
+    out = np.full(values.shape[0], np.nan)
+    if values.shape[0] >= window:
+        windows = np.lib.stride_tricks.sliding_window_view(values, window)
+        out[window - 1:] = windows.std(axis=1, ddof=ddof)
+    return out
+
+
+def _prefix_sums(values: np.ndarray) -> tuple:
+    """Cumulative sums of values (NaN as 0) and of NaN counts, each with a leading 0"""
+    n = values.shape[0]
+    missing = np.isnan(values)
+    sums = np.zeros(n + 1)
+    np.cumsum(np.where(missing, 0.0, values), out=sums[1:])
+    nan_counts = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(missing, out=nan_counts[1:])
+    return sums, nan_counts
+
+
+def _window_sums(prefix: tuple, window: int) -> np.ndarray:
+    """Rolling window sums from _prefix_sums output, NaN for windows containing NaN"""
+    sums, nan_counts = prefix
+    out = np.full(sums.shape[0] - 1, np.nan)
+    if out.shape[0] >= window:
+        clean = (nan_counts[window:] - nan_counts[:-window]) == 0
+        out[window - 1:] = np.where(clean, sums[window:] - sums[:-window], np.nan)
+    return out
+
+
+def sma_many(values: np.ndarray, windows: tuple) -> tuple:
+    """
+    Simple moving averages for several windows from one prefix sum
+
+    The cumulative sum is taken once and each window's average is the
+    difference of two shifted slices of it, so adding a window costs one
+    subtraction rather than another pass over the prices. NaN handling
+    matches sma(): a window containing NaN yields NaN.
+    """
+    prefix = _prefix_sums(values)
+    return tuple(_window_sums(prefix, window) / window for window in windows)
+
+
+def rolling_sum(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Rolling sum over a fixed window, as the difference of two prefix sums
+
+    A window containing NaN yields NaN, matching pandas rolling(window).sum().
+    """
+    return _window_sums(_prefix_sums(values), window)
+
+
+def vwap(prices: np.ndarray, volumes: np.ndarray, window: int = 14) -> np.ndarray:
+    """
+    Rolling volume-weighted average price
+
+    Sum of price * volume over the window divided by the window's total
+    volume. Equals the `ta` library's VolumeWeightedAveragePrice when high,
+    low and close are all the same price series.
+    """
+    return rolling_sum(prices * volumes, window) / rolling_sum(volumes, window)
+
+
+def bollinger_bands(values: np.ndarray, window: int = 20, window_dev: float = 2.0) -> tuple:
+    """
+    Bollinger Bands as (middle, high, low) arrays
+
+    Uses the population standard deviation (ddof=0), matching the `ta`
+    library's BollingerBands.
+    """
+    middle = sma(values, window)
+    deviation = window_dev * rolling_std(values, window, ddof=0)
+    return middle, middle + deviation, middle - deviation
+
+
+@dataclass
+class BasicIndicators:
+    """
+    Core indicator series for one price history
+
+    Each field is a separate contiguous float64 array aligned with the input
+    prices, so the indicators are computed and consumed as plain arrays and
+    only turned into DataFrame columns at the API boundary.
+    """
+    sma_7: np.ndarray
+    sma_25: np.ndarray
+    price_change: np.ndarray
+    volatility: np.ndarray
+
+    @classmethod
+    def compute(cls, prices: np.ndarray) -> 'BasicIndicators':
+        """Compute every core indicator from a float64 price array"""
+        price_change = pct_change(prices)
+        return cls(
+            sma_7=sma(prices, 7),
+            sma_25=sma(prices, 25),
+            price_change=price_change,
+            volatility=rolling_std(price_change, 7),
+        )
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        """Indicator arrays keyed by DataFrame column name"""
+        return {field.name: getattr(self, field.name) for field in fields(self)}
+
+
+def warmup() -> None:
+    """
+    Compile every kernel ahead of first use
+
+    With Numba installed the first call to each kernel pays the JIT cost;
+    running them once on a small array moves that cost to startup.
+    """
+    dummy = np.linspace(1.0, 2.0, 32)
+    sma(dummy, 7)
+    ema(dummy, 12)
+    rsi(dummy, 14)
+    macd_diff(dummy, 26, 12, 9)
+    macd_signal(dummy, 26, 12, 9)
+    signal_vote(1.0, 2.0, 50.0, True, 1.0, 1.0, True, 0.1, 0.2)
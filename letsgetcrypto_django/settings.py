@@ -44,6 +44,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'django.middleware.gzip.GZipMiddleware',  # Compress JSON list responses (skips bodies under 200 bytes)
     'corsheaders.middleware.CorsMiddleware',  # CORS middleware (must be before CommonMiddleware)
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -80,13 +81,24 @@ WSGI_APPLICATION = 'letsgetcrypto_django.wsgi.application'
 if os.environ.get('DATABASE_URL'):
     # Production database (PostgreSQL on AWS RDS)
     import dj_database_url
+
+    # Behind pgbouncer in transaction pooling mode the pooler owns the
+    # connections, so Django must close its own after every request and
+    # cannot rely on server-side cursors
+    DB_USE_PGBOUNCER = os.environ.get('DB_USE_PGBOUNCER', 'False').lower() == 'true'
     DATABASES = {
         'default': dj_database_url.config(
             default=os.environ['DATABASE_URL'],
-            conn_max_age=600,
+            conn_max_age=0 if DB_USE_PGBOUNCER else int(os.environ.get('DB_CONN_MAX_AGE', 600)),
             conn_health_checks=True,
         )
     }
+    # connect_timeout is a psycopg/mysqlclient option; sqlite rejects it
+    if DATABASES['default']['ENGINE'].rsplit('.', 1)[-1] in ('postgresql', 'mysql'):
+        DATABASES['default'].setdefault('OPTIONS', {})['connect_timeout'] = int(
+            os.environ.get('DB_CONNECT_TIMEOUT', 2)
+        )
+    DATABASES['default']['DISABLE_SERVER_SIDE_CURSORS'] = DB_USE_PGBOUNCER
 else:
     # Development database (SQLite)
     DATABASES = {
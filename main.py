@@ -30,11 +30,16 @@ Author: Advanced Crypto Trading Tool
 import sys
 import os
 import json
+import asyncio
 import time
 import logging
 import threading
 import traceback
-from datetime import datetime, timedelta
+import functools
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
 from typing import Dict, List, Optional, Tuple, Any
 import warnings
 warnings.filterwarnings('ignore')
@@ -43,16 +48,25 @@ warnings.filterwarnings('ignore')
 import pandas as pd
 import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from retrying import retry
 import schedule
 
+# Fast JSON parsing for API responses (optional)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # GUI libraries
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, 
                             QWidget, QPushButton, QLabel, QComboBox, QLineEdit, 
                             QTextEdit, QCheckBox, QSpinBox, QDoubleSpinBox,
                             QTabWidget, QGridLayout, QGroupBox, QMessageBox,
                             QProgressBar, QSplitter, QTableWidget, QTableWidgetItem, QDialog)
-from PyQt5.QtCore import QThread, pyqtSignal, QTimer, Qt
+from PyQt5.QtCore import QThread, pyqtSignal, QTimer, Qt, QEvent
 from PyQt5.QtGui import QFont, QPixmap
 
 # Plotting
@@ -63,6 +77,13 @@ import seaborn as sns
 
 # Trading and crypto libraries
 import ccxt
+try:
+    import ccxt.pro as ccxtpro
+    CCXT_PRO_AVAILABLE = True
+except ImportError:
+    ccxtpro = None
+    CCXT_PRO_AVAILABLE = False
+
 try:
     from bitcoinlib import wallets, keys
 except ImportError:
@@ -92,7 +113,7 @@ except ImportError:
     TENSORFLOW_AVAILABLE = False
 
 # Technical indicators
-import ta
+import indicator_kernels
 
 # Logging setup
 from loguru import logger
@@ -109,6 +130,71 @@ except ImportError:
 # Configure logging
 logger.add("crypto_trading.log", rotation="1 week", retention="4 weeks", level="INFO")
 
+# Feature rows queued before MLModels.queue_prediction flushes a batch
+PREDICTION_BATCH_SIZE = 64
+
+# Ensemble weight of each model's up probability, and the column layout of
+# MLModels.ensemble_out (one row per symbol)
+ENSEMBLE_WEIGHTS = {'logistic': 0.3, 'xgboost': 0.5, 'lstm': 0.2}
+ENSEMBLE_COLUMNS = ('logistic', 'xgboost', 'lstm', 'ensemble')
+
+# Seconds a fetched exchange balance is trusted before TradingEngine refetches it
+BALANCE_CACHE_TTL = 30
+
+# Columns of TradingEngine.trade_log; signal stores an index into TRADE_SIGNALS
+TRADE_SIGNALS = ('BUY', 'SELL', 'HOLD')
+TRADE_LOG_DTYPE = np.dtype([
+    ('timestamp', 'datetime64[us]'),
+    ('price', 'f8'),
+    ('amount', 'f8'),
+    ('signal', 'u1'),
+    ('simulated', '?'),
+    ('symbol', 'O'),
+    ('order_id', 'O'),
+    ('status', 'O')
+])
+
+# Oldest streamed ticker price (seconds) TradingEngine trades on before
+# falling back to a REST fetch_ticker, and the wait before a failed ticker
+# stream reconnects
+PRICE_STREAM_MAX_AGE = 5
+PRICE_STREAM_RETRY_DELAY = 5
+
+# Seconds TradingEngine.close waits for the ticker streams to shut down
+PRICE_STREAM_CLOSE_TIMEOUT = 5
+
+# Exchange trading pair for each CoinGecko coin id offered in the GUI; other
+# coins fall back to the first three letters of the id against USDT
+SYMBOL_MAP = {
+    'bitcoin': 'BTC/USDT',
+    'ethereum': 'ETH/USDT',
+    'binancecoin': 'BNB/USDT',
+    'cardano': 'ADA/USDT',
+    'solana': 'SOL/USDT'
+}
+
+# BackgroundTask slot shared by training, predictions and feedback loop
+# cycles: they all use MLModels' features, split cache and Keras graph, so
+# only one of them may run at a time
+MODEL_TASK = 'model work'
+
+# Trades appended to the GUI history table between column resizes
+TRADE_TABLE_RESIZE_INTERVAL = 50
+
+# Set PERF_PROFILE=1 to time the hot paths (trades, data refresh, charts,
+# training, predictions); each section logs its P50/P99 latency every
+# PERF_REPORT_INTERVAL calls, and all sections are summarized on exit
+PERF_PROFILE = os.environ.get('PERF_PROFILE', '').lower() in ('1', 'true', 'yes')
+PERF_REPORT_INTERVAL = 50
+
+# Keep-alive connections per host in the HTTP session shared by the data
+# fetcher, the exchange client and the GUI
+HTTP_POOL_SIZE = 16
+
+# Concurrent requests used by DataFetcher.fetch_many; stays within
+# HTTP_POOL_SIZE so no connection is opened and then discarded
+MAX_FETCH_WORKERS = 10
+
 class APIError(Exception):
     """Custom exception for API-related errors"""
     pass
@@ -121,14 +207,102 @@ class WalletError(Exception):
     """Custom exception for wallet-related errors"""
     pass
 
+class LatencyProfiler:
+    """
+    Records wall-clock latencies of named code sections
+    
+    When disabled, timed() returns a shared no-op context and profiled()
+    returns the function unchanged, so instrumented code costs nothing.
+    """
+    
+    def __init__(self, enabled: bool, report_interval: int = PERF_REPORT_INTERVAL):
+        self.enabled = enabled
+        self.report_interval = report_interval
+        self.samples = {}  # Section name -> deque of recent latencies in ns
+        self.counts = {}   # Section name -> total calls recorded
+        self.lock = threading.Lock()
+    
+    def timed(self, name: str):
+        """Context manager timing the enclosed block as section name"""
+        if not self.enabled:
+            return nullcontext()
+        return self._timed(name)
+    
+    @contextmanager
+    def _timed(self, name: str):
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter_ns() - start)
+    
+    def profiled(self, name: str):
+        """Decorator timing every call of the function as section name"""
+        def decorator(func):
+            if not self.enabled:
+                return func
+            
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self._timed(name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+    
+    def record(self, name: str, elapsed_ns: int) -> None:
+        """Add one latency sample, logging the section summary every report_interval calls"""
+        with self.lock:
+            samples = self.samples.get(name)
+            if samples is None:
+                samples = self.samples[name] = deque(maxlen=1000)
+            samples.append(elapsed_ns)
+            count = self.counts[name] = self.counts.get(name, 0) + 1
+            due = count % self.report_interval == 0
+        if due:
+            self.report(name)
+    
+    def report(self, name: Optional[str] = None) -> None:
+        """
+        Log P50/P99 latencies over the most recent samples
+        
+        Args:
+            name: Section to report, or None for every section
+        """
+        with self.lock:
+            names = [name] if name is not None else sorted(self.samples)
+            snapshot = [(n, self.counts[n], np.array(self.samples[n])) for n in names]
+        
+        for section, count, samples in snapshot:
+            p50, p99 = np.percentile(samples, [50, 99]) / 1e6
+            logger.info(f"[perf] {section}: calls={count} p50={p50:.2f}ms p99={p99:.2f}ms")
+
+# Shared profiler for the instrumented hot paths
+perf = LatencyProfiler(PERF_PROFILE)
+
+def create_http_session() -> requests.Session:
+    """
+    Create a pooled HTTP session to share between API clients
+    
+    Connections are kept alive and reused across calls, so only the first
+    request to each host pays for the TLS handshake. Failed connections and
+    GET requests are retried with a short backoff; orders are never resent.
+    """
+    session = requests.Session()
+    retries = Retry(total=3, backoff_factor=0.1, allowed_methods=['GET'])
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE,
+                          max_retries=retries)
+    session.mount('https://', adapter)
+    return session
+
 class DataFetcher:
     """Handles data fetching from multiple cryptocurrency APIs"""
     
-    def __init__(self):
-        self.session = requests.Session()
+    def __init__(self, session: Optional[requests.Session] = None):
+        self.session = session if session is not None else create_http_session()
         self.session.headers.update({
             'User-Agent': 'CryptoTradingTool/1.0'
         })
+        self.rng = np.random.default_rng()  # Source for the simulated sentiment scores
         
     @retry(stop_max_attempt_number=3, wait_fixed=2000)
     def fetch_coingecko_data(self, coin_id: str, days: int = 30) -> Optional[pd.DataFrame]:
@@ -155,18 +329,19 @@ class DataFetcher:
             
             response = self.session.get(url, params=params, timeout=30)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content) if ORJSON_AVAILABLE else response.json()
             
-            # Convert to DataFrame
-            df = pd.DataFrame({
-                'timestamp': [x[0] for x in data['prices']],
-                'price': [x[1] for x in data['prices']],
-                'volume': [x[1] for x in data['total_volumes']],
-                'market_cap': [x[1] for x in data['market_caps']]
-            })
+            # Convert to DataFrame: each [timestamp, value] list becomes one
+            # (n, 2) float64 array, so columns are sliced instead of looped
+            prices = np.asarray(data['prices'], dtype=np.float64).reshape(-1, 2)
+            volumes = np.asarray(data['total_volumes'], dtype=np.float64).reshape(-1, 2)
+            market_caps = np.asarray(data['market_caps'], dtype=np.float64).reshape(-1, 2)
             
-            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-            df.set_index('timestamp', inplace=True)
+            df = pd.DataFrame({
+                'price': prices[:, 1],
+                'volume': volumes[:, 1],
+                'market_cap': market_caps[:, 1]
+            }, index=pd.to_datetime(prices[:, 0].astype(np.int64), unit='ms').rename('timestamp'))
             
             logger.success(f"Successfully fetched {len(df)} records from CoinGecko")
             return df
@@ -175,6 +350,36 @@ class DataFetcher:
             logger.error(f"Error fetching CoinGecko data: {e}")
             raise APIError(f"CoinGecko API error: {e}")
     
+    def fetch_many(self, coin_ids: List[str], days: int = 30) -> Dict[str, Optional[pd.DataFrame]]:
+        """
+        Fetch CoinGecko price data for several coins concurrently
+        
+        Requests run on a thread pool sharing this fetcher's session, so the
+        total wall time is roughly that of the slowest coin rather than the
+        sum of all of them.
+        
+        Args:
+            coin_ids: CoinGecko coin identifiers
+            days: Number of days of historical data
+            
+        Returns:
+            Dictionary mapping each coin id to its DataFrame, or None if the
+            fetch failed
+        """
+        def fetch(coin_id: str) -> Optional[pd.DataFrame]:
+            try:
+                return self.fetch_coingecko_data(coin_id, days)
+            except Exception as e:
+                logger.error(f"Error fetching {coin_id}: {e}")
+                return None
+        
+        if not coin_ids:
+            return {}
+        
+        workers = min(len(coin_ids), MAX_FETCH_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return dict(zip(coin_ids, executor.map(fetch, coin_ids)))
+    
     @retry(stop_max_attempt_number=3, wait_fixed=2000)
     def fetch_fear_greed_index(self) -> Optional[Dict]:
         """
@@ -189,7 +394,7 @@ class DataFetcher:
             url = "https://api.alternative.me/fng/"
             response = self.session.get(url, timeout=30)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content) if ORJSON_AVAILABLE else response.json()
             
             if 'data' in data and len(data['data']) > 0:
                 current = data['data'][0]
@@ -220,19 +425,12 @@ class DataFetcher:
         try:
             logger.info(f"Simulating news sentiment for {coin_name}")
             
-            # Simulate sentiment analysis with some randomness
-            import random
-            random.seed(int(time.time()) % 1000)
+            # Simulate sentiment analysis with some randomness: draw the
+            # positive/negative/neutral scores together and normalize them
+            scores = self.rng.uniform([0.1, 0.1, 0.3], [0.6, 0.4, 0.7])
+            scores /= scores.sum()
             
-            sentiment = {
-                'positive': random.uniform(0.1, 0.6),
-                'negative': random.uniform(0.1, 0.4),
-                'neutral': random.uniform(0.3, 0.7)
-            }
-            
-            # Normalize scores
-            total = sum(sentiment.values())
-            sentiment = {k: v/total for k, v in sentiment.items()}
+            sentiment = dict(zip(('positive', 'negative', 'neutral'), scores.tolist()))
             
             logger.info(f"News sentiment: {sentiment}")
             return sentiment
@@ -258,10 +456,14 @@ class DataFetcher:
             hour = datetime.now().hour
             base_sentiment = 0.5 + 0.2 * np.sin(hour * np.pi / 12)
             
+            bullish, bearish = np.clip(
+                np.array([base_sentiment, 1 - base_sentiment]) + self.rng.normal(0, 0.1, 2), 0.1, 0.8
+            ).tolist()
+            
             sentiment = {
-                'bullish': max(0.1, min(0.8, base_sentiment + np.random.normal(0, 0.1))),
-                'bearish': max(0.1, min(0.8, (1 - base_sentiment) + np.random.normal(0, 0.1))),
-                'volume': np.random.randint(100, 1000)
+                'bullish': bullish,
+                'bearish': bearish,
+                'volume': int(self.rng.integers(100, 1000))
             }
             
             logger.info(f"Social sentiment: {sentiment}")
@@ -288,53 +490,60 @@ class TechnicalIndicators:
         try:
             logger.info("Calculating technical indicators")
             
-            # Make a copy to avoid modifying original
-            df = df.copy()
+            # Indicators are collected as plain arrays and assembled into a
+            # new frame once at the end, leaving the input frame untouched
+            cols = {c: df[c].to_numpy() for c in df.columns}
+            price = df['price']
+            
+            # Price indicators run on the raw float64 array through the
+            # compiled indicator_kernels, which match the `ta` formulas
+            prices = price.to_numpy(dtype=np.float64)
             
             # Simple Moving Averages
-            df['sma_7'] = ta.trend.sma_indicator(df['price'], window=7)
-            df['sma_25'] = ta.trend.sma_indicator(df['price'], window=25)
-            df['sma_99'] = ta.trend.sma_indicator(df['price'], window=99)
+            cols['sma_7'], cols['sma_25'], cols['sma_99'] = indicator_kernels.sma_many(prices, (7, 25, 99))
             
             # Exponential Moving Averages
-            df['ema_12'] = ta.trend.ema_indicator(df['price'], window=12)
-            df['ema_26'] = ta.trend.ema_indicator(df['price'], window=26)
+            cols['ema_12'] = indicator_kernels.ema(prices, 12)
+            cols['ema_26'] = indicator_kernels.ema(prices, 26)
             
             # MACD
-            df['macd'] = ta.trend.macd_diff(df['price'])
-            df['macd_signal'] = ta.trend.macd_signal(df['price'])
+            cols['macd'] = indicator_kernels.macd_diff(prices, 26, 12, 9)
+            cols['macd_signal'] = indicator_kernels.macd_signal(prices, 26, 12, 9)
             
             # RSI
-            df['rsi'] = ta.momentum.rsi(df['price'], window=14)
+            cols['rsi'] = indicator_kernels.rsi(prices, 14)
             
             # Bollinger Bands
-            df['bb_high'] = ta.volatility.bollinger_hband(df['price'])
-            df['bb_low'] = ta.volatility.bollinger_lband(df['price'])
-            df['bb_middle'] = ta.volatility.bollinger_mavg(df['price'])
+            bb_middle, bb_high, bb_low = indicator_kernels.bollinger_bands(prices, 20, 2.0)
+            cols['bb_high'] = bb_high
+            cols['bb_low'] = bb_low
+            cols['bb_middle'] = bb_middle
             
             # Volatility
-            df['volatility'] = df['price'].rolling(window=24).std()
+            cols['volatility'] = indicator_kernels.rolling_std(prices, 24)
             
             # Volume indicators (if volume data available)
             if 'volume' in df.columns:
                 # Simple moving average of volume (ta.volume.volume_sma doesn't exist, use pandas rolling)
-                df['volume_sma'] = df['volume'].rolling(window=20).mean()
+                cols['volume_sma'] = df['volume'].rolling(window=20).mean().to_numpy()
                 # VWAP approximation using single price point (CoinGecko data lacks OHLC: high, low, close)
-                df['vwap'] = ta.volume.volume_weighted_average_price(df['price'], df['price'], df['price'], df['volume'], window=14)
+                cols['vwap'] = indicator_kernels.vwap(prices, df['volume'].to_numpy(dtype=np.float64), 14)
             
             # Price change features
-            df['price_change'] = df['price'].pct_change()
-            df['price_change_1h'] = df['price'].pct_change(periods=1)
-            df['price_change_24h'] = df['price'].pct_change(periods=24)
+            cols['price_change'] = price.pct_change().to_numpy()
+            cols['price_change_1h'] = price.pct_change(periods=1).to_numpy()
+            cols['price_change_24h'] = price.pct_change(periods=24).to_numpy()
             
             # Quarter-end flag (important for institutional trading)
-            df['quarter_end'] = df.index.to_series().apply(
-                lambda x: 1 if x.month in [3, 6, 9, 12] and x.day >= 28 else 0
-            )
+            cols['quarter_end'] = (
+                np.isin(df.index.month, [3, 6, 9, 12]) & (df.index.day >= 28)
+            ).astype(np.int64)
             
             # Support and resistance levels
-            df['support'] = df['price'].rolling(window=48, center=True).min()
-            df['resistance'] = df['price'].rolling(window=48, center=True).max()
+            cols['support'] = price.rolling(window=48, center=True).min().to_numpy()
+            cols['resistance'] = price.rolling(window=48, center=True).max().to_numpy()
+            
+            df = pd.DataFrame(cols, index=df.index, copy=False)
             
             logger.success(f"Added technical indicators to {len(df)} records")
             return df
@@ -352,6 +561,12 @@ class MLModels:
         self.feature_columns = []
         self.performance_history = []  # Track model performance over time
         self.model_versions = {}  # Track different model versions
+        self.logistic_weights = None  # (weights, intercept) of the scaler-folded logistic model
+        self.pending_predictions = []  # Feature rows queued for flush_predictions
+        self.split_cache = None  # (X, y, split) of the last train/test split
+        self.lstm_graph = None  # (sequence_length, model, initial weights, predict function)
+        self.symbol_rows = {}  # Symbol -> row of ensemble_out
+        self.ensemble_out = np.empty((0, len(ENSEMBLE_COLUMNS)), dtype=np.float32)
         
     def prepare_features(self, df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
         """
@@ -373,9 +588,18 @@ class MLModels:
             feature_cols = [col for col in feature_cols if df[col].notna().sum() > len(df) * 0.5]
             
             self.feature_columns = feature_cols
-            
-            # Prepare features
-            X = df[feature_cols].fillna(method='ffill').fillna(0)
+            self.split_cache = None
+            
+            # Prepare features: forward-fill each column in one pass by
+            # carrying the row index of the last non-NaN value down, then
+            # zero whatever is still missing (leading NaNs). Features are
+            # float32, the precision XGBoost works in internally, which
+            # halves the matrix the scaler and models read
+            X = df[feature_cols].to_numpy(dtype=np.float32)
+            last_valid = np.where(np.isnan(X), 0, np.arange(X.shape[0])[:, None])
+            np.maximum.accumulate(last_valid, axis=0, out=last_valid)
+            X = X[last_valid, np.arange(X.shape[1])]
+            X[np.isnan(X)] = 0.0
             
             # Create target: 1 if price goes up in next period, 0 otherwise
             df['price_next'] = df['price'].shift(-1)
@@ -388,12 +612,27 @@ class MLModels:
             y = y[:-1]
             
             logger.success(f"Prepared {X.shape[0]} samples with {X.shape[1]} features")
-            return X.values, y.values
+            return X, y.values
             
         except Exception as e:
             logger.error(f"Error preparing features: {e}")
             raise
     
+    def _split(self, X: np.ndarray, y: np.ndarray) -> List[np.ndarray]:
+        """
+        Train/test split shared by the models trained on the same features
+        
+        The split for the most recent (X, y) pair is reused, so training the
+        logistic and XGBoost models on one feature set shuffles and copies
+        the data once. Holding X and y keeps the identity check valid.
+        """
+        if self.split_cache is not None and self.split_cache[0] is X and self.split_cache[1] is y:
+            return self.split_cache[2]
+        
+        split = train_test_split(X, y, test_size=0.2, random_state=42)
+        self.split_cache = (X, y, split)
+        return split
+    
     def train_logistic_regression(self, X: np.ndarray, y: np.ndarray) -> float:
         """
         Train Logistic Regression model
@@ -409,7 +648,7 @@ class MLModels:
             logger.info("Training Logistic Regression model")
             
             # Split data
-            X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+            X_train, X_test, y_train, y_test = self._split(X, y)
             
             # Scale features
             scaler = StandardScaler()
@@ -428,6 +667,14 @@ class MLModels:
             self.models['logistic'] = model
             self.scalers['logistic'] = scaler
             
+            # Fold the scaler into the linear model for inference:
+            # coef . (x - mean) / scale + b == x . (coef / scale) + (b - coef . mean / scale)
+            weights = model.coef_[0] / scaler.scale_
+            self.logistic_weights = (
+                weights.astype(np.float32),
+                np.float32(model.intercept_[0] - weights @ scaler.mean_)
+            )
+            
             logger.success(f"Logistic Regression accuracy: {accuracy:.4f}")
             return accuracy
             
@@ -450,7 +697,7 @@ class MLModels:
             logger.info("Training XGBoost model")
             
             # Split data
-            X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+            X_train, X_test, y_train, y_test = self._split(X, y)
             
             # Check for GPU availability by attempting a small test fit
             gpu_available = False
@@ -458,42 +705,44 @@ class MLModels:
                 # Create a minimal test dataset
                 X_test_gpu = np.array([[1, 2], [3, 4]])
                 y_test_gpu = np.array([0, 1])
-                test_model = xgb.XGBClassifier(tree_method='gpu_hist', gpu_id=0, n_estimators=1)
+                test_model = xgb.XGBClassifier(tree_method='hist', device='cuda', n_estimators=1)
                 test_model.fit(X_test_gpu, y_test_gpu)
-                gpu_available = True
-                logger.info("GPU is available for XGBoost")
+                # Without a usable GPU XGBoost falls back to the CPU with a
+                # warning instead of raising, so check the device it settled on
+                config = json.loads(test_model.get_booster().save_config())
+                gpu_available = config['learner']['generic_param']['device'].startswith('cuda')
+                if gpu_available:
+                    logger.info("GPU is available for XGBoost")
+                else:
+                    logger.info("GPU not available, will use CPU for XGBoost")
             except Exception as e:
                 logger.info(f"GPU not available, will use CPU for XGBoost: {type(e).__name__}")
             
-            # Create model with appropriate tree_method
+            # The histogram tree method runs on either device
+            params = {
+                'objective': 'binary:logistic',
+                'max_depth': 6,
+                'eta': 0.1,
+                'seed': 42,
+                'tree_method': 'hist',
+                'device': 'cuda' if gpu_available else 'cpu'
+            }
             if gpu_available:
-                model = xgb.XGBClassifier(
-                    tree_method='gpu_hist',
-                    gpu_id=0,
-                    n_estimators=100,
-                    max_depth=6,
-                    learning_rate=0.1,
-                    random_state=42
-                )
                 logger.info("Using GPU acceleration for XGBoost")
             else:
-                model = xgb.XGBClassifier(
-                    n_estimators=100,
-                    max_depth=6,
-                    learning_rate=0.1,
-                    random_state=42
-                )
                 logger.info("Using CPU for XGBoost")
             
-            # Train model
-            model.fit(X_train, y_train)
+            # Train through the native API on a pre-binned QuantileDMatrix,
+            # so feature quantiles are sketched once up front
+            dtrain = xgb.QuantileDMatrix(X_train, y_train, max_bin=256)
+            booster = xgb.train(params, dtrain, num_boost_round=100)
             
             # Evaluate
-            y_pred = model.predict(X_test)
+            y_pred = (booster.predict(xgb.DMatrix(X_test)) > 0.5).astype(int)
             accuracy = accuracy_score(y_test, y_pred)
             
             # Store model
-            self.models['xgboost'] = model
+            self.models['xgboost'] = booster
             
             logger.success(f"XGBoost accuracy: {accuracy:.4f}")
             return accuracy
@@ -523,6 +772,8 @@ class MLModels:
             # Check for GPU
             if tf.config.list_physical_devices('GPU'):
                 logger.info("Using GPU acceleration for LSTM")
+                # Run layer math in float16 on the GPU's tensor cores; variables stay float32
+                keras.mixed_precision.set_global_policy('mixed_float16')
             else:
                 logger.info("Using CPU for LSTM")
             
@@ -533,31 +784,47 @@ class MLModels:
             scaler = MinMaxScaler()
             prices_scaled = scaler.fit_transform(prices)
             
-            # Create sequences
-            X, y = [], []
-            for i in range(sequence_length, len(prices_scaled)):
-                X.append(prices_scaled[i-sequence_length:i, 0])
-                y.append(prices_scaled[i, 0])
-            
-            X, y = np.array(X), np.array(y)
-            X = X.reshape((X.shape[0], X.shape[1], 1))
+            # Create sequences as a strided view over the scaled prices: row i
+            # holds the sequence_length values preceding target y[i]
+            flat = prices_scaled.ravel()
+            windows = np.lib.stride_tricks.sliding_window_view(flat, sequence_length)
+            X = windows[:-1, :, None]
+            y = flat[sequence_length:]
             
             # Split data
             split_index = int(0.8 * len(X))
             X_train, X_test = X[:split_index], X[split_index:]
             y_train, y_test = y[:split_index], y[split_index:]
             
-            # Build LSTM model
-            model = Sequential([
-                LSTM(50, return_sequences=True, input_shape=(sequence_length, 1)),
-                Dropout(0.2),
-                LSTM(50, return_sequences=False),
-                Dropout(0.2),
-                Dense(25),
-                Dense(1)
-            ])
-            
-            model.compile(optimizer=Adam(learning_rate=0.001), loss='mean_squared_error')
+            # Build the LSTM graph once per sequence length; retrains restore
+            # its initial weights and compile it with a fresh optimizer instead
+            # of constructing a new model
+            if self.lstm_graph is None or self.lstm_graph[0] != sequence_length:
+                model = Sequential([
+                    LSTM(50, return_sequences=True, input_shape=(sequence_length, 1)),
+                    Dropout(0.2),
+                    LSTM(50, return_sequences=False),
+                    Dropout(0.2),
+                    Dense(25),
+                    Dense(1, dtype='float32')  # Keep the regression output in float32 for a stable loss
+                ])
+                
+                self._compile_lstm(model)
+                
+                # Inference entry point, traced once for any batch size
+                predict = tf.function(
+                    lambda x: model(x, training=False),
+                    input_signature=[tf.TensorSpec([None, sequence_length, 1], tf.float32)],
+                    jit_compile=True
+                )
+                self.lstm_graph = (sequence_length, model, model.get_weights(), predict)
+            else:
+                _, model, initial_weights, predict = self.lstm_graph
+                model.set_weights(initial_weights)
+                # A new Adam starts from zero moments and step count with its
+                # own learning rate (and loss scale under mixed precision);
+                # zeroing the old optimizer's variables would zero those too
+                self._compile_lstm(model)
             
             # Train model
             history = model.fit(X_train, y_train, batch_size=32, epochs=50, 
@@ -568,7 +835,7 @@ class MLModels:
             self.scalers['lstm'] = scaler
             
             # Calculate a simple accuracy metric
-            y_pred = model.predict(X_test)
+            y_pred = predict(tf.convert_to_tensor(X_test, dtype=tf.float32)).numpy()
             
             # Convert to directional accuracy
             y_test_dir = np.diff(scaler.inverse_transform(y_test.reshape(-1, 1)).flatten())
@@ -583,6 +850,65 @@ class MLModels:
             logger.error(f"Error training LSTM: {e}")
             return 0.0
     
+    @staticmethod
+    def _compile_lstm(model) -> None:
+        """Compile the LSTM with a fresh Adam optimizer"""
+        # jit_compile fuses the train/predict steps with XLA
+        model.compile(optimizer=Adam(learning_rate=0.001), loss='mean_squared_error',
+                      jit_compile=True)
+    
+    def _model_scores(self, X: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Run every trained model over X once
+        
+        Args:
+            X: Feature matrix for prediction
+            
+        Returns:
+            Dictionary mapping model name to its per-row up probabilities
+        """
+        scores = {}
+        
+        # Logistic Regression prediction
+        if self.logistic_weights is not None:
+            weights, intercept = self.logistic_weights
+            scores['logistic'] = 1.0 / (1.0 + np.exp(-(X @ weights + intercept)))
+        elif 'logistic' in self.models and 'logistic' in self.scalers:
+            X_scaled = self.scalers['logistic'].transform(X)
+            scores['logistic'] = self.models['logistic'].predict_proba(X_scaled)[:, 1]
+        
+        # XGBoost prediction
+        if 'xgboost' in self.models:
+            # binary:logistic boosters already return probabilities
+            scores['xgboost'] = self.models['xgboost'].predict(xgb.DMatrix(X, nthread=1))
+        
+        # LSTM prediction (simplified)
+        if 'lstm' in self.models:
+            # For simplicity, use a placeholder prediction
+            scores['lstm'] = np.full(len(X), 0.5)
+        
+        return scores
+    
+    @staticmethod
+    def _combine_predictions(predictions: Dict[str, float]) -> Dict[str, float]:
+        """Add the weighted ensemble score and trading signal to per-model predictions"""
+        if predictions:
+            ensemble_pred = sum(predictions.get(model, 0) * weight
+                              for model, weight in ENSEMBLE_WEIGHTS.items())
+            predictions['ensemble'] = ensemble_pred
+            
+            # Generate trading signal
+            if ensemble_pred > 0.6:
+                signal = 'BUY'
+            elif ensemble_pred < 0.4:
+                signal = 'SELL'
+            else:
+                signal = 'HOLD'
+                
+            predictions['signal'] = signal
+        
+        return predictions
+    
     def get_ensemble_prediction(self, X: np.ndarray) -> Dict[str, float]:
         """
         Get ensemble prediction from all trained models
@@ -594,47 +920,112 @@ class MLModels:
             Dictionary with individual and ensemble predictions
         """
         try:
-            predictions = {}
-            
-            # Logistic Regression prediction
-            if 'logistic' in self.models and 'logistic' in self.scalers:
-                X_scaled = self.scalers['logistic'].transform(X)
-                pred = self.models['logistic'].predict_proba(X_scaled)[:, 1]
-                predictions['logistic'] = float(np.mean(pred))
-            
-            # XGBoost prediction
-            if 'xgboost' in self.models:
-                pred = self.models['xgboost'].predict_proba(X)[:, 1]
-                predictions['xgboost'] = float(np.mean(pred))
-            
-            # LSTM prediction (simplified)
-            if 'lstm' in self.models:
-                # For simplicity, use a placeholder prediction
-                predictions['lstm'] = 0.5
-            
-            # Ensemble prediction (weighted average)
-            if predictions:
-                weights = {'logistic': 0.3, 'xgboost': 0.5, 'lstm': 0.2}
-                ensemble_pred = sum(predictions.get(model, 0) * weights.get(model, 0) 
-                                  for model in weights)
-                predictions['ensemble'] = ensemble_pred
-                
-                # Generate trading signal
-                if ensemble_pred > 0.6:
-                    signal = 'BUY'
-                elif ensemble_pred < 0.4:
-                    signal = 'SELL'
-                else:
-                    signal = 'HOLD'
-                    
-                predictions['signal'] = signal
-            
-            return predictions
+            scores = self._model_scores(X)
+            predictions = {model: float(np.mean(pred)) for model, pred in scores.items()}
+            return self._combine_predictions(predictions)
             
         except Exception as e:
             logger.error(f"Error getting ensemble prediction: {e}")
             return {'signal': 'HOLD', 'ensemble': 0.5}
     
+    def get_ensemble_predictions_batch(self, X: np.ndarray) -> List[Dict[str, float]]:
+        """
+        Get one ensemble prediction per row of X
+        
+        Each model runs once over the whole batch, so scoring many symbols
+        costs one predict call per model instead of one per symbol.
+        
+        Args:
+            X: Feature matrix with one row per candidate
+            
+        Returns:
+            List of prediction dictionaries, in row order
+        """
+        try:
+            scores = self._model_scores(X)
+            return [
+                self._combine_predictions({model: float(pred[i]) for model, pred in scores.items()})
+                for i in range(len(X))
+            ]
+            
+        except Exception as e:
+            logger.error(f"Error getting batch ensemble predictions: {e}")
+            return [{'signal': 'HOLD', 'ensemble': 0.5} for _ in range(len(X))]
+    
+    def update_symbol_predictions(self, symbols: List[str], X: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Score one feature row per symbol into the shared ensemble buffer
+        
+        Scores live in ensemble_out, a float32 array with one row per symbol
+        (see symbol_rows) and one column per ENSEMBLE_COLUMNS entry, so a
+        polling loop updates rows in place instead of building a dict per
+        symbol per tick. Columns of models that are not trained hold NaN.
+        
+        Args:
+            symbols: Symbol for each row of X
+            X: Feature matrix with one row per symbol
+            
+        Returns:
+            Tuple of a view of every symbol's scores and the matching
+            array of 'BUY'/'SELL'/'HOLD' signals
+        """
+        for symbol in symbols:
+            self.symbol_rows.setdefault(symbol, len(self.symbol_rows))
+        
+        count = len(self.symbol_rows)
+        if count > len(self.ensemble_out):
+            grown = np.full((max(count, 2 * len(self.ensemble_out)), len(ENSEMBLE_COLUMNS)),
+                            np.nan, dtype=np.float32)
+            grown[:len(self.ensemble_out)] = self.ensemble_out
+            self.ensemble_out = grown
+        
+        rows = np.array([self.symbol_rows[symbol] for symbol in symbols], dtype=np.intp)
+        scores = self._model_scores(X)
+        ensemble = np.zeros(len(rows)) if scores else np.full(len(rows), np.nan)
+        
+        for column, model in enumerate(ENSEMBLE_COLUMNS[:-1]):
+            if model in scores:
+                self.ensemble_out[rows, column] = scores[model]
+                ensemble += ENSEMBLE_WEIGHTS[model] * scores[model]
+            else:
+                self.ensemble_out[rows, column] = np.nan
+        self.ensemble_out[rows, -1] = ensemble
+        
+        view = self.ensemble_out[:count]
+        # NaN ensembles (no trained models) compare false and map to HOLD
+        signals = np.where(view[:, -1] > 0.6, 'BUY', np.where(view[:, -1] < 0.4, 'SELL', 'HOLD'))
+        return view, signals
+    
+    def queue_prediction(self, features: np.ndarray) -> Optional[List[Dict[str, float]]]:
+        """
+        Queue one feature row for batched prediction
+        
+        Args:
+            features: Feature vector for a single candidate
+            
+        Returns:
+            The flushed batch's predictions once PREDICTION_BATCH_SIZE rows
+            are queued, otherwise None
+        """
+        self.pending_predictions.append(np.asarray(features).reshape(-1))
+        if len(self.pending_predictions) >= PREDICTION_BATCH_SIZE:
+            return self.flush_predictions()
+        return None
+    
+    def flush_predictions(self) -> List[Dict[str, float]]:
+        """
+        Predict every queued feature row in one batch
+        
+        Returns:
+            List of prediction dictionaries, in the order rows were queued
+        """
+        if not self.pending_predictions:
+            return []
+        
+        X_batch = np.vstack(self.pending_predictions)
+        self.pending_predictions = []
+        return self.get_ensemble_predictions_batch(X_batch)
+    
     def save_performance_metrics(self, model_name: str, metrics: Dict[str, float]) -> None:
         """
         Save performance metrics for a trained model
@@ -1161,17 +1552,48 @@ class CryptoWallet:
 class TradingEngine:
     """Automated trading engine with risk management"""
     
-    def __init__(self):
+    def __init__(self, session: Optional[requests.Session] = None):
         self.exchange = None
+        self.session = session  # HTTP session handed to the exchange client, if any
+        self.rng = np.random.default_rng()  # Source for simulated trade prices and amounts
         self.is_testnet = True
         self.positions = {}
-        self.trade_log = []
+        # Logged trades as a TRADE_LOG_DTYPE array grown by doubling; only the
+        # first trade_count rows are valid
+        self.trade_log = np.zeros(64, dtype=TRADE_LOG_DTYPE)
+        self.trade_count = 0
         self.risk_settings = {
             'max_position_size': 0.1,  # 10% of portfolio
             'stop_loss_pct': 0.05,     # 5% stop loss
             'take_profit_pct': 0.15,   # 15% take profit
             'max_daily_trades': 5
         }
+        # Runs exchange requests that can overlap within a single trade
+        self.io_executor = ThreadPoolExecutor(max_workers=2)
+        self.trade_lock = threading.Lock()  # Guards trade_log appends from concurrent orders
+        # Fill prices of BUY and SELL trades in log order, in growable buffers
+        # (only the first trade_price_counts[signal] entries are valid)
+        self.trade_prices = {'BUY': np.empty(64), 'SELL': np.empty(64)}
+        self.trade_price_counts = {'BUY': 0, 'SELL': 0}
+        # Running performance over completed BUY/SELL pairs
+        self.running_return = 0.0
+        self.running_wins = 0
+        self.running_pairs = 0
+        # Trades logged on today_date, reset when the date rolls over
+        self.today_date = date.today()
+        self.today_trades = 0
+        # Last fetched exchange balance and its time.monotonic() timestamp
+        self.balance_cache = None
+        self.balance_fetched_at = 0.0
+        self.balance_lock = threading.Lock()
+        # Last streamed price per symbol as (price, time.monotonic()), fed by
+        # ccxt.pro ticker streams on a background event loop
+        self.last_prices = {}
+        self.watched_symbols = set()
+        self.stream_lock = threading.Lock()  # Guards starting streams from concurrent trades
+        self.stream_loop = None
+        self.stream_thread = None
+        self.stream_exchange = None
         
     def initialize_exchange(self, api_key: str = "", secret: str = "", testnet: bool = True) -> bool:
         """
@@ -1193,8 +1615,10 @@ class TradingEngine:
                 
             logger.info("Initializing exchange connection")
             
+            self.is_testnet = testnet
+            
             # Initialize Binance exchange (most common)
-            self.exchange = ccxt.binance({
+            config = {
                 'apiKey': api_key,
                 'secret': secret,
                 'sandbox': testnet,
@@ -1202,10 +1626,15 @@ class TradingEngine:
                 'options': {
                     'defaultType': 'spot'
                 }
-            })
-            
-            # Test connection
-            balance = self.exchange.fetch_balance()
+            }
+            if self.session is not None:
+                config['session'] = self.session
+            self.exchange = ccxt.binance(config)
+            
+            # Test connection and load the market list once up front; ccxt
+            # keeps it, so trades don't pay for the lookup on first use
+            self.refresh_balance()
+            self.exchange.load_markets()
             logger.success("Exchange connection successful")
             return True
             
@@ -1214,6 +1643,7 @@ class TradingEngine:
             self.exchange = None
             return False
     
+    @perf.profiled('execute_trade')
     def execute_trade(self, symbol: str, signal: str, amount: float = None) -> Dict[str, Any]:
         """
         Execute a trade based on ML signal
@@ -1235,32 +1665,38 @@ class TradingEngine:
             
             logger.info(f"Executing {signal} trade for {symbol}")
             
-            # Get current price
-            ticker = self.exchange.fetch_ticker(symbol)
-            current_price = ticker['last']
+            # Check daily trade limit before spending any exchange round trips
+            if self.trades_today() >= self.risk_settings['max_daily_trades']:
+                logger.warning("Daily trade limit reached")
+                return {'status': 'trade_limit_reached', 'signal': signal}
+            
+            # Get current price and, when needed, the balance concurrently; one
+            # balance snapshot serves both the amount sizing and the SELL check.
+            # A fresh streamed price saves the ticker round trip entirely
+            current_price = self.streamed_price(symbol)
+            ticker_future = None
+            if current_price is None:
+                ticker_future = self.io_executor.submit(self.exchange.fetch_ticker, symbol)
+            balance = None
+            if amount is None or signal == 'SELL':
+                balance = self.get_balance()
+            if ticker_future is not None:
+                with perf.timed('fetch_ticker'):
+                    current_price = ticker_future.result()['last']
+            self.watch_price(symbol)
             
             # Calculate trade amount if not provided
             if amount is None:
-                balance = self.exchange.fetch_balance()
-                base_currency = symbol.split('/')[1]  # e.g., 'USDT' from 'BTC/USDT'
-                available_balance = balance[base_currency]['free']
+                quote_currency = symbol.split('/')[1]  # e.g., 'USDT' from 'BTC/USDT'
+                available_balance = balance[quote_currency]['free']
                 amount = available_balance * self.risk_settings['max_position_size']
             
-            # Check daily trade limit
-            today_trades = len([t for t in self.trade_log 
-                              if t['timestamp'].date() == datetime.now().date()])
-            
-            if today_trades >= self.risk_settings['max_daily_trades']:
-                logger.warning("Daily trade limit reached")
-                return {'status': 'trade_limit_reached', 'signal': signal}
-            
             # Execute trade
             if signal == 'BUY':
                 order = self.exchange.create_market_buy_order(symbol, amount)
             else:  # SELL
                 # For sell, we need to have the base currency
                 base_currency = symbol.split('/')[0]  # e.g., 'BTC' from 'BTC/USDT'
-                balance = self.exchange.fetch_balance()
                 available_amount = balance[base_currency]['free']
                 
                 if available_amount > 0:
@@ -1268,26 +1704,255 @@ class TradingEngine:
                 else:
                     return {'status': 'insufficient_balance', 'signal': signal}
             
+            # Exchanges may report None for a market order's amount, so the
+            # filled quantity is what gets applied and logged
+            filled = order.get('filled') or 0
+            self._apply_fill(symbol, signal, filled, current_price)
+            
             # Log trade
             trade_record = {
                 'timestamp': datetime.now(),
                 'symbol': symbol,
                 'signal': signal,
                 'price': current_price,
-                'amount': order['amount'],
+                'amount': filled,
                 'order_id': order['id'],
                 'status': order['status']
             }
             
-            self.trade_log.append(trade_record)
+            self._log_trade(trade_record)
             
-            logger.success(f"Trade executed: {signal} {order['amount']} {symbol} at {current_price}")
+            logger.success(f"Trade executed: {signal} {filled} {symbol} at {current_price}")
             return {'status': 'success', 'order': order, 'trade': trade_record}
             
         except Exception as e:
             logger.error(f"Error executing trade: {e}")
             return {'status': 'error', 'error': str(e), 'signal': signal}
     
+    def streamed_price(self, symbol: str) -> Optional[float]:
+        """
+        Latest streamed price for symbol
+        
+        Returns:
+            The price, or None if the symbol is not streamed or its last
+            update is older than PRICE_STREAM_MAX_AGE seconds
+        """
+        entry = self.last_prices.get(symbol)
+        if entry is None or time.monotonic() - entry[1] > PRICE_STREAM_MAX_AGE:
+            return None
+        return entry[0]
+    
+    def watch_price(self, symbol: str) -> None:
+        """
+        Start streaming symbol's ticker into last_prices, if not already
+        
+        The streams run on one background thread with its own asyncio event
+        loop. Without ccxt.pro this does nothing and trades keep using REST.
+        """
+        if not CCXT_PRO_AVAILABLE:
+            return
+        
+        with self.stream_lock:
+            if symbol in self.watched_symbols:
+                return
+            if self.stream_loop is None:
+                self.stream_loop = asyncio.new_event_loop()
+                self.stream_thread = threading.Thread(
+                    target=self.stream_loop.run_forever, name="price-stream", daemon=True
+                )
+                self.stream_thread.start()
+            self.watched_symbols.add(symbol)
+        asyncio.run_coroutine_threadsafe(self._stream_ticker(symbol), self.stream_loop)
+    
+    async def _stream_ticker(self, symbol: str) -> None:
+        """Keep last_prices[symbol] updated from the exchange's ticker stream"""
+        if self.stream_exchange is None:
+            # Tickers are public, so the stream needs no API keys
+            self.stream_exchange = ccxtpro.binance({'options': {'defaultType': 'spot'}})
+            self.stream_exchange.set_sandbox_mode(self.is_testnet)
+        
+        while True:
+            try:
+                ticker = await self.stream_exchange.watch_ticker(symbol)
+                self.last_prices[symbol] = (ticker['last'], time.monotonic())
+            except Exception as e:
+                logger.warning(f"Ticker stream for {symbol} failed, reconnecting: {e}")
+                await asyncio.sleep(PRICE_STREAM_RETRY_DELAY)
+    
+    async def _close_streams(self) -> None:
+        """Cancel every ticker stream and close the streaming exchange"""
+        tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if self.stream_exchange is not None:
+            await self.stream_exchange.close()
+            self.stream_exchange = None
+    
+    def close(self) -> None:
+        """
+        Stop the ticker streams and their background event loop
+        
+        Safe to call more than once, or when no stream was ever started.
+        """
+        with self.stream_lock:
+            loop, thread = self.stream_loop, self.stream_thread
+            self.stream_loop = None
+            self.stream_thread = None
+            self.watched_symbols.clear()
+        if loop is None:
+            return
+        
+        try:
+            asyncio.run_coroutine_threadsafe(self._close_streams(), loop).result(PRICE_STREAM_CLOSE_TIMEOUT)
+        except Exception as e:
+            logger.warning(f"Error closing ticker streams: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(PRICE_STREAM_CLOSE_TIMEOUT)
+        if not thread.is_alive():
+            loop.close()
+    
+    def refresh_balance(self) -> Dict[str, Any]:
+        """
+        Fetch the exchange balance and store it as the cached balance
+        
+        Returns:
+            ccxt balance structure
+        """
+        balance = self.exchange.fetch_balance()
+        with self.balance_lock:
+            self.balance_cache = balance
+            self.balance_fetched_at = time.monotonic()
+        return balance
+    
+    def get_balance(self) -> Dict[str, Any]:
+        """
+        Get the exchange balance, refetching it only when the cached copy
+        is older than BALANCE_CACHE_TTL seconds
+        
+        Returns:
+            ccxt balance structure
+        """
+        with self.balance_lock:
+            if (self.balance_cache is not None
+                    and time.monotonic() - self.balance_fetched_at < BALANCE_CACHE_TTL):
+                return self.balance_cache
+        return self.refresh_balance()
+    
+    def _apply_fill(self, symbol: str, signal: str, amount: float, price: float) -> None:
+        """
+        Optimistically apply a filled market order to the cached balance
+        
+        Fees are not known here, so the cached figures drift slightly until
+        the next refresh_balance replaces them with the exchange's numbers.
+        The order has already been sent, so this never raises: if the fill
+        cannot be applied the cache is dropped and the next get_balance
+        fetches it again.
+        """
+        with self.balance_lock:
+            if self.balance_cache is None:
+                return
+            try:
+                base_currency, quote_currency = symbol.split('/')
+                direction = 1.0 if signal == 'BUY' else -1.0
+                base = self.balance_cache.setdefault(base_currency, {'free': 0.0})
+                quote = self.balance_cache.setdefault(quote_currency, {'free': 0.0})
+                base['free'] = (base.get('free') or 0.0) + direction * float(amount)
+                quote['free'] = (quote.get('free') or 0.0) - direction * float(amount) * float(price)
+            except Exception as e:
+                logger.warning(f"Could not apply fill to cached balance: {e}")
+                self.balance_cache = None
+    
+    def trades_today(self) -> int:
+        """Number of trades logged today"""
+        if date.today() != self.today_date:
+            return 0
+        return self.today_trades
+    
+    def _log_trade(self, trade_record: Dict[str, Any]) -> None:
+        """Append a trade to trade_log and record its price for performance metrics"""
+        signal = trade_record['signal']
+        with self.trade_lock:
+            if self.trade_count == len(self.trade_log):
+                grown = np.zeros(2 * len(self.trade_log), dtype=TRADE_LOG_DTYPE)
+                grown[:self.trade_count] = self.trade_log
+                self.trade_log = grown
+            self.trade_log[self.trade_count] = (
+                trade_record['timestamp'],
+                trade_record['price'],
+                trade_record['amount'],
+                TRADE_SIGNALS.index(signal),
+                trade_record.get('simulated', False),
+                trade_record['symbol'],
+                trade_record['order_id'],
+                trade_record['status']
+            )
+            self.trade_count += 1
+            
+            trade_date = trade_record['timestamp'].date()
+            if trade_date != self.today_date:
+                self.today_date = trade_date
+                self.today_trades = 0
+            self.today_trades += 1
+            
+            prices = self.trade_prices[signal]
+            count = self.trade_price_counts[signal]
+            if count == len(prices):
+                prices = np.resize(prices, 2 * len(prices))
+                self.trade_prices[signal] = prices
+            prices[count] = trade_record['price']
+            self.trade_price_counts[signal] = count + 1
+            
+            # A trade that completes the next BUY/SELL pair updates the running
+            # performance totals, so reading them never rescans the log
+            pairs = min(self.trade_price_counts['BUY'], self.trade_price_counts['SELL'])
+            if pairs > self.running_pairs:
+                buy_price = self.trade_prices['BUY'][self.running_pairs]
+                sell_price = self.trade_prices['SELL'][self.running_pairs]
+                return_pct = float((sell_price - buy_price) / buy_price)
+                self.running_return += return_pct
+                self.running_wins += return_pct > 0
+                self.running_pairs = pairs
+    
+    def execute_trades_batch(self, orders: List[Tuple[str, str, Optional[float]]]) -> List[Dict[str, Any]]:
+        """
+        Execute several trades concurrently
+        
+        Orders are submitted together on a thread pool sharing this engine's
+        exchange connection, so N orders take roughly one order's latency
+        instead of N. For live trades the daily trade limit is applied to the
+        batch up front: orders past the remaining allowance are not sent.
+        
+        Args:
+            orders: List of (symbol, signal, amount) tuples; amount may be None
+            
+        Returns:
+            List of trade execution results, in order
+        """
+        if not orders:
+            return []
+        
+        remaining = self.risk_settings['max_daily_trades'] - self.trades_today()
+        
+        results = [None] * len(orders)
+        to_send = []
+        for i, (symbol, signal, amount) in enumerate(orders):
+            if signal != 'HOLD' and self.exchange is not None:
+                if remaining <= 0:
+                    results[i] = {'status': 'trade_limit_reached', 'signal': signal}
+                    continue
+                remaining -= 1
+            to_send.append(i)
+        
+        if to_send:
+            workers = min(len(to_send), MAX_FETCH_WORKERS)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {i: executor.submit(self.execute_trade, *orders[i]) for i in to_send}
+                for i, future in futures.items():
+                    results[i] = future.result()
+        
+        return results
+    
     def _simulate_trade(self, symbol: str, signal: str, amount: float = None) -> Dict[str, Any]:
         """
         Simulate trade execution for demo purposes
@@ -1302,11 +1967,11 @@ class TradingEngine:
         """
         try:
             # Simulate current price
-            current_price = np.random.uniform(30000, 50000) if 'BTC' in symbol else np.random.uniform(2000, 3000)
+            current_price = self.rng.uniform(30000, 50000) if 'BTC' in symbol else self.rng.uniform(2000, 3000)
             
             # Simulate trade amount
             if amount is None:
-                amount = np.random.uniform(0.001, 0.01)
+                amount = self.rng.uniform(0.001, 0.01)
             
             # Create simulated trade record
             trade_record = {
@@ -1320,7 +1985,7 @@ class TradingEngine:
                 'simulated': True
             }
             
-            self.trade_log.append(trade_record)
+            self._log_trade(trade_record)
             
             logger.info(f"Simulated trade: {signal} {amount} {symbol} at {current_price}")
             return {'status': 'simulated', 'trade': trade_record}
@@ -1329,14 +1994,33 @@ class TradingEngine:
             logger.error(f"Error simulating trade: {e}")
             return {'status': 'error', 'error': str(e), 'signal': signal}
     
-    def get_trade_history(self) -> List[Dict[str, Any]]:
+    def get_trade_history(self, start: int = 0) -> List[Dict[str, Any]]:
         """
         Get trading history
         
+        Args:
+            start: Index of the first trade to return, to fetch only trades
+                logged since an earlier call
+            
         Returns:
             List of trade records
         """
-        return self.trade_log.copy()
+        with self.trade_lock:
+            rows = self.trade_log[start:self.trade_count].copy()
+        
+        return [
+            {
+                'timestamp': row['timestamp'].item(),
+                'symbol': row['symbol'],
+                'signal': TRADE_SIGNALS[row['signal']],
+                'price': float(row['price']),
+                'amount': float(row['amount']),
+                'order_id': row['order_id'],
+                'status': row['status'],
+                'simulated': bool(row['simulated'])
+            }
+            for row in rows
+        ]
     
     def calculate_portfolio_performance(self) -> Dict[str, float]:
         """
@@ -1346,39 +2030,48 @@ class TradingEngine:
             Dictionary with performance metrics
         """
         try:
-            if not self.trade_log:
+            if self.trade_count == 0:
                 return {'total_return': 0.0, 'win_rate': 0.0, 'total_trades': 0}
             
-            # Simple performance calculation
-            buy_trades = [t for t in self.trade_log if t['signal'] == 'BUY']
-            sell_trades = [t for t in self.trade_log if t['signal'] == 'SELL']
-            
-            total_return = 0.0
-            wins = 0
-            total_pairs = min(len(buy_trades), len(sell_trades))
-            
-            for i in range(total_pairs):
-                buy_price = buy_trades[i]['price']
-                sell_price = sell_trades[i]['price']
-                return_pct = (sell_price - buy_price) / buy_price
-                total_return += return_pct
-                
-                if return_pct > 0:
-                    wins += 1
-            
-            win_rate = wins / total_pairs if total_pairs > 0 else 0.0
-            
-            return {
-                'total_return': total_return,
-                'win_rate': win_rate,
-                'total_trades': len(self.trade_log),
-                'trade_pairs': total_pairs
-            }
+            # Simple performance calculation: the i-th BUY paired with the i-th
+            # SELL, accumulated by _log_trade as each pair completes
+            with self.trade_lock:
+                total_pairs = self.running_pairs
+                return {
+                    'total_return': self.running_return,
+                    'win_rate': self.running_wins / total_pairs if total_pairs > 0 else 0.0,
+                    'total_trades': self.trade_count,
+                    'trade_pairs': total_pairs
+                }
             
         except Exception as e:
             logger.error(f"Error calculating performance: {e}")
             return {'total_return': 0.0, 'win_rate': 0.0, 'total_trades': 0}
 
+class BackgroundTask(QThread):
+    """
+    Runs a callable off the GUI thread and reports the outcome through Qt signals
+    
+    succeeded carries the callable's return value; failed carries the task's
+    error label and the exception message.
+    """
+    
+    succeeded = pyqtSignal(object)
+    failed = pyqtSignal(str, str)
+    
+    def __init__(self, error_label: str, func, *args):
+        super().__init__()
+        self.error_label = error_label
+        self.func = func
+        self.args = args
+    
+    def run(self):
+        try:
+            self.succeeded.emit(self.func(*self.args))
+        except Exception as e:
+            logger.error(f"Background task {self.func.__name__} failed: {e}")
+            self.failed.emit(self.error_label, str(e))
+
 class CryptoPredictionApp(QMainWindow):
     """Main PyQt5 GUI application"""
     
@@ -1387,11 +2080,12 @@ class CryptoPredictionApp(QMainWindow):
         self.setWindowTitle("Advanced Cryptocurrency Trading & Prediction Tool")
         self.setGeometry(100, 100, 1400, 900)
         
-        # Initialize components
-        self.data_fetcher = DataFetcher()
+        # Initialize components; every HTTP client shares one connection pool
+        self.http_session = create_http_session()
+        self.data_fetcher = DataFetcher(self.http_session)
         self.ml_models = MLModels()
         self.wallet = CryptoWallet()
-        self.trading_engine = TradingEngine()
+        self.trading_engine = TradingEngine(self.http_session)
         self.feedback_loop = FeedbackLoop(self.ml_models, self.data_fetcher)
         
         # Initialize Claude analyzer if available
@@ -1401,10 +2095,24 @@ class CryptoPredictionApp(QMainWindow):
             if self.claude_analyzer.is_available():
                 logger.info("Claude Opus 4.1 integration enabled in GUI")
         
+        # Compile the indicator kernels in the background so the first
+        # refresh doesn't pay the JIT cost
+        threading.Thread(target=indicator_kernels.warmup, name="indicator-warmup", daemon=True).start()
+        
         # Data storage
         self.current_data = None
         self.predictions = {}
         
+        # Running BackgroundTask per task name (kept referenced until finished)
+        self.tasks = {}
+        self.last_logged_performance = None  # Last portfolio figures written to the log
+        self.status_dirty = False  # An update_status call is already queued
+        # HH:MM:SS prefix for log lines and the whole second it was formatted for
+        self.log_time_second = None
+        self.log_time_text = ''
+        # Timestamped log lines held back while the window is minimized
+        self.pending_log = []
+        
         # Setup UI
         self.setup_ui()
         
@@ -1414,6 +2122,48 @@ class CryptoPredictionApp(QMainWindow):
         # Show risk disclosure
         self.show_risk_disclosure()
         
+    def log_timestamp(self) -> str:
+        """HH:MM:SS for log lines, formatted at most once per second"""
+        second = int(time.time())
+        if second != self.log_time_second:
+            self.log_time_second = second
+            self.log_time_text = time.strftime('%H:%M:%S', time.localtime(second))
+        return self.log_time_text
+    
+    def log_event(self, message: str):
+        """
+        Add a timestamped line to the activity log
+        
+        While the window is minimized nobody can see the log, so lines are
+        only queued; the QTextEdit appends and relayouts happen in one batch
+        when the window is restored.
+        
+        Args:
+            message: Log message without the timestamp
+        """
+        line = f"[{self.log_timestamp()}] {message}"
+        if self.isMinimized():
+            self.pending_log.append(line)
+        else:
+            self.log_text.append(line)
+    
+    def flush_pending_log(self):
+        """Append the log lines queued while the window was minimized"""
+        if not self.pending_log:
+            return
+        
+        self.log_text.setUpdatesEnabled(False)
+        for line in self.pending_log:
+            self.log_text.append(line)
+        self.log_text.setUpdatesEnabled(True)
+        self.pending_log = []
+    
+    def changeEvent(self, event):
+        """Write out queued log lines once the window is no longer minimized"""
+        super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange and not self.isMinimized():
+            self.flush_pending_log()
+    
     def setup_ui(self):
         """Setup the main user interface"""
         central_widget = QWidget()
@@ -1604,6 +2354,7 @@ class CryptoPredictionApp(QMainWindow):
         self.figure = Figure(figsize=(12, 8))
         self.canvas = FigureCanvas(self.figure)
         charts_layout.addWidget(self.canvas)
+        self.setup_charts()
         
         tab_widget.addTab(charts_tab, "Price Charts")
         
@@ -1611,6 +2362,37 @@ class CryptoPredictionApp(QMainWindow):
         predictions_tab = QWidget()
         predictions_layout = QVBoxLayout(predictions_tab)
         
+        # Fixed title/value label pairs; a new prediction only replaces the values
+        signals_group = QGroupBox("ML Model Predictions & Trading Signal")
+        signals_layout = QGridLayout(signals_group)
+        self.prediction_labels = {}
+        prediction_rows = [
+            ('time', "Current Time:"),
+            ('coin', "Cryptocurrency:"),
+            ('logistic', "Logistic Regression:"),
+            ('xgboost', "XGBoost:"),
+            ('lstm', "LSTM:"),
+            ('ensemble', "Confidence Score:"),
+            ('signal', "Trading Signal:")
+        ]
+        for row, (key, title) in enumerate(prediction_rows):
+            signals_layout.addWidget(QLabel(title), row, 0)
+            self.prediction_labels[key] = QLabel("N/A")
+            signals_layout.addWidget(self.prediction_labels[key], row, 1)
+        predictions_layout.addWidget(signals_group)
+        
+        interpretation_label = QLabel(
+            "BUY: High confidence upward price movement expected\n"
+            "SELL: High confidence downward price movement expected\n"
+            "HOLD: Uncertain market conditions, maintain current position\n\n"
+            "These predictions are based on historical data and technical indicators. "
+            "They are NOT guaranteed and should not be used as the sole basis for "
+            "trading decisions. Always conduct your own research."
+        )
+        interpretation_label.setWordWrap(True)
+        predictions_layout.addWidget(interpretation_label)
+        
+        # Free-form text: Claude analysis and feedback loop status
         self.predictions_text = QTextEdit()
         self.predictions_text.setReadOnly(True)
         predictions_layout.addWidget(self.predictions_text)
@@ -1622,6 +2404,11 @@ class CryptoPredictionApp(QMainWindow):
         trading_layout = QVBoxLayout(trading_tab)
         
         self.trading_table = QTableWidget()
+        self.trading_table.setColumnCount(6)
+        self.trading_table.setHorizontalHeaderLabels([
+            'Timestamp', 'Symbol', 'Signal', 'Price', 'Amount', 'Status'
+        ])
+        self.rendered_trades = 0  # Trades already shown in trading_table
         trading_layout.addWidget(self.trading_table)
         
         tab_widget.addTab(trading_tab, "Trading History")
@@ -1635,11 +2422,6 @@ class CryptoPredictionApp(QMainWindow):
         self.refresh_timer.timeout.connect(self.auto_refresh)
         self.refresh_timer.start(300000)  # 5 minutes
         
-        # Status update timer (every 10 seconds)
-        self.status_timer = QTimer()
-        self.status_timer.timeout.connect(self.update_status)
-        self.status_timer.start(10000)  # 10 seconds
-        
         # Feedback loop timer (every 1 hour for Tier 1 checks)
         self.feedback_timer = QTimer()
         self.feedback_timer.timeout.connect(self.auto_feedback_loop)
@@ -1648,7 +2430,7 @@ class CryptoPredictionApp(QMainWindow):
     def auto_feedback_loop(self):
         """Automatically run feedback loop if enabled"""
         if self.enable_feedback_loop.isChecked():
-            self.log_text.append(f"[{datetime.now().strftime('%H:%M:%S')}] Auto feedback loop triggered")
+            self.log_event("Auto feedback loop triggered")
             self.run_feedback_loop_cycle()
     
     def show_risk_disclosure(self):
@@ -1668,158 +2450,257 @@ class CryptoPredictionApp(QMainWindow):
         msg.setStandardButtons(QMessageBox.Ok)
         msg.exec_()
     
+    def start_task(self, name: str, func, args: tuple, on_success, error_label: str) -> bool:
+        """
+        Run func(*args) on a BackgroundTask unless a task of that name is running
+        
+        Args:
+            name: Task name, one task per name at a time
+            func: Callable to run on the worker thread; must not touch widgets
+            args: Arguments for func
+            on_success: GUI-thread slot receiving func's return value
+            error_label: Prefix for the status/log message if func raises
+            
+        Returns:
+            True if the task was started
+        """
+        running = self.tasks.get(name)
+        if running is not None and running.isRunning():
+            self.log_event(f"{name.title()} already in progress")
+            return False
+        
+        task = BackgroundTask(error_label, func, *args)
+        task.succeeded.connect(on_success)
+        task.failed.connect(self.report_task_error)
+        self.tasks[name] = task
+        task.start()
+        return True
+    
+    def report_task_error(self, label: str, message: str):
+        """Show a background task failure in the status bar and log"""
+        self.status_label.setText(f"{label}: {message}")
+        self.log_event(f"{label}: {message}")
+    
     def refresh_data(self):
         """Refresh cryptocurrency data"""
-        try:
+        coin_id = self.coin_combo.currentText()
+        days = self.days_spinbox.value()
+        
+        if self.start_task('refresh', self.load_market_data, (coin_id, days),
+                           self.on_data_refreshed, "Error"):
             self.status_label.setText("Fetching data...")
-            self.log_text.append(f"[{datetime.now().strftime('%H:%M:%S')}] Refreshing data...")
-            
-            coin_id = self.coin_combo.currentText()
-            days = self.days_spinbox.value()
-            
-            # Fetch price data
-            price_data = self.data_fetcher.fetch_coingecko_data(coin_id, days)
-            
-            if price_data is not None:
-                # Add technical indicators
-                self.current_data = TechnicalIndicators.add_technical_indicators(price_data)
-                
-                # Fetch sentiment data
-                fear_greed = self.data_fetcher.fetch_fear_greed_index()
-                news_sentiment = self.data_fetcher.fetch_news_sentiment(coin_id)
-                social_sentiment = self.data_fetcher.fetch_social_sentiment(coin_id.upper()[:3])
-                
-                # Update charts
-                self.update_charts()
-                
-                self.status_label.setText(f"Data updated: {len(self.current_data)} records")
-                self.log_text.append(f"[{datetime.now().strftime('%H:%M:%S')}] Data refresh complete")
-            else:
-                self.status_label.setText("Data fetch failed")
-                self.log_text.append(f"[{datetime.now().strftime('%H:%M:%S')}] Data fetch failed")
-                
-        except Exception as e:
-            self.status_label.setText(f"Error: {str(e)}")
-            self.log_text.append(f"[{datetime.now().strftime('%H:%M:%S')}] Error: {str(e)}")
+            self.log_event("Refreshing data...")
+    
+    @perf.profiled('refresh_data')
+    def load_market_data(self, coin_id: str, days: int) -> Optional[Dict[str, Any]]:
+        """
+        Fetch price and sentiment data and add technical indicators
+        
+        Runs on a worker thread.
+        
+        Returns:
+            Dictionary with the indicator frame and sentiment data, or None
+            if no price data was returned
+        """
+        # Fetch price data and the Fear & Greed Index concurrently; they are
+        # independent requests sharing the fetcher's session
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            price_future = executor.submit(self.data_fetcher.fetch_coingecko_data, coin_id, days)
+            fear_greed_future = executor.submit(self.data_fetcher.fetch_fear_greed_index)
+            price_data = price_future.result()
+            fear_greed = fear_greed_future.result()
+        
+        if price_data is None:
+            return None
+        
+        return {
+            # Add technical indicators
+            'data': TechnicalIndicators.add_technical_indicators(price_data),
+            # Sentiment data (news and social scores are simulated locally)
+            'fear_greed': fear_greed,
+            'news_sentiment': self.data_fetcher.fetch_news_sentiment(coin_id),
+            'social_sentiment': self.data_fetcher.fetch_social_sentiment(coin_id.upper()[:3])
+        }
     
+    def on_data_refreshed(self, result: Optional[Dict[str, Any]]):
+        """Apply freshly loaded market data to the GUI"""
+        if result is None:
+            self.status_label.setText("Data fetch failed")
+            self.log_event("Data fetch failed")
+            return
+        
+        self.current_data = result['data']
+        
+        # Update charts
+        self.update_charts()
+        
+        self.status_label.setText(f"Data updated: {len(self.current_data)} records")
+        self.log_event("Data refresh complete")
+        self.schedule_status_update()
+    
+    def setup_charts(self):
+        """Create the chart axes and artists once so refreshes only swap their data"""
+        self.price_ax = self.figure.add_subplot(3, 1, 1)
+        self.rsi_ax = self.figure.add_subplot(3, 1, 2)
+        self.volume_ax = self.figure.add_subplot(3, 1, 3)
+        
+        # Price chart with moving averages
+        self.price_line, = self.price_ax.plot([], [], label='Price', linewidth=2)
+        self.sma7_line, = self.price_ax.plot([], [], label='SMA 7', alpha=0.7)
+        self.sma25_line, = self.price_ax.plot([], [], label='SMA 25', alpha=0.7)
+        self.price_ax.set_ylabel('Price (USD)')
+        self.price_ax.legend()
+        self.price_ax.grid(True, alpha=0.3)
+        
+        # RSI
+        self.rsi_line, = self.rsi_ax.plot([], [], label='RSI', color='orange')
+        self.rsi_ax.axhline(y=70, color='r', linestyle='--', alpha=0.5, label='Overbought')
+        self.rsi_ax.axhline(y=30, color='g', linestyle='--', alpha=0.5, label='Oversold')
+        self.rsi_ax.set_ylabel('RSI')
+        self.rsi_ax.set_ylim(0, 100)
+        self.rsi_ax.legend()
+        self.rsi_ax.grid(True, alpha=0.3)
+        
+        # Volume bars are created on the first refresh, once the dates are known
+        self.volume_bars = None
+        self.volume_index = None
+        self.volume_ax.set_ylabel('Volume')
+        self.volume_ax.grid(True, alpha=0.3)
+        
+        self.figure.tight_layout()
+    
+    @perf.profiled('update_charts')
     def update_charts(self):
         """Update the price charts"""
         if self.current_data is None:
             return
             
         try:
-            self.figure.clear()
-            
-            # Create subplots
-            ax1 = self.figure.add_subplot(3, 1, 1)
-            ax2 = self.figure.add_subplot(3, 1, 2)
-            ax3 = self.figure.add_subplot(3, 1, 3)
-            
             data = self.current_data.dropna()
             
-            # Price chart with moving averages
-            ax1.plot(data.index, data['price'], label='Price', linewidth=2)
+            self.price_line.set_data(data.index, data['price'].values)
             if 'sma_7' in data.columns:
-                ax1.plot(data.index, data['sma_7'], label='SMA 7', alpha=0.7)
+                self.sma7_line.set_data(data.index, data['sma_7'].values)
             if 'sma_25' in data.columns:
-                ax1.plot(data.index, data['sma_25'], label='SMA 25', alpha=0.7)
-            
-            ax1.set_title(f'{self.coin_combo.currentText().title()} Price Chart')
-            ax1.set_ylabel('Price (USD)')
-            ax1.legend()
-            ax1.grid(True, alpha=0.3)
+                self.sma25_line.set_data(data.index, data['sma_25'].values)
+            self.price_ax.set_title(f'{self.coin_combo.currentText().title()} Price Chart')
+            self.price_ax.relim()
+            self.price_ax.autoscale_view()
             
-            # RSI
             if 'rsi' in data.columns:
-                ax2.plot(data.index, data['rsi'], label='RSI', color='orange')
-                ax2.axhline(y=70, color='r', linestyle='--', alpha=0.5, label='Overbought')
-                ax2.axhline(y=30, color='g', linestyle='--', alpha=0.5, label='Oversold')
-                ax2.set_ylabel('RSI')
-                ax2.set_ylim(0, 100)
-                ax2.legend()
-                ax2.grid(True, alpha=0.3)
-            
-            # Volume
+                self.rsi_line.set_data(data.index, data['rsi'].values)
+                self.rsi_ax.relim()
+                self.rsi_ax.autoscale_view(scaley=False)
+            
             if 'volume' in data.columns:
-                ax3.bar(data.index, data['volume'], alpha=0.6, label='Volume')
-                ax3.set_ylabel('Volume')
-                ax3.legend()
-                ax3.grid(True, alpha=0.3)
+                self.update_volume_bars(data)
             
-            self.figure.tight_layout()
-            self.canvas.draw()
+            self.canvas.draw_idle()
             
         except Exception as e:
             logger.error(f"Error updating charts: {e}")
     
+    def update_volume_bars(self, data: pd.DataFrame):
+        """Resize the existing volume bars, rebuilding them only when the dates change
+        
+        Args:
+            data: Indicator frame with a volume column
+        """
+        volumes = data['volume'].values
+        if self.volume_bars is not None and self.volume_index.equals(data.index):
+            for patch, volume in zip(self.volume_bars.patches, volumes):
+                patch.set_height(volume)
+        else:
+            if self.volume_bars is not None:
+                self.volume_bars.remove()
+            self.volume_bars = self.volume_ax.bar(data.index, volumes, alpha=0.6, label='Volume',
+                                                  color='C0')
+            self.volume_index = data.index
+            self.volume_ax.legend()
+        
+        self.volume_ax.relim()
+        self.volume_ax.autoscale_view()
+    
     def train_models(self):
         """Train machine learning models"""
         if self.current_data is None:
-            self.log_text.append(f"[{datetime.now().strftime('%H:%M:%S')}] No data available for training")
+            self.log_event("No data available for training")
             return
-            
-        try:
+        
+        # Workers get their own copy: prepare_features adds columns to the
+        # frame while the GUI thread keeps drawing current_data
+        if self.start_task(MODEL_TASK, self.train_all_models, (self.current_data.copy(),),
+                           self.on_models_trained, "Training error"):
             self.status_label.setText("Training models...")
-            self.log_text.append(f"[{datetime.now().strftime('%H:%M:%S')}] Starting model training...")
-            
-            # Prepare features
-            X, y = self.ml_models.prepare_features(self.current_data)
-            
-            # Train models
-            lr_accuracy = self.ml_models.train_logistic_regression(X, y)
-            xgb_accuracy = self.ml_models.train_xgboost(X, y)
-            lstm_accuracy = self.ml_models.train_lstm(self.current_data)
-            
-            # Save performance metrics for feedback loop
-            self.ml_models.save_performance_metrics('logistic', {'accuracy': lr_accuracy})
-            self.ml_models.save_performance_metrics('xgboost', {'accuracy': xgb_accuracy})
-            self.ml_models.save_performance_metrics('lstm', {'accuracy': lstm_accuracy})
-            
-            self.status_label.setText("Models trained successfully")
-            self.log_text.append(
-                f"[{datetime.now().strftime('%H:%M:%S')}] Training complete - "
-                f"LR: {lr_accuracy:.3f}, XGB: {xgb_accuracy:.3f}, LSTM: {lstm_accuracy:.3f}"
-            )
-            
-        except Exception as e:
-            self.status_label.setText(f"Training error: {str(e)}")
-            self.log_text.append(f"[{datetime.now().strftime('%H:%M:%S')}] Training error: {str(e)}")
+            self.log_event("Starting model training...")
+    
+    @perf.profiled('train_models')
+    def train_all_models(self, data: pd.DataFrame) -> Tuple[float, float, float]:
+        """
+        Train every model on data and record their metrics
+        
+        Runs on a worker thread.
+        
+        Returns:
+            Tuple of logistic, XGBoost and LSTM accuracies
+        """
+        # Prepare features
+        X, y = self.ml_models.prepare_features(data)
+        
+        # Train models
+        lr_accuracy = self.ml_models.train_logistic_regression(X, y)
+        xgb_accuracy = self.ml_models.train_xgboost(X, y)
+        lstm_accuracy = self.ml_models.train_lstm(data)
+        
+        # Save performance metrics for feedback loop
+        self.ml_models.save_performance_metrics('logistic', {'accuracy': lr_accuracy})
+        self.ml_models.save_performance_metrics('xgboost', {'accuracy': xgb_accuracy})
+        self.ml_models.save_performance_metrics('lstm', {'accuracy': lstm_accuracy})
+        
+        return lr_accuracy, xgb_accuracy, lstm_accuracy
+    
+    def on_models_trained(self, accuracies: Tuple[float, float, float]):
+        """Report finished model training"""
+        lr_accuracy, xgb_accuracy, lstm_accuracy = accuracies
+        self.status_label.setText("Models trained successfully")
+        self.log_event(
+            f"Training complete - "
+            f"LR: {lr_accuracy:.3f}, XGB: {xgb_accuracy:.3f}, LSTM: {lstm_accuracy:.3f}"
+        )
     
     def run_feedback_loop_cycle(self):
         """Execute a feedback loop training cycle"""
-        try:
+        # Get current coin selection
+        coin = self.coin_combo.currentText()
+        days = self.days_spinbox.value()
+        
+        # Execute training cycle in the model task slot, so it never retrains
+        # the models while a training or prediction task is using them
+        if self.start_task(MODEL_TASK, self.feedback_loop.execute_training_cycle, (coin, days),
+                           self.on_feedback_cycle_done, "Feedback loop error"):
             self.status_label.setText("Running feedback loop training cycle...")
-            self.log_text.append(f"[{datetime.now().strftime('%H:%M:%S')}] Starting feedback loop cycle...")
-            
-            # Get current coin selection
-            coin = self.coin_combo.currentText()
-            days = self.days_spinbox.value()
-            
-            # Execute training cycle
-            result = self.feedback_loop.execute_training_cycle(coin, days)
-            
-            if result['status'] == 'success':
-                self.log_text.append(
-                    f"[{datetime.now().strftime('%H:%M:%S')}] Feedback loop cycle complete: "
-                    f"{len(result.get('results', {}))} tier(s) trained"
-                )
-                self.status_label.setText("Feedback loop cycle complete")
-            elif result['status'] == 'no_action':
-                self.log_text.append(
-                    f"[{datetime.now().strftime('%H:%M:%S')}] No retraining needed: "
-                    f"{result.get('reason', 'thresholds not met')}"
-                )
-                self.status_label.setText("No retraining needed")
-            else:
-                self.log_text.append(
-                    f"[{datetime.now().strftime('%H:%M:%S')}] Feedback loop error: "
-                    f"{result.get('reason', result.get('error', 'unknown'))}"
-                )
-                self.status_label.setText("Feedback loop error")
-                
-        except Exception as e:
-            self.status_label.setText(f"Feedback loop error: {str(e)}")
-            self.log_text.append(f"[{datetime.now().strftime('%H:%M:%S')}] Feedback loop error: {str(e)}")
+            self.log_event("Starting feedback loop cycle...")
+    
+    def on_feedback_cycle_done(self, result: Dict[str, Any]):
+        """Report a finished feedback loop training cycle"""
+        if result['status'] == 'success':
+            self.log_event(
+                f"Feedback loop cycle complete: "
+                f"{len(result.get('results', {}))} tier(s) trained"
+            )
+            self.status_label.setText("Feedback loop cycle complete")
+        elif result['status'] == 'no_action':
+            self.log_event(
+                f"No retraining needed: "
+                f"{result.get('reason', 'thresholds not met')}"
+            )
+            self.status_label.setText("No retraining needed")
+        else:
+            self.log_event(
+                f"Feedback loop error: "
+                f"{result.get('reason', result.get('error', 'unknown'))}"
+            )
+            self.status_label.setText("Feedback loop error")
     
     def show_feedback_loop_status(self):
         """Display feedback loop status"""
@@ -1851,124 +2732,134 @@ class CryptoPredictionApp(QMainWindow):
             self.predictions_text.setText(status_text)
             
         except Exception as e:
-            self.log_text.append(f"[{datetime.now().strftime('%H:%M:%S')}] Error displaying status: {str(e)}")
+            self.log_event(f"Error displaying status: {str(e)}")
     
     def get_predictions(self):
         """Get ML predictions and trading signals"""
         if self.current_data is None:
-            self.log_text.append(f"[{datetime.now().strftime('%H:%M:%S')}] No data available for predictions")
+            self.log_event("No data available for predictions")
             return
-            
-        try:
+        
+        coin_name = self.coin_combo.currentText().replace('-', ' ').title()
+        with_claude = self.claude_analyzer is not None and self.claude_analyzer.is_available()
+        
+        if self.start_task(MODEL_TASK, self.compute_predictions,
+                           (self.current_data.copy(), coin_name, with_claude),
+                           self.on_predictions_ready, "Prediction error"):
             self.status_label.setText("Generating predictions...")
-            
-            # Prepare latest features
-            X, _ = self.ml_models.prepare_features(self.current_data)
-            
-            if len(X) > 0:
-                # Get ensemble prediction
-                self.predictions = self.ml_models.get_ensemble_prediction(X[-10:])  # Last 10 samples
+            if with_claude:
+                self.log_event("Generating Claude AI insights...")
+    
+    @perf.profiled('get_predictions')
+    def compute_predictions(self, data: pd.DataFrame, coin_name: str,
+                            with_claude: bool) -> Optional[Dict[str, Any]]:
+        """
+        Run the ensemble, plus Claude analysis when requested, on the latest data
+        
+        Runs on a worker thread.
+        
+        Returns:
+            Dictionary with the predictions and log messages for the GUI, or
+            None if there are no feature rows
+        """
+        # Prepare latest features
+        X, _ = self.ml_models.prepare_features(data)
+        
+        if len(X) == 0:
+            return None
+        
+        # Get ensemble prediction
+        predictions = self.ml_models.get_ensemble_prediction(X[-10:])  # Last 10 samples
+        messages = []
+        
+        # Add Claude AI analysis if available
+        if with_claude:
+            try:
+                # Prepare data for Claude
+                latest_data = data.iloc[-1]
                 
-                # Add Claude AI analysis if available
-                if self.claude_analyzer and self.claude_analyzer.is_available():
-                    self.status_label.setText("Generating AI analysis...")
-                    self.log_text.append(f"[{datetime.now().strftime('%H:%M:%S')}] Generating Claude AI insights...")
-                    
-                    try:
-                        # Prepare data for Claude
-                        latest_data = self.current_data.iloc[-1]
-                        coin_name = self.coin_combo.currentText().replace('-', ' ').title()
-                        
-                        tech_indicators = {
-                            'rsi': latest_data.get('rsi', None) if 'rsi' in self.current_data.columns else None,
-                            'macd': latest_data.get('macd', None) if 'macd' in self.current_data.columns else None,
-                            'sma_7': latest_data.get('sma_7', None) if 'sma_7' in self.current_data.columns else None,
-                            'sma_25': latest_data.get('sma_25', None) if 'sma_25' in self.current_data.columns else None,
-                            'volatility': latest_data.get('volatility', None) if 'volatility' in self.current_data.columns else None,
-                            'volume': latest_data.get('volume', None) if 'volume' in self.current_data.columns else None
-                        }
-                        
-                        # Get Fear & Greed Index if available
-                        fear_greed = None
-                        try:
-                            fg_data = self.data_fetcher.fetch_fear_greed_index()
-                            if fg_data:
-                                fear_greed = fg_data.get('value')
-                        except:
-                            pass
-                        
-                        # Get Claude analysis
-                        claude_result = self.claude_analyzer.analyze_market_data(
-                            coin_name=coin_name,
-                            current_price=latest_data['price'],
-                            price_change_24h=latest_data.get('price_change_24h', 0) if 'price_change_24h' in self.current_data.columns else 0,
-                            technical_indicators=tech_indicators,
-                            ml_predictions={'signal': self.predictions.get('signal', 'HOLD'), 
-                                          'confidence': self.predictions.get('ensemble', 0.5)},
-                            fear_greed_index=fear_greed
-                        )
-                        
-                        self.predictions['claude_analysis'] = claude_result
-                        self.log_text.append(f"[{datetime.now().strftime('%H:%M:%S')}] Claude AI analysis completed")
-                        
-                    except Exception as e:
-                        logger.error(f"Error generating Claude analysis: {e}")
-                        self.log_text.append(f"[{datetime.now().strftime('%H:%M:%S')}] Claude analysis error: {str(e)}")
+                tech_indicators = {
+                    'rsi': latest_data.get('rsi', None) if 'rsi' in data.columns else None,
+                    'macd': latest_data.get('macd', None) if 'macd' in data.columns else None,
+                    'sma_7': latest_data.get('sma_7', None) if 'sma_7' in data.columns else None,
+                    'sma_25': latest_data.get('sma_25', None) if 'sma_25' in data.columns else None,
+                    'volatility': latest_data.get('volatility', None) if 'volatility' in data.columns else None,
+                    'volume': latest_data.get('volume', None) if 'volume' in data.columns else None
+                }
                 
-                # Update predictions display
-                self.update_predictions_display()
+                # Get Fear & Greed Index if available
+                fear_greed = None
+                try:
+                    fg_data = self.data_fetcher.fetch_fear_greed_index()
+                    if fg_data:
+                        fear_greed = fg_data.get('value')
+                except:
+                    pass
                 
-                self.status_label.setText("Predictions updated")
-                self.log_text.append(
-                    f"[{datetime.now().strftime('%H:%M:%S')}] Predictions: "
-                    f"Signal={self.predictions.get('signal', 'HOLD')}, "
-                    f"Confidence={self.predictions.get('ensemble', 0.5):.3f}"
+                # Get Claude analysis
+                claude_result = self.claude_analyzer.analyze_market_data(
+                    coin_name=coin_name,
+                    current_price=latest_data['price'],
+                    price_change_24h=latest_data.get('price_change_24h', 0) if 'price_change_24h' in data.columns else 0,
+                    technical_indicators=tech_indicators,
+                    ml_predictions={'signal': predictions.get('signal', 'HOLD'), 
+                                  'confidence': predictions.get('ensemble', 0.5)},
+                    fear_greed_index=fear_greed
                 )
                 
-                # Auto-trade if enabled
-                if self.auto_trade_checkbox.isChecked():
-                    self.execute_auto_trade()
-            
-        except Exception as e:
-            self.status_label.setText(f"Prediction error: {str(e)}")
-            self.log_text.append(f"[{datetime.now().strftime('%H:%M:%S')}] Prediction error: {str(e)}")
+                predictions['claude_analysis'] = claude_result
+                messages.append("Claude AI analysis completed")
+                
+            except Exception as e:
+                logger.error(f"Error generating Claude analysis: {e}")
+                messages.append(f"Claude analysis error: {str(e)}")
+        
+        return {'predictions': predictions, 'messages': messages}
+    
+    def on_predictions_ready(self, result: Optional[Dict[str, Any]]):
+        """Show new predictions and auto-trade on them if enabled"""
+        if result is None:
+            return
+        
+        for message in result['messages']:
+            self.log_event(f"{message}")
+        
+        self.predictions = result['predictions']
+        
+        # Update predictions display
+        self.update_predictions_display()
+        
+        self.status_label.setText("Predictions updated")
+        self.log_event(
+            f"Predictions: "
+            f"Signal={self.predictions.get('signal', 'HOLD')}, "
+            f"Confidence={self.predictions.get('ensemble', 0.5):.3f}"
+        )
+        
+        # Auto-trade if enabled
+        if self.auto_trade_checkbox.isChecked():
+            self.execute_auto_trade()
     
     def update_predictions_display(self):
         """Update the predictions display"""
         if not self.predictions:
             return
-            
-        display_text = f"""
-CRYPTOCURRENCY PREDICTIONS & TRADING SIGNALS
-===========================================
-
-Current Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-Cryptocurrency: {self.coin_combo.currentText().title()}
-
-ML MODEL PREDICTIONS:
---------------------
-Logistic Regression: {self.predictions.get('logistic', 'N/A'):.4f}
-XGBoost: {self.predictions.get('xgboost', 'N/A'):.4f}
-LSTM: {self.predictions.get('lstm', 'N/A'):.4f}
-
-ENSEMBLE PREDICTION:
--------------------
-Confidence Score: {self.predictions.get('ensemble', 0.5):.4f}
-Trading Signal: {self.predictions.get('signal', 'HOLD')}
-
-SIGNAL INTERPRETATION:
----------------------
-BUY: High confidence upward price movement expected
-SELL: High confidence downward price movement expected  
-HOLD: Uncertain market conditions, maintain current position
-"""
-
+        
+        labels = self.prediction_labels
+        labels['time'].setText(datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+        labels['coin'].setText(self.coin_combo.currentText().title())
+        for key in ENSEMBLE_COLUMNS:
+            value = self.predictions.get(key)
+            labels[key].setText(f"{value:.4f}" if value is not None else "N/A")
+        labels['signal'].setText(self.predictions.get('signal', 'HOLD'))
+        
         # Add Claude AI Analysis if available
-        if 'claude_analysis' in self.predictions:
-            claude = self.predictions['claude_analysis']
-            display_text += f"""
-{'='*43}
-CLAUDE OPUS 4.1 AI ANALYSIS
+        if 'claude_analysis' not in self.predictions:
+            self.predictions_text.clear()
+            return
+        
+        claude = self.predictions['claude_analysis']
+        display_text = f"""CLAUDE OPUS 4.1 AI ANALYSIS
 {'='*43}
 
 MARKET ANALYSIS:
@@ -1980,21 +2871,12 @@ RECOMMENDATION:
 RISK ASSESSMENT:
 {claude.get('risk_assessment', 'Not available')}
 """
-            # Add key insights if available
-            insights = claude.get('key_insights', [])
-            if insights:
-                display_text += "\nKEY INSIGHTS:\n"
-                for i, insight in enumerate(insights, 1):
-                    display_text += f"{i}. {insight}\n"
-
-        display_text += f"""
-{'='*43}
-RISK DISCLAIMER:
----------------
-These predictions are based on historical data and technical indicators.
-They are NOT guaranteed and should not be used as the sole basis for
-trading decisions. Always conduct your own research.
-        """
+        # Add key insights if available
+        insights = claude.get('key_insights', [])
+        if insights:
+            display_text += "\nKEY INSIGHTS:\n"
+            for i, insight in enumerate(insights, 1):
+                display_text += f"{i}. {insight}\n"
         
         self.predictions_text.setText(display_text)
     
@@ -2008,45 +2890,72 @@ trading decisions. Always conduct your own research.
         
         if success:
             self.status_label.setText("Exchange connected")
-            self.log_text.append(f"[{datetime.now().strftime('%H:%M:%S')}] Exchange connected successfully")
+            self.log_event("Exchange connected successfully")
         else:
             self.status_label.setText("Exchange connection failed")
-            self.log_text.append(f"[{datetime.now().strftime('%H:%M:%S')}] Exchange connection failed")
+            self.log_event("Exchange connection failed")
     
     def execute_manual_trade(self):
         """Execute a manual trade based on current signal"""
         if not self.predictions:
-            self.log_text.append(f"[{datetime.now().strftime('%H:%M:%S')}] No predictions available")
+            self.log_event("No predictions available")
             return
-            
-        coin_symbol = self.coin_combo.currentText().upper()
-        if coin_symbol == 'BITCOIN':
-            symbol = 'BTC/USDT'
-        elif coin_symbol == 'ETHEREUM':
-            symbol = 'ETH/USDT'
-        else:
-            symbol = f'{coin_symbol[:3]}/USDT'
         
         signal = self.predictions.get('signal', 'HOLD')
+        if signal == 'HOLD':
+            self.log_event("Signal is HOLD - no trade placed")
+            return
         
-        result = self.trading_engine.execute_trade(symbol, signal)
-        
-        self.log_text.append(
-            f"[{datetime.now().strftime('%H:%M:%S')}] Trade executed: "
-            f"{signal} {symbol} - Status: {result.get('status', 'unknown')}"
-        )
-        
-        self.update_trading_history()
+        self.place_trade(signal)
     
     def execute_auto_trade(self):
         """Execute automatic trading based on ML signals"""
         if not self.predictions:
             return
-            
-        # Only trade if confidence is high enough
+        
+        # Only trade if confidence is high enough: scores inside 0.3-0.7 are
+        # too close to a coin flip
         confidence = self.predictions.get('ensemble', 0.5)
-        if confidence < 0.3 or confidence > 0.7:  # High confidence threshold
-            self.execute_manual_trade()
+        if 0.3 <= confidence <= 0.7:
+            return
+        
+        signal = self.predictions.get('signal', 'HOLD')
+        if signal != 'HOLD':
+            self.place_trade(signal)
+    
+    def place_trade(self, signal: str):
+        """
+        Send a trade for the selected coin on a background task
+        
+        Args:
+            signal: Trading signal ('BUY', 'SELL', 'HOLD')
+        """
+        coin_id = self.coin_combo.currentText().lower()
+        symbol = SYMBOL_MAP.get(coin_id) or f'{coin_id[:3].upper()}/USDT'
+        
+        self.start_task('trade', self.run_trade, (symbol, signal), self.on_trade_done, "Trade error")
+    
+    def run_trade(self, symbol: str, signal: str) -> Tuple[str, str, Dict[str, Any]]:
+        """
+        Execute a trade through the trading engine
+        
+        Runs on a worker thread.
+        
+        Returns:
+            Tuple of symbol, signal and the engine's trade result
+        """
+        return symbol, signal, self.trading_engine.execute_trade(symbol, signal)
+    
+    def on_trade_done(self, outcome: Tuple[str, str, Dict[str, Any]]):
+        """Log a finished trade and refresh the trade views"""
+        symbol, signal, result = outcome
+        self.log_event(
+            f"Trade executed: "
+            f"{signal} {symbol} - Status: {result.get('status', 'unknown')}"
+        )
+        
+        self.update_trading_history()
+        self.schedule_status_update()
     
     def create_wallets(self):
         """Create cryptocurrency wallets"""
@@ -2076,23 +2985,23 @@ trading decisions. Always conduct your own research.
             self.wallet_info_text.setText(info_text)
             
             self.status_label.setText("Wallets created")
-            self.log_text.append(f"[{datetime.now().strftime('%H:%M:%S')}] Wallets created successfully")
+            self.log_event("Wallets created successfully")
             
         except Exception as e:
             self.status_label.setText(f"Wallet error: {str(e)}")
-            self.log_text.append(f"[{datetime.now().strftime('%H:%M:%S')}] Wallet error: {str(e)}")
+            self.log_event(f"Wallet error: {str(e)}")
     
     def update_trading_history(self):
-        """Update the trading history table"""
-        trades = self.trading_engine.get_trade_history()
+        """Append trades logged since the last update to the trading history table"""
+        new_trades = self.trading_engine.get_trade_history(self.rendered_trades)
+        if not new_trades:
+            return
         
-        self.trading_table.setRowCount(len(trades))
-        self.trading_table.setColumnCount(6)
-        self.trading_table.setHorizontalHeaderLabels([
-            'Timestamp', 'Symbol', 'Signal', 'Price', 'Amount', 'Status'
-        ])
+        first_row = self.rendered_trades
+        self.trading_table.setUpdatesEnabled(False)
+        self.trading_table.setRowCount(first_row + len(new_trades))
         
-        for i, trade in enumerate(trades):
+        for i, trade in enumerate(new_trades, first_row):
             self.trading_table.setItem(i, 0, QTableWidgetItem(trade['timestamp'].strftime('%Y-%m-%d %H:%M:%S')))
             self.trading_table.setItem(i, 1, QTableWidgetItem(trade['symbol']))
             self.trading_table.setItem(i, 2, QTableWidgetItem(trade['signal']))
@@ -2100,21 +3009,43 @@ trading decisions. Always conduct your own research.
             self.trading_table.setItem(i, 4, QTableWidgetItem(f"{trade['amount']:.6f}"))
             self.trading_table.setItem(i, 5, QTableWidgetItem(trade['status']))
         
-        self.trading_table.resizeColumnsToContents()
+        self.rendered_trades = first_row + len(new_trades)
+        
+        # Resizing measures every cell, so only do it for the first rows and
+        # then once per TRADE_TABLE_RESIZE_INTERVAL trades
+        if first_row == 0 or first_row // TRADE_TABLE_RESIZE_INTERVAL != self.rendered_trades // TRADE_TABLE_RESIZE_INTERVAL:
+            self.trading_table.resizeColumnsToContents()
+        self.trading_table.setUpdatesEnabled(True)
     
     def auto_refresh(self):
         """Auto-refresh data periodically"""
         if self.current_data is not None:  # Only refresh if we have data
             self.refresh_data()
     
+    def schedule_status_update(self):
+        """
+        Queue an update_status call for the next event loop pass
+        
+        Called from the code paths that change trades or data instead of
+        polling on a timer; several changes in one pass share one update.
+        """
+        if not self.status_dirty:
+            self.status_dirty = True
+            QTimer.singleShot(0, self.update_status)
+    
     def update_status(self):
         """Update status information"""
-        # Update portfolio performance if we have trades
-        trades = self.trading_engine.get_trade_history()
-        if trades:
+        self.status_dirty = False
+        
+        # Update portfolio performance if we have trades; the figures only
+        # change when a trade lands, so unchanged ones are not logged again
+        if self.trading_engine.trade_count:
             performance = self.trading_engine.calculate_portfolio_performance()
-            self.log_text.append(
-                f"[{datetime.now().strftime('%H:%M:%S')}] Portfolio: "
+            if performance == self.last_logged_performance:
+                return
+            self.last_logged_performance = performance
+            self.log_event(
+                f"Portfolio: "
                 f"Return={performance['total_return']:.2%}, "
                 f"Win Rate={performance['win_rate']:.2%}, "
                 f"Trades={performance['total_trades']}"
@@ -2129,11 +3060,11 @@ trading decisions. Always conduct your own research.
                 return
             
             self.status_label.setText("Searching...")
-            self.log_text.append(f"[{datetime.now().strftime('%H:%M:%S')}] Searching for: {query}")
+            self.log_event(f"Searching for: {query}")
             
             # Search using CoinGecko API
             url = "https://api.coingecko.com/api/v3/search"
-            response = requests.get(url, params={'query': query}, timeout=10)
+            response = self.http_session.get(url, params={'query': query}, timeout=10)
             response.raise_for_status()
             
             data = response.json()
@@ -2186,7 +3117,7 @@ trading decisions. Always conduct your own research.
             
         except Exception as e:
             self.status_label.setText(f"Search error: {str(e)}")
-            self.log_text.append(f"[{datetime.now().strftime('%H:%M:%S')}] Search error: {str(e)}")
+            self.log_event(f"Search error: {str(e)}")
             QMessageBox.critical(self, "Search Error", f"Failed to search: {str(e)}")
     
     def select_crypto_from_search(self, coin_id, dialog):
@@ -2199,7 +3130,7 @@ trading decisions. Always conduct your own research.
                 index = self.coin_combo.count() - 1
             
             self.coin_combo.setCurrentIndex(index)
-            self.log_text.append(f"[{datetime.now().strftime('%H:%M:%S')}] Selected: {coin_id}")
+            self.log_event(f"Selected: {coin_id}")
             dialog.accept()
     
     def add_to_watchlist(self):
@@ -2211,7 +3142,7 @@ trading decisions. Always conduct your own research.
                 return
             
             self.status_label.setText("Adding to watchlist...")
-            self.log_text.append(f"[{datetime.now().strftime('%H:%M:%S')}] Adding {coin_id} to watchlist...")
+            self.log_event(f"Adding {coin_id} to watchlist...")
             
             # Get coin info from CoinGecko
             url = f"https://api.coingecko.com/api/v3/coins/{coin_id}"
@@ -2222,7 +3153,7 @@ trading decisions. Always conduct your own research.
                 'community_data': 'false',
                 'developer_data': 'false'
             }
-            response = requests.get(url, params=params, timeout=10)
+            response = self.http_session.get(url, params=params, timeout=10)
             response.raise_for_status()
             
             data = response.json()
@@ -2242,12 +3173,12 @@ trading decisions. Always conduct your own research.
                     'added_at': datetime.now().isoformat()
                 }
                 self.status_label.setText(f"Added {coin_name} to watchlist")
-                self.log_text.append(f"[{datetime.now().strftime('%H:%M:%S')}] Added {coin_name} to watchlist")
+                self.log_event(f"Added {coin_name} to watchlist")
                 QMessageBox.information(self, "Watchlist", f"{coin_name} added to watchlist successfully!")
             
         except Exception as e:
             self.status_label.setText(f"Error: {str(e)}")
-            self.log_text.append(f"[{datetime.now().strftime('%H:%M:%S')}] Watchlist error: {str(e)}")
+            self.log_event(f"Watchlist error: {str(e)}")
             QMessageBox.critical(self, "Error", f"Failed to add to watchlist: {str(e)}")
     
     def view_watchlist(self):
@@ -2258,7 +3189,7 @@ trading decisions. Always conduct your own research.
                 return
             
             self.status_label.setText("Loading watchlist...")
-            self.log_text.append(f"[{datetime.now().strftime('%H:%M:%S')}] Loading watchlist...")
+            self.log_event("Loading watchlist...")
             
             # Fetch current prices for all watchlist items
             coin_ids = ','.join(self.watchlist.keys())
@@ -2270,7 +3201,7 @@ trading decisions. Always conduct your own research.
                 'include_market_cap': 'true'
             }
             
-            response = requests.get(url, params=params, timeout=10)
+            response = self.http_session.get(url, params=params, timeout=10)
             response.raise_for_status()
             prices_data = response.json()
             
@@ -2366,7 +3297,7 @@ trading decisions. Always conduct your own research.
             
         except Exception as e:
             self.status_label.setText(f"Error: {str(e)}")
-            self.log_text.append(f"[{datetime.now().strftime('%H:%M:%S')}] Watchlist error: {str(e)}")
+            self.log_event(f"Watchlist error: {str(e)}")
             QMessageBox.critical(self, "Error", f"Failed to load watchlist: {str(e)}")
     
     def load_from_watchlist(self, coin_id, dialog):
@@ -2378,7 +3309,7 @@ trading decisions. Always conduct your own research.
             index = self.coin_combo.count() - 1
         
         self.coin_combo.setCurrentIndex(index)
-        self.log_text.append(f"[{datetime.now().strftime('%H:%M:%S')}] Loaded: {coin_id}")
+        self.log_event(f"Loaded: {coin_id}")
         dialog.accept()
     
     def remove_from_watchlist(self, coin_id, dialog):
@@ -2395,7 +3326,7 @@ trading decisions. Always conduct your own research.
             
             if reply == QMessageBox.Yes:
                 del self.watchlist[coin_id]
-                self.log_text.append(f"[{datetime.now().strftime('%H:%M:%S')}] Removed {coin_name} from watchlist")
+                self.log_event(f"Removed {coin_name} from watchlist")
                 dialog.accept()
                 # Reopen the dialog to show updated list
                 self.view_watchlist()
@@ -2445,7 +3376,11 @@ def main():
     logger.info("Cryptocurrency Trading & Prediction Tool started successfully")
     
     # Run application
-    sys.exit(app.exec_())
+    exit_code = app.exec_()
+    window.trading_engine.close()
+    if perf.enabled:
+        perf.report()
+    sys.exit(exit_code)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -9,8 +9,10 @@ through the Model Context Protocol, enabling AI-powered trading analysis.
 import json
 import logging
 import asyncio
-from typing import Any, Dict, List, Optional
+import time
+from typing import Any, Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass
+from urllib.parse import urlencode
 import os
 
 # Check if mcp package is available
@@ -28,12 +30,32 @@ except ImportError:
     MCP_AVAILABLE = False
     print("MCP package not available. Install with: pip install mcp")
 
-import requests
+import aiohttp
+
+# Fast JSON encoding for tool results (optional)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
 
+def dumps(obj: Any) -> str:
+    """Serialize to compact JSON text, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(",", ":"))
+
+
+# Tool response cache lifetimes in seconds
+PRICE_CACHE_TTL = 60
+HISTORY_CACHE_TTL = 600
+MARKET_OVERVIEW_CACHE_TTL = 60
+
+
 @dataclass
 class CryptoAPIConfig:
     """Configuration for cryptocurrency API"""
@@ -49,6 +71,12 @@ class CryptoMCPServer:
         if not MCP_AVAILABLE:
             raise ImportError("MCP package not installed. Install with: pip install mcp")
         self.server = Server("letsgetcrypto")
+        # Shared HTTP session, created on first use inside the event loop
+        self._session: Optional[aiohttp.ClientSession] = None
+        # Cached API responses as (expiry, document), keyed by path and query
+        self._cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        # Fetches currently running, keyed like _cache, shared by all waiters
+        self._inflight: Dict[str, asyncio.Task] = {}
         self.setup_tools()
     
     def setup_tools(self):
@@ -57,31 +85,34 @@ class CryptoMCPServer:
         @self.server.list_tools()
         async def list_tools() -> List[Tool]:
             """List all available cryptocurrency tools"""
+            # One symbol, or several to be fetched concurrently
+            symbol_schema = {
+                "oneOf": [
+                    {"type": "string"},
+                    {"type": "array", "items": {"type": "string"}}
+                ],
+                "description": "Cryptocurrency symbol (e.g., 'bitcoin', 'ethereum') "
+                               "or a list of symbols"
+            }
             return [
                 Tool(
                     name="get_crypto_price",
-                    description="Get current price and market data for a cryptocurrency",
+                    description="Get current price and market data for one or more cryptocurrencies",
                     inputSchema={
                         "type": "object",
                         "properties": {
-                            "symbol": {
-                                "type": "string",
-                                "description": "Cryptocurrency symbol (e.g., 'bitcoin', 'ethereum')"
-                            }
+                            "symbol": symbol_schema
                         },
                         "required": ["symbol"]
                     }
                 ),
                 Tool(
                     name="get_crypto_history",
-                    description="Get historical price data for a cryptocurrency",
+                    description="Get historical price data for one or more cryptocurrencies",
                     inputSchema={
                         "type": "object",
                         "properties": {
-                            "symbol": {
-                                "type": "string",
-                                "description": "Cryptocurrency symbol (e.g., 'bitcoin', 'ethereum')"
-                            },
+                            "symbol": symbol_schema,
                             "days": {
                                 "type": "integer",
                                 "description": "Number of days of historical data (1-365)",
@@ -120,10 +151,14 @@ class CryptoMCPServer:
             """Execute a tool and return results"""
             try:
                 if name == "get_crypto_price":
-                    result = await self._get_crypto_price(arguments["symbol"])
+                    result = await self._for_symbols(
+                        arguments["symbol"],
+                        self._get_crypto_price
+                    )
                 elif name == "get_crypto_history":
-                    result = await self._get_crypto_history(
+                    result = await self._for_symbols(
                         arguments["symbol"],
+                        self._get_crypto_history,
                         arguments.get("days", 30)
                     )
                 elif name == "get_market_overview":
@@ -140,7 +175,7 @@ class CryptoMCPServer:
                 
                 return [TextContent(
                     type="text",
-                    text=json.dumps(result, indent=2)
+                    text=dumps(result)
                 )]
             except Exception as e:
                 logger.error(f"Error executing tool {name}: {e}")
@@ -149,44 +184,106 @@ class CryptoMCPServer:
                     text=f"Error: {str(e)}"
                 )]
     
+    async def _get_json(self, path: str, params: Optional[Dict[str, Any]] = None,
+                        ttl: float = 0) -> Dict[str, Any]:
+        """
+        GET a JSON document from the crypto API, optionally through the cache
+        
+        With a ttl, the document is cached for that many seconds and
+        concurrent requests for it share one upstream fetch. Failed requests
+        are never cached.
+        """
+        if not ttl:
+            return await self._fetch_json(path, params)
+        
+        key = f"{path}?{urlencode(sorted(params.items()))}" if params else path
+        entry = self._cache.get(key)
+        if entry is not None and time.monotonic() < entry[0]:
+            return entry[1]
+        
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._refresh(key, ttl, path, params))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shield the shared task so one cancelled waiter doesn't cancel the
+        # fetch for everyone else
+        return await asyncio.shield(task)
+    
+    async def _refresh(self, key: str, ttl: float, path: str,
+                       params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Fetch a fresh document and store it in the cache"""
+        value = await self._fetch_json(path, params)
+        self._cache[key] = (time.monotonic() + ttl, value)
+        return value
+    
+    async def _fetch_json(self, path: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """GET a JSON document from the crypto API without blocking the event loop"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.config.timeout)
+            )
+        async with self._session.get(f"{self.config.base_url}{path}", params=params) as response:
+            response.raise_for_status()
+            return await response.json()
+    
+    async def _for_symbols(self, symbols: Union[str, List[str]], fetch, *args) -> Dict[str, Any]:
+        """
+        Run fetch(symbol, *args) for one symbol, or for a list concurrently
+        
+        A list gives a dict keyed by symbol; a symbol whose request failed
+        maps to {"error": ...} instead of failing the whole batch.
+        """
+        if isinstance(symbols, str):
+            return await fetch(symbols, *args)
+        
+        symbols = list(dict.fromkeys(symbols))
+        results = await asyncio.gather(
+            *(fetch(symbol, *args) for symbol in symbols),
+            return_exceptions=True
+        )
+        return {
+            symbol: {"error": str(result)} if isinstance(result, Exception) else result
+            for symbol, result in zip(symbols, results)
+        }
+    
     async def _get_crypto_price(self, symbol: str) -> Dict[str, Any]:
         """Get current cryptocurrency price"""
-        url = f"{self.config.base_url}/api/price/{symbol}/"
-        response = requests.get(url, timeout=self.config.timeout)
-        response.raise_for_status()
-        return response.json()
+        return await self._get_json(f"/api/price/{symbol}/", ttl=PRICE_CACHE_TTL)
     
     async def _get_crypto_history(self, symbol: str, days: int = 30) -> Dict[str, Any]:
         """Get historical cryptocurrency data"""
-        url = f"{self.config.base_url}/api/history/{symbol}/"
-        params = {"days": min(days, 365)}
-        response = requests.get(url, params=params, timeout=self.config.timeout)
-        response.raise_for_status()
-        return response.json()
+        return await self._get_json(
+            f"/api/history/{symbol}/", {"days": min(days, 365)}, ttl=HISTORY_CACHE_TTL
+        )
     
     async def _get_market_overview(self, limit: int = 10) -> Dict[str, Any]:
         """Get market overview"""
-        url = f"{self.config.base_url}/api/market/"
-        params = {"limit": min(limit, 50)}
-        response = requests.get(url, params=params, timeout=self.config.timeout)
-        response.raise_for_status()
-        return response.json()
+        return await self._get_json(
+            "/api/market/", {"limit": min(limit, 50)}, ttl=MARKET_OVERVIEW_CACHE_TTL
+        )
     
     async def _check_api_health(self) -> Dict[str, Any]:
         """Check API health"""
-        url = f"{self.config.base_url}/api/health/"
-        response = requests.get(url, timeout=self.config.timeout)
-        response.raise_for_status()
-        return response.json()
+        return await self._get_json("/api/health/")
+    
+    async def close(self):
+        """Close the shared HTTP session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
     
     async def run(self):
         """Run the MCP server"""
-        async with stdio_server() as (read_stream, write_stream):
-            await self.server.run(
-                read_stream,
-                write_stream,
-                self.server.create_initialization_options()
-            )
+        try:
+            async with stdio_server() as (read_stream, write_stream):
+                await self.server.run(
+                    read_stream,
+                    write_stream,
+                    self.server.create_initialization_options()
+                )
+        finally:
+            await self.close()
 
 
 async def main():
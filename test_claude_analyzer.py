@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Test suite for batched Claude market analysis
+"""
+
+import sys
+import os
+import unittest
+from unittest.mock import MagicMock, patch
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# Import required classes
+import claude_analyzer
+from claude_analyzer import ClaudeAnalyzer, BATCH_MAX_COINS, BATCH_TOKENS_PER_COIN
+
+
+def make_market(coin_name, price=100.0):
+    """Keyword arguments of analyze_market_data for one coin"""
+    return {
+        'coin_name': coin_name,
+        'current_price': price,
+        'price_change_24h': 1.5,
+        'technical_indicators': {'rsi': 55.0},
+        'ml_predictions': {'signal': 'HOLD'},
+    }
+
+
+def make_message(text):
+    """Fake Anthropic message carrying text"""
+    message = MagicMock()
+    message.content = [MagicMock(text=text)]
+    return message
+
+
+class TestSplitBatchResponse(unittest.TestCase):
+    """Test splitting a batch response into per-coin sections"""
+    
+    def test_markdown_decorated_headers(self):
+        """Test headers wrapped in markdown heading and bold markers"""
+        text = (
+            "Here are the analyses.\n"
+            "## === Bitcoin ===\n"
+            "Bitcoin looks strong.\n"
+            "**=== Ethereum ===**\n"
+            "Ethereum is ranging.\n"
+            "### **=== Solana ===**\n"
+            "Solana is volatile.\n"
+            "=== **Cardano** ===\n"
+            "Cardano is quiet.\n"
+        )
+        
+        sections = ClaudeAnalyzer._split_batch_response(text)
+        
+        self.assertEqual(set(sections), {'bitcoin', 'ethereum', 'solana', 'cardano'})
+        self.assertIn("Bitcoin looks strong.", sections['bitcoin'])
+        self.assertNotIn("Ethereum", sections['bitcoin'])
+        self.assertIn("Solana is volatile.", sections['solana'])
+    
+    def test_text_without_headers(self):
+        """Test a response with no section headers yields no sections"""
+        self.assertEqual(ClaudeAnalyzer._split_batch_response("No sections here."), {})
+
+
+class TestAnalyzeMarketDataBatch(unittest.TestCase):
+    """Test analyze_market_data_batch against a mocked client"""
+    
+    def setUp(self):
+        """Set up an analyzer with a mocked Anthropic client"""
+        patcher = patch.object(claude_analyzer, 'ANTHROPIC_AVAILABLE', True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        
+        self.analyzer = ClaudeAnalyzer(api_key=None)
+        self.analyzer.client = MagicMock()
+    
+    def test_missing_section_gets_placeholder(self):
+        """Test coins absent from the response are reported, not memoized"""
+        self.analyzer.client.messages.create.return_value = make_message(
+            "## === Bitcoin ===\nRECOMMENDATION: BUY\n"
+            "**=== Ethereum ===**\nRECOMMENDATION: HOLD\n"
+        )
+        markets = [make_market('Bitcoin'), make_market('Ethereum'), make_market('Solana')]
+        
+        results = self.analyzer.analyze_market_data_batch(markets)
+        
+        self.assertEqual(len(results), 3)
+        self.assertEqual(results[2]['analysis'], 'Analysis missing from batch response.')
+        self.assertNotEqual(results[0]['analysis'], 'Analysis missing from batch response.')
+        self.assertEqual(self.analyzer.client.messages.create.call_count, 1)
+        
+        # Answered coins are memoized, the missing one is asked for again
+        self.analyzer.analyze_market_data_batch(markets)
+        self.assertEqual(self.analyzer.client.messages.create.call_count, 2)
+        prompt = self.analyzer.client.messages.create.call_args[1]['messages'][0]['content']
+        self.assertIn("Solana", prompt)
+        self.assertNotIn("Bitcoin", prompt)
+    
+    def test_large_batch_is_chunked(self):
+        """Test max_tokens stays bounded by splitting large batches"""
+        markets = [make_market(f"Coin{i}", price=100.0 + i) for i in range(BATCH_MAX_COINS + 2)]
+        self.analyzer.client.messages.create.side_effect = lambda **kwargs: make_message(
+            "\n".join(
+                f"=== {market['coin_name']} ===\nRECOMMENDATION: HOLD"
+                for market in markets
+                if f"=== {market['coin_name']} ===" in kwargs['messages'][0]['content']
+            )
+        )
+        
+        results = self.analyzer.analyze_market_data_batch(markets)
+        
+        calls = self.analyzer.client.messages.create.call_args_list
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(
+            [call[1]['max_tokens'] for call in calls],
+            [BATCH_TOKENS_PER_COIN * BATCH_MAX_COINS, BATCH_TOKENS_PER_COIN * 2]
+        )
+        self.assertTrue(all(
+            result['analysis'] != 'Analysis missing from batch response.' for result in results
+        ))
+    
+    def test_memoized_result_is_not_shared(self):
+        """Test mutating a returned analysis does not change later memo hits"""
+        self.analyzer.client.messages.create.return_value = make_message(
+            "=== Bitcoin ===\nRECOMMENDATION: BUY\n"
+        )
+        
+        first = self.analyzer.analyze_market_data_batch([make_market('Bitcoin')])[0]
+        expected = dict(first, key_insights=list(first['key_insights']))
+        first['analysis'] = 'changed'
+        first['key_insights'].append('changed')
+        
+        second = self.analyzer.analyze_market_data_batch([make_market('Bitcoin')])[0]
+        self.assertEqual(self.analyzer.client.messages.create.call_count, 1)
+        self.assertEqual(second, expected)
+    
+    def test_failed_request_reports_each_coin(self):
+        """Test an API error fills every coin of the batch with an error result"""
+        self.analyzer.client.messages.create.side_effect = RuntimeError("overloaded")
+        
+        results = self.analyzer.analyze_market_data_batch([make_market('Bitcoin'), make_market('Ethereum')])
+        
+        self.assertEqual([result['analysis'] for result in results],
+                         ['Analysis error: overloaded'] * 2)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Test suite for HeadlessCryptoAPI price data and technical indicators
+"""
+
+import sys
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+import numpy as np
+import pandas as pd
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# Import required classes
+import headless_crypto_api
+from headless_crypto_api import HeadlessCryptoAPI, DISKCACHE_AVAILABLE
+
+
+def make_frame(rows, seed=0):
+    """Random-walk price and volume frame like fetch_price_data returns"""
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range('2024-01-01', periods=rows, freq='h')
+    return pd.DataFrame({
+        'price': 100 + np.cumsum(rng.normal(0, 1, rows)),
+        'volume': rng.uniform(1e6, 2e6, rows),
+        'market_cap': rng.uniform(1e9, 2e9, rows)
+    }, index=dates)
+
+
+class TestBasicIndicators(unittest.TestCase):
+    """Test the indicator fallback used without the `ta` library"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.api = HeadlessCryptoAPI(enable_claude=False, disk_cache_dir=None)
+        self.df = make_frame(120)
+    
+    def test_fallback_matches_pandas(self):
+        """Test the fallback keeps the pandas columns and their values"""
+        with patch.object(headless_crypto_api, 'TA_AVAILABLE', False):
+            result = self.api.calculate_technical_indicators(self.df.copy())
+        
+        self.assertEqual(
+            set(result.columns) - set(self.df.columns),
+            {'sma_7', 'sma_25', 'price_change', 'volatility'}
+        )
+        price_change = self.df['price'].pct_change()
+        expected = {
+            'sma_7': self.df['price'].rolling(7).mean(),
+            'sma_25': self.df['price'].rolling(25).mean(),
+            'price_change': price_change,
+            'volatility': price_change.rolling(7).std(),
+        }
+        for column, values in expected.items():
+            np.testing.assert_allclose(result[column].to_numpy(), values.to_numpy(),
+                                       rtol=1e-9, equal_nan=True, err_msg=column)
+
+class TestIndicatorCache(unittest.TestCase):
+    """Test reuse of cached indicator frames"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.api = HeadlessCryptoAPI(enable_claude=False, disk_cache_dir=None)
+        self.df = make_frame(120)
+    
+    def test_same_frame_is_returned(self):
+        """Test the cached frame object is returned without recomputation"""
+        df = self.api.calculate_technical_indicators(self.df.copy(), cache_key='ada:30')
+        
+        with patch.object(self.api, '_compute_indicators') as compute:
+            self.assertIs(self.api.calculate_technical_indicators(df, cache_key='ada:30'), df)
+        compute.assert_not_called()
+    
+    def test_new_frame_is_recomputed(self):
+        """Test a sliding window frame gets a full computation and replaces the entry"""
+        self.api.calculate_technical_indicators(self.df.iloc[:100].copy(), cache_key='btc:30')
+        
+        result = self.api.calculate_technical_indicators(self.df.iloc[20:].copy(), cache_key='btc:30')
+        
+        expected = self.api.calculate_technical_indicators(self.df.iloc[20:].copy())
+        pd.testing.assert_frame_equal(result, expected)
+        self.assertIs(self.api.indicator_cache['btc:30'], result)
+
+@unittest.skipUnless(DISKCACHE_AVAILABLE, "diskcache not installed")
+class TestDiskCache(unittest.TestCase):
+    """Test the opt-in persistent price data cache"""
+    
+    def setUp(self):
+        """Set up a cache directory removed after each test"""
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.cache_dir = tmp.name
+        self.df = make_frame(48)
+    
+    def make_api(self, disk_cache_dir):
+        """API instance whose disk cache is closed at cleanup"""
+        api = HeadlessCryptoAPI(enable_claude=False, disk_cache_dir=disk_cache_dir)
+        if api.disk_cache is not None:
+            self.addCleanup(api.disk_cache.close)
+        return api
+    
+    def test_disabled_without_directory(self):
+        """Test no disk cache is opened unless a directory is given"""
+        self.assertIsNone(self.make_api(None).disk_cache)
+    
+    def test_survives_new_instance(self):
+        """Test a second instance reads prices fetched by the first"""
+        first = self.make_api(self.cache_dir)
+        with patch.object(first, '_get_json', return_value=self.df):
+            first.fetch_price_data('bitcoin', 2)
+        
+        second = self.make_api(self.cache_dir)
+        with patch.object(second, '_get_json') as get_json:
+            result = second.fetch_price_data('bitcoin', 2)
+        
+        get_json.assert_not_called()
+        pd.testing.assert_frame_equal(result, self.df)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
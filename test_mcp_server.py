@@ -162,6 +162,15 @@ def test_mcp_server():
         resource_content = json.loads(response['result']['contents'][0]['text'])
         print(f"   ✓ Server info: {json.dumps(resource_content, indent=6)}")
         
+        # Test 8: Request that is valid JSON but not an object
+        print("\n9. Testing invalid request...")
+        response = send_request(process, [1])
+        assert response['error']['code'] == -32600, response
+        print(f"   ✓ Invalid request rejected: {response['error']['message']}")
+        response = send_request(process, {"jsonrpc": "2.0", "id": 8, "method": "tools/list"})
+        assert response['id'] == 8, response
+        print("   ✓ Server still answering")
+        
         print("\n" + "=" * 60)
         print("✅ All tests passed!")
         print("=" * 60)
@@ -173,7 +182,7 @@ def test_mcp_server():
         return False
     finally:
         # Clean up
-        print("\n9. Shutting down server...")
+        print("\n10. Shutting down server...")
         process.terminate()
         try:
             process.wait(timeout=5)
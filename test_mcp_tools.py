@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Test suite for the MCP server's request helpers: symbol fan-out and response cache
+"""
+
+import sys
+import os
+import asyncio
+import time
+import unittest
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# Import required classes
+from mcp_server import CryptoMCPServer, MCP_AVAILABLE, PRICE_CACHE_TTL
+
+
+class FakeFetch:
+    """Stand-in for CryptoMCPServer._fetch_json counting upstream requests"""
+    
+    def __init__(self, delay=0.0, fail=()):
+        self.calls = []
+        self.delay = delay
+        self.fail = set(fail)
+    
+    async def __call__(self, path, params=None):
+        self.calls.append((path, params))
+        await asyncio.sleep(self.delay)
+        if path in self.fail:
+            raise RuntimeError(f"upstream error for {path}")
+        return {"path": path, "params": params, "call": len(self.calls)}
+
+
+@unittest.skipUnless(MCP_AVAILABLE, "MCP package not installed")
+class TestForSymbols(unittest.IsolatedAsyncioTestCase):
+    """Test _for_symbols fan-out and error mapping"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.server = CryptoMCPServer()
+        self.fetch = FakeFetch(fail={"/api/price/BAD/"})
+        self.server._fetch_json = self.fetch
+    
+    async def test_single_symbol_returns_document(self):
+        """Test a plain string gives the document itself"""
+        result = await self.server._for_symbols("BTC", self.server._get_crypto_price)
+        
+        self.assertEqual(result["path"], "/api/price/BTC/")
+    
+    async def test_list_is_keyed_by_symbol(self):
+        """Test a list gives one entry per distinct symbol"""
+        result = await self.server._for_symbols(
+            ["BTC", "ETH", "BTC"], self.server._get_crypto_history, 7
+        )
+        
+        self.assertEqual(list(result), ["BTC", "ETH"])
+        self.assertEqual(result["ETH"]["params"], {"days": 7})
+        self.assertEqual(len(self.fetch.calls), 2)
+    
+    async def test_failed_symbol_maps_to_error(self):
+        """Test one failing symbol does not fail the whole list"""
+        result = await self.server._for_symbols(["BTC", "BAD"], self.server._get_crypto_price)
+        
+        self.assertEqual(result["BTC"]["path"], "/api/price/BTC/")
+        self.assertEqual(result["BAD"], {"error": "upstream error for /api/price/BAD/"})
+    
+    async def test_single_symbol_error_propagates(self):
+        """Test a plain string request still raises its error"""
+        with self.assertRaises(RuntimeError):
+            await self.server._for_symbols("BAD", self.server._get_crypto_price)
+
+
+@unittest.skipUnless(MCP_AVAILABLE, "MCP package not installed")
+class TestGetJsonCache(unittest.IsolatedAsyncioTestCase):
+    """Test the TTL cache and in-flight sharing in _get_json"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.server = CryptoMCPServer()
+        self.fetch = FakeFetch(delay=0.01, fail={"/api/price/BAD/"})
+        self.server._fetch_json = self.fetch
+    
+    async def test_cached_within_ttl(self):
+        """Test a repeat request within the TTL is served from the cache"""
+        first = await self.server._get_crypto_price("BTC")
+        second = await self.server._get_crypto_price("BTC")
+        
+        self.assertEqual(first, second)
+        self.assertEqual(len(self.fetch.calls), 1)
+    
+    async def test_refetched_after_ttl(self):
+        """Test an expired entry is fetched again"""
+        await self.server._get_crypto_price("BTC")
+        expiry, document = self.server._cache["/api/price/BTC/"]
+        self.assertAlmostEqual(expiry - time.monotonic(), PRICE_CACHE_TTL, delta=1)
+        
+        # Age the entry past its TTL
+        self.server._cache["/api/price/BTC/"] = (time.monotonic() - 1, document)
+        result = await self.server._get_crypto_price("BTC")
+        
+        self.assertEqual(result["call"], 2)
+    
+    async def test_concurrent_requests_share_one_fetch(self):
+        """Test simultaneous requests for one key wait on the same fetch"""
+        results = await asyncio.gather(*(self.server._get_crypto_price("ETH") for _ in range(5)))
+        
+        self.assertEqual(len(self.fetch.calls), 1)
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertEqual(self.server._inflight, {})
+    
+    async def test_params_are_part_of_the_key(self):
+        """Test requests differing only in query parameters are cached apart"""
+        await self.server._get_crypto_history("BTC", 7)
+        await self.server._get_crypto_history("BTC", 30)
+        await self.server._get_crypto_history("BTC", 7)
+        
+        self.assertEqual(len(self.fetch.calls), 2)
+    
+    async def test_failures_are_not_cached(self):
+        """Test a failed fetch is retried by the next request"""
+        for _ in range(2):
+            with self.assertRaises(RuntimeError):
+                await self.server._get_crypto_price("BAD")
+        
+        self.assertEqual(len(self.fetch.calls), 2)
+        self.assertEqual(self.server._cache, {})
+    
+    async def test_uncached_requests_always_fetch(self):
+        """Test requests without a ttl bypass the cache"""
+        await self.server._check_api_health()
+        await self.server._check_api_health()
+        
+        self.assertEqual(len(self.fetch.calls), 2)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Test suite for MLModels training behaviour
+"""
+
+import sys
+import os
+import json
+import unittest
+import pandas as pd
+import numpy as np
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# Import required classes
+from main import MLModels, TENSORFLOW_AVAILABLE
+
+
+@unittest.skipUnless(TENSORFLOW_AVAILABLE, "TensorFlow not installed")
+class TestLSTMRetraining(unittest.TestCase):
+    """Test that the cached LSTM graph keeps learning on retrains"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.ml_models = MLModels()
+        rng = np.random.default_rng(0)
+        dates = pd.date_range(end=pd.Timestamp.now(), periods=120, freq='D')
+        self.df = pd.DataFrame({
+            'price': 100 + np.cumsum(rng.normal(0, 1, 120))
+        }, index=dates)
+    
+    def test_second_training_changes_weights(self):
+        """Test a retrain moves the weights away from their initial values"""
+        self.ml_models.train_lstm(self.df, sequence_length=20)
+        _, model, initial_weights, _ = self.ml_models.lstm_graph
+        
+        self.ml_models.train_lstm(self.df, sequence_length=20)
+        
+        # The retrain reused the cached model, with a learning rate intact
+        self.assertIs(self.ml_models.lstm_graph[1], model)
+        self.assertAlmostEqual(float(np.asarray(model.optimizer.learning_rate)), 0.001, places=6)
+        changed = [
+            not np.allclose(before, after)
+            for before, after in zip(initial_weights, model.get_weights())
+        ]
+        self.assertTrue(any(changed))
+
+class TestXGBoostTraining(unittest.TestCase):
+    """Test XGBoost training on the available device"""
+    
+    def test_trains_with_hist_tree_method(self):
+        """Test training succeeds with tree_method='hist' and a device setting"""
+        ml_models = MLModels()
+        rng = np.random.default_rng(0)
+        X = rng.normal(size=(200, 5))
+        y = (X[:, 0] > 0).astype(int)
+        
+        accuracy = ml_models.train_xgboost(X, y)
+        
+        self.assertGreater(accuracy, 0.5)
+        config = json.loads(ml_models.models['xgboost'].save_config())
+        self.assertIn(config['learner']['generic_param']['device'].split(':')[0], ('cpu', 'cuda'))
+        self.assertEqual(
+            config['learner']['gradient_booster']['gbtree_train_param']['tree_method'], 'hist'
+        )
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
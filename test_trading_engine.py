@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Test suite for TradingEngine bookkeeping
+"""
+
+import sys
+import os
+import asyncio
+import time
+import unittest
+from datetime import datetime, date, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# Import required classes
+import main
+from main import TradingEngine, BALANCE_CACHE_TTL
+
+
+def make_trade(signal, price, amount=1.0, timestamp=None):
+    """Trade record as passed to TradingEngine._log_trade"""
+    return {
+        'timestamp': timestamp or datetime.now(),
+        'symbol': 'BTC/USDT',
+        'signal': signal,
+        'price': price,
+        'amount': amount,
+        'order_id': f"test_{signal}_{price}",
+        'status': 'filled'
+    }
+
+
+def make_exchange():
+    """Fake ccxt exchange filling every market order at 100 USDT"""
+    exchange = MagicMock()
+    exchange.fetch_ticker.return_value = {'last': 100.0}
+    exchange.fetch_balance.side_effect = lambda: {
+        'USDT': {'free': 1000.0}, 'BTC': {'free': 1.0}
+    }
+    order = {'id': 'order-1', 'amount': None, 'filled': 0.5, 'status': 'closed'}
+    exchange.create_market_buy_order.return_value = order
+    exchange.create_market_sell_order.return_value = order
+    return exchange
+
+
+def make_stream_exchange():
+    """Fake ccxt.pro exchange streaming a 100 USDT ticker"""
+    exchange = MagicMock()
+    
+    async def watch_ticker(symbol):
+        await asyncio.sleep(0.01)
+        return {'last': 100.0}
+    
+    exchange.watch_ticker.side_effect = watch_ticker
+    exchange.close = AsyncMock()
+    return exchange
+
+
+class TestTradeLog(unittest.TestCase):
+    """Test the structured-array trade log and its running totals"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.engine = TradingEngine()
+    
+    def test_log_grows_past_initial_capacity(self):
+        """Test trades beyond the preallocated rows are kept in order"""
+        capacity = len(self.engine.trade_log)
+        for i in range(capacity + 10):
+            self.engine._log_trade(make_trade('BUY' if i % 2 == 0 else 'SELL', 100.0 + i))
+        
+        self.assertEqual(self.engine.trade_count, capacity + 10)
+        self.assertGreaterEqual(len(self.engine.trade_log), capacity + 10)
+        
+        history = self.engine.get_trade_history()
+        self.assertEqual(len(history), capacity + 10)
+        self.assertEqual([trade['price'] for trade in history[:3]], [100.0, 101.0, 102.0])
+        self.assertEqual(history[-1]['signal'], 'SELL')
+        self.assertEqual(len(self.engine.get_trade_history(start=capacity)), 10)
+    
+    def test_running_pair_totals(self):
+        """Test the i-th BUY is paired with the i-th SELL as trades arrive"""
+        self.engine._log_trade(make_trade('BUY', 100.0))
+        self.assertEqual(self.engine.calculate_portfolio_performance()['trade_pairs'], 0)
+        
+        self.engine._log_trade(make_trade('SELL', 110.0))   # +10%
+        self.engine._log_trade(make_trade('SELL', 150.0))   # waits for a BUY
+        self.engine._log_trade(make_trade('BUY', 200.0))    # -25%
+        
+        performance = self.engine.calculate_portfolio_performance()
+        self.assertEqual(performance['trade_pairs'], 2)
+        self.assertEqual(performance['total_trades'], 4)
+        self.assertAlmostEqual(performance['total_return'], 0.10 - 0.25)
+        self.assertAlmostEqual(performance['win_rate'], 0.5)
+
+
+class TestDailyTradeLimit(unittest.TestCase):
+    """Test the daily trade counter and batch limit reservation"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        # Live trades must not start ticker streams in tests
+        patcher = patch.object(main, 'CCXT_PRO_AVAILABLE', False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        
+        self.engine = TradingEngine()
+    
+    def test_trades_today_rolls_over(self):
+        """Test trades from an earlier day do not count against today"""
+        yesterday = datetime.now() - timedelta(days=1)
+        for _ in range(3):
+            self.engine._log_trade(make_trade('BUY', 100.0, timestamp=yesterday))
+        self.assertEqual(self.engine.today_date, yesterday.date())
+        self.assertEqual(self.engine.trades_today(), 0)
+        
+        self.engine._log_trade(make_trade('SELL', 100.0))
+        self.assertEqual(self.engine.today_date, date.today())
+        self.assertEqual(self.engine.trades_today(), 1)
+    
+    def test_batch_reserves_remaining_allowance(self):
+        """Test a live batch sends only as many orders as the limit allows"""
+        self.engine.exchange = make_exchange()
+        self.engine.risk_settings['max_daily_trades'] = 5
+        for _ in range(3):
+            self.engine._log_trade(make_trade('BUY', 100.0))
+        
+        results = self.engine.execute_trades_batch([
+            ('BTC/USDT', 'BUY', 0.5),
+            ('BTC/USDT', 'HOLD', None),
+            ('BTC/USDT', 'BUY', 0.5),
+            ('BTC/USDT', 'SELL', 0.5),
+        ])
+        
+        self.assertEqual([result['status'] for result in results],
+                         ['success', 'no_action', 'success', 'trade_limit_reached'])
+        self.assertEqual(self.engine.exchange.create_market_buy_order.call_count, 2)
+        self.engine.exchange.create_market_sell_order.assert_not_called()
+        self.assertEqual(self.engine.trades_today(), 5)
+    
+    def test_simulated_batch_is_not_limited(self):
+        """Test demo mode trades are never held back by the limit"""
+        self.engine.risk_settings['max_daily_trades'] = 1
+        
+        results = self.engine.execute_trades_batch([('BTC/USDT', 'BUY', None)] * 3)
+        
+        self.assertEqual([result['status'] for result in results], ['simulated'] * 3)
+
+
+class TestBalanceCache(unittest.TestCase):
+    """Test the balance TTL cache and optimistic fills"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        patcher = patch.object(main, 'CCXT_PRO_AVAILABLE', False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        
+        self.engine = TradingEngine()
+        self.engine.exchange = make_exchange()
+    
+    def test_balance_reused_within_ttl(self):
+        """Test get_balance refetches only once the cached copy expires"""
+        self.engine.get_balance()
+        self.engine.get_balance()
+        self.assertEqual(self.engine.exchange.fetch_balance.call_count, 1)
+        
+        self.engine.balance_fetched_at -= BALANCE_CACHE_TTL
+        self.engine.get_balance()
+        self.assertEqual(self.engine.exchange.fetch_balance.call_count, 2)
+    
+    def test_fill_applied_to_cached_balance(self):
+        """Test a filled order updates the cached balance without a refetch"""
+        self.engine.get_balance()
+        
+        result = self.engine.execute_trade('BTC/USDT', 'BUY', 0.5)
+        
+        self.assertEqual(result['status'], 'success')
+        self.assertEqual(result['trade']['amount'], 0.5)
+        balance = self.engine.get_balance()
+        self.assertAlmostEqual(balance['BTC']['free'], 1.5)
+        self.assertAlmostEqual(balance['USDT']['free'], 950.0)
+        self.assertEqual(self.engine.exchange.fetch_balance.call_count, 1)
+    
+    def test_unappliable_fill_drops_cache(self):
+        """Test a fill that cannot be applied forces a refetch instead of raising"""
+        self.engine.get_balance()
+        
+        self.engine._apply_fill('BTC/USDT', 'BUY', 0.5, None)
+        
+        self.assertIsNone(self.engine.balance_cache)
+        self.engine.get_balance()
+        self.assertEqual(self.engine.exchange.fetch_balance.call_count, 2)
+
+
+class TestPriceStream(unittest.TestCase):
+    """Test the ticker streams and their shutdown"""
+    
+    def setUp(self):
+        """Set up an engine streaming from a fake ccxt.pro exchange"""
+        self.stream_exchange = make_stream_exchange()
+        ccxtpro = MagicMock()
+        ccxtpro.binance.return_value = self.stream_exchange
+        for name, value in (('CCXT_PRO_AVAILABLE', True), ('ccxtpro', ccxtpro)):
+            patcher = patch.object(main, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        
+        self.engine = TradingEngine()
+        self.addCleanup(self.engine.close)
+    
+    def test_close_stops_streams(self):
+        """Test close cancels the streams, closes the exchange and ends the thread"""
+        self.engine.watch_price('BTC/USDT')
+        self.engine.watch_price('ETH/USDT')
+        deadline = time.monotonic() + 5
+        while len(self.engine.last_prices) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(self.engine.streamed_price('BTC/USDT'), 100.0)
+        thread = self.engine.stream_thread
+        
+        self.engine.close()
+        
+        self.stream_exchange.close.assert_awaited_once()
+        self.assertFalse(thread.is_alive())
+        self.assertIsNone(self.engine.stream_loop)
+        self.assertEqual(self.engine.watched_symbols, set())
+    
+    def test_close_without_streams(self):
+        """Test close is a no-op when no stream was started"""
+        self.engine.close()
+        
+        self.assertIsNone(self.engine.stream_loop)
+        self.stream_exchange.close.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)